@@ -11,3 +11,6 @@ class BlogConfig(AppConfig):
         admin.site.site_header = 'Djangify Admin'
         admin.site.site_title = 'Djangify Admin Portal'
         admin.site.index_title = 'Welcome to Djangify Admin Portal'
+
+        # Connect cache invalidation signals
+        from djangify_backend.apps.blog import signals  # noqa: F401
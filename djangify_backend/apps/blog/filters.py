@@ -1,6 +1,118 @@
+import hashlib
+from django.core.exceptions import EmptyResultSet
 from django_filters import rest_framework as filters
-from django.db.models import Q
+from rest_framework.filters import SearchFilter, search_smart_split
+from rest_framework.settings import api_settings
+from djangify_backend.apps.core.cache import get_list_namespace
 from .models import Post, Comment
+from .search import (
+    SEARCH_CACHE_MAX_RESULTS,
+    full_text_search,
+    normalize_search_query,
+    search_posts,
+    search_stats,
+    supports_full_text,
+)
+
+
+class PostSearchFilter(SearchFilter):
+    """
+    Search filter using the stored full-text vector on PostgreSQL.
+
+    Results are ranked by relevance unless the request asks for an explicit
+    ordering, and carry a highlighted content excerpt. Other databases fall
+    back to the substring search over ``search_fields``.
+
+    On cached viewsets the ranked primary keys of each normalized query are
+    cached under the view's generation and set as ``view.result_ids``, which
+    the paginator slices pages from instead of counting and re-ranking.
+    """
+
+    # Orders matches by relevance, which keyset cursors cannot follow
+    ranks_results = True
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return queryset
+
+        full_text = supports_full_text(queryset)
+        self.search_query = normalize_search_query(text)
+        ranked = not request.query_params.get(api_settings.ORDERING_PARAM)
+
+        result_ids = self.get_result_ids(request, queryset, view, full_text, ranked)
+        if result_ids is not None:
+            view.result_ids = result_ids
+            queryset = queryset.filter(pk__in=result_ids)
+        return self.search(request, queryset, view, full_text, ranked)
+
+    def get_search_terms(self, request):
+        # Match the normalized query, so searches sharing a cache key agree
+        return search_smart_split(self.search_query)
+
+    def search(self, request, queryset, view, full_text, ranked):
+        if not full_text:
+            return super().filter_queryset(request, queryset, view)
+
+        queryset = full_text_search(queryset, self.search_query)
+        if not ranked:
+            return queryset
+        return queryset.order_by("-search_rank", *queryset.query.order_by)
+
+    def is_narrowed_later(self, request, view) -> bool:
+        """
+        Whether a search backend after this one (e.g. ``?fuzzy=``) filters
+        or reorders the results, which a cached id list would not reflect.
+        """
+        backends = list(getattr(view, "filter_backends", ()))
+        if type(self) not in backends:
+            return False
+        return any(
+            request.query_params.get(getattr(backend, "search_param", ""), "").strip()
+            for backend in backends[backends.index(type(self)) + 1 :]
+        )
+
+    def get_result_ids(self, request, queryset, view, full_text, ranked):
+        """
+        Ordered primary keys of the matches, cached per normalized query.
+
+        The SQL of the filtered queryset keys the entry alongside the query,
+        so filters, draft visibility and ordering each get their own list.
+
+        Returns:
+            Optional[List]: None when the view has no cache, a later backend
+            narrows the results, or the search matches more than
+            SEARCH_CACHE_MAX_RESULTS posts
+        """
+        if (
+            not hasattr(view, "get_cache_key")
+            or view.bypasses_cache(request)
+            or self.is_narrowed_later(request, view)
+        ):
+            return None
+        try:
+            sql = str(queryset.query)
+        except EmptyResultSet:
+            return None
+
+        signature = hashlib.md5(f"{self.search_query}\n{sql}".encode()).hexdigest()
+        key = view.get_cache_key(
+            "search",
+            scopes=(get_list_namespace(view.get_cache_namespace()),),
+            q=signature,
+        )
+
+        def compute():
+            matches = self.search(request, queryset, view, full_text, ranked)
+            return list(
+                matches.values_list("pk", flat=True)[: SEARCH_CACHE_MAX_RESULTS + 1]
+            )
+
+        result_ids, hit = view.get_or_refresh_response(key, compute)
+        search_stats.record_lookup(self.search_query, hit)
+        if len(result_ids) > SEARCH_CACHE_MAX_RESULTS:
+            return None
+        return result_ids
 
 
 class PostFilter(filters.FilterSet):
@@ -32,11 +144,7 @@ class PostFilter(filters.FilterSet):
         return queryset.filter(tags__slug__in=tag_slugs).distinct()
 
     def filter_search(self, queryset, name, value):
-        return queryset.filter(
-            Q(title__icontains=value)
-            | Q(content__icontains=value)
-            | Q(excerpt__icontains=value)
-        ).distinct()
+        return search_posts(queryset, value)
 
 
 class CommentFilter(filters.FilterSet):
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from djangify_backend.apps.blog.models import (
+    Post,
+    count_words,
+    estimate_reading_time,
+)
+from djangify_backend.apps.core.cache import bump_generation
+
+
+class Command(BaseCommand):
+    help = "Recompute stored word_count and reading_time for every post"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Posts loaded and updated per batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        posts = (
+            Post.objects.select_related(None)
+            .prefetch_related(None)
+            .only("id", "content", "word_count", "reading_time")
+            .order_by("pk")
+        )
+
+        changed = []
+        updated = 0
+        for post in posts.iterator(chunk_size=batch_size):
+            word_count = count_words(post.content)
+            reading_time = estimate_reading_time(word_count)
+            if (post.word_count, post.reading_time) == (word_count, reading_time):
+                continue
+
+            post.word_count = word_count
+            post.reading_time = reading_time
+            changed.append(post)
+            if len(changed) >= batch_size:
+                updated += self.flush(changed)
+
+        updated += self.flush(changed)
+
+        # bulk_update skips post_save, so drop cached post payloads here
+        if updated:
+            bump_generation("post")
+
+        self.stdout.write(self.style.SUCCESS(f"Updated metrics for {updated} posts"))
+
+    def flush(self, posts):
+        count = Post.objects.bulk_update(posts, ["word_count", "reading_time"])
+        posts.clear()
+        return count
@@ -0,0 +1,123 @@
+import random
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from djangify_backend.apps.blog.models import Category, Post
+from djangify_backend.apps.blog.search import (
+    full_text_search,
+    icontains_search,
+    post_search_vector,
+    supports_full_text,
+)
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "pa", "do", "fi"]
+DEFAULT_QUERIES = ["django", "cache invalidation", "python async"]
+# Never seeded: shows the cost of a search that matches nothing
+UNMATCHED_QUERY = "nonexistentterm"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare icontains and full-text post search on a synthetic corpus. "
+        "The corpus is created inside a transaction and rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--posts", type=int, default=50000)
+        parser.add_argument("--words", type=int, default=400, help="Words per post")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--match-rate",
+            type=float,
+            default=0.02,
+            help="Share of posts containing each query",
+        )
+        parser.add_argument(
+            "--query", action="append", dest="queries", help="Repeatable"
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        queries = options["queries"] or DEFAULT_QUERIES
+
+        with transaction.atomic():
+            category = Category.objects.create(
+                name="Search benchmark", slug="search-benchmark", title="Benchmark"
+            )
+            self.create_corpus(category, rng, queries, options)
+            posts = Post.objects.select_related(None).prefetch_related(None)
+            posts = posts.filter(category=category)
+
+            paths = [("icontains", icontains_search)]
+            if supports_full_text(posts):
+                posts.update(search_vector=post_search_vector())
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE blog_post")
+                paths.append(("full-text", self.ranked_search))
+            else:
+                self.stdout.write("Not PostgreSQL: timing the icontains path only")
+
+            self.stdout.write(
+                f"{'query':<24}{'path':<12}{'matches':>9}{'median ms':>12}"
+            )
+            for query in [*queries, UNMATCHED_QUERY]:
+                for name, search in paths:
+                    matches, median = self.time_search(
+                        search, posts, query, options["repeat"]
+                    )
+                    self.stdout.write(
+                        f"{query:<24}{name:<12}{matches:>9}{median:>12.2f}"
+                    )
+
+            transaction.set_rollback(True)
+
+    def create_corpus(self, category, rng, queries, options):
+        """Bulk insert posts of random pseudo-words, seeded with the queries."""
+        vocabulary = [
+            "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(5000)
+        ]
+        phrases = [query.split() for query in queries]
+        now = timezone.now()
+
+        batch = []
+        for number in range(options["posts"]):
+            words = rng.choices(vocabulary, k=options["words"])
+            for phrase in phrases:
+                if rng.random() < options["match_rate"]:
+                    start = rng.randrange(len(words) - len(phrase) + 1)
+                    words[start : start + len(phrase)] = phrase
+            batch.append(
+                Post(
+                    title=" ".join(words[:6]).title(),
+                    slug=f"search-benchmark-{number}",
+                    excerpt=" ".join(words[6:30]),
+                    content="<p>" + " ".join(words) + "</p>",
+                    category=category,
+                    status="published",
+                    published_date=now,
+                )
+            )
+            if len(batch) >= options["batch_size"]:
+                Post.objects.bulk_create(batch)
+                batch = []
+        Post.objects.bulk_create(batch)
+
+    def ranked_search(self, queryset, query):
+        return full_text_search(queryset, query, headline=False).order_by(
+            "-search_rank"
+        )
+
+    def time_search(self, search, posts, query, repeat):
+        """Time a paginated request's work: a count and the first page."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            queryset = search(posts, query)
+            matches = queryset.count()
+            list(queryset.values_list("pk", flat=True)[:20])
+            timings.append((time.perf_counter() - start) * 1000)
+        return matches, statistics.median(timings)
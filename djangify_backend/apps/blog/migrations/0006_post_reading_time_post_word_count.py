@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-17 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0005_category_title_tag_title_alter_category_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="reading_time",
+            field=models.PositiveIntegerField(
+                db_index=True,
+                default=1,
+                editable=False,
+                help_text="Estimated reading time in minutes",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="word_count",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.1.15 on 2026-10-17 22:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import Func
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["search_vector"], name="blog_post_search_gin"
+)
+
+
+class StripTags(Func):
+    function = "REGEXP_REPLACE"
+    template = "%(function)s(%(expressions)s, '<[^>]+>', ' ', 'g')"
+
+
+def create_search_index(apps, schema_editor):
+    # GIN indexes and tsvector expressions exist on PostgreSQL only; other
+    # databases keep the column and fall back to substring search
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Post = apps.get_model("blog", "Post")
+    schema_editor.add_index(Post, SEARCH_INDEX.clone())
+
+    config = getattr(settings, "BLOG_SEARCH_CONFIG", "english")
+    Post.objects.using(schema_editor.connection.alias).update(
+        search_vector=(
+            SearchVector("title", weight="A", config=config)
+            + SearchVector("excerpt", weight="B", config=config)
+            + SearchVector(StripTags("content"), weight="C", config=config)
+        )
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.remove_index(apps.get_model("blog", "Post"), SEARCH_INDEX.clone())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0006_post_reading_time_post_word_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="post", index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
@@ -1,8 +1,34 @@
-from django.db import models
+from html import unescape
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connections, models
+from django.db.models.functions import Coalesce
+from django.utils.html import strip_tags
 from django.utils.text import slugify
 from djangify_backend.apps.core.models import TimeStampedModel, SEOModel, SluggedModel
 from django.core.validators import FileExtensionValidator
 from djangify_backend.apps.core.utils import validate_svg_file
+from djangify_backend.apps.blog.search import (
+    SEARCH_FIELDS,
+    post_search_vector,
+    search_posts,
+)
+
+# Average reading speed used for reading_time
+WORDS_PER_MINUTE = 200
+
+
+def count_words(html):
+    """Count the words in the visible text of an HTML fragment."""
+    # Tags become spaces so adjacent blocks ("<p>a</p><p>b</p>") stay apart,
+    # as in the search vector's StripTags
+    return len(unescape(strip_tags((html or "").replace("<", " <"))).split())
+
+
+def estimate_reading_time(word_count):
+    """Reading time in whole minutes, never less than one."""
+    minutes = word_count / WORDS_PER_MINUTE
+    return round(minutes) if minutes >= 1 else 1
 
 
 class PostManager(models.Manager):
@@ -12,9 +38,14 @@ class PostManager(models.Manager):
     """
 
     def get_queryset(self):
-        # Optimize database queries by prefetching related fields
+        # Optimize database queries by prefetching related fields; the search
+        # vector is only ever read inside SQL
         return (
-            super().get_queryset().select_related("category").prefetch_related("tags")
+            super()
+            .get_queryset()
+            .select_related("category")
+            .prefetch_related("tags")
+            .defer("search_vector")
         )
 
     def published(self):
@@ -40,16 +71,8 @@ class PostManager(models.Manager):
         return self.published().filter(tags__slug=tag_slug)
 
     def search(self, query):
-        # Searches posts by title, content, or excerpt, returns only published posts
-        return (
-            self.published()
-            .filter(
-                models.Q(title__icontains=query)
-                | models.Q(content__icontains=query)
-                | models.Q(excerpt__icontains=query)
-            )
-            .distinct()
-        )
+        # Searches published posts, ranked by full-text relevance on PostgreSQL
+        return search_posts(self.published(), query)
 
     def archive(self, year, month=None):
         # Returns posts for a specific year and optional month
@@ -82,6 +105,33 @@ class CommentManager(models.Manager):
         return self.approved().filter(post__slug=post_slug)
 
 
+class TaxonomyManager(models.Manager):
+    """
+    Custom manager for Category and Tag models providing post counts
+    from a single annotated aggregate.
+    """
+
+    def with_post_count(self, published_only=False):
+        # Annotates post_count with a correlated COUNT, without loading posts.
+        # A subquery rather than a join, so the count stays right when the
+        # queryset is prefetched through a post (e.g. a post's tags)
+        relation = self.model._meta.get_field("posts")
+        posts = relation.related_model.objects.filter(
+            **{relation.field.name: models.OuterRef("pk")}
+        )
+        if published_only:
+            posts = posts.filter(status="published")
+        post_count = (
+            posts.order_by()
+            .values(relation.field.name)
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return self.get_queryset().annotate(
+            post_count=Coalesce(models.Subquery(post_count), 0)
+        )
+
+
 class Category(TimeStampedModel, SluggedModel):
     """
     Category model for organizing blog posts.
@@ -92,6 +142,8 @@ class Category(TimeStampedModel, SluggedModel):
     slug = models.SlugField(unique=True)
     description = models.TextField(blank=True)
 
+    objects = TaxonomyManager()
+
     def save(self, *args, **kwargs):
         # Auto-generate slug from name if not provided
         if not self.slug:
@@ -115,6 +167,8 @@ class Tag(TimeStampedModel, SluggedModel):
     name = models.CharField(max_length=100)
     slug = models.SlugField(unique=True)
 
+    objects = TaxonomyManager()
+
     def save(self, *args, **kwargs):
         # Auto-generate slug from name if not provided
         if not self.slug:
@@ -173,18 +227,65 @@ class Post(TimeStampedModel, SluggedModel, SEOModel):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="draft")
     published_date = models.DateTimeField(null=True, blank=True)
     is_featured = models.BooleanField(default=False)
+    word_count = models.PositiveIntegerField(default=0, db_index=True, editable=False)
+    reading_time = models.PositiveIntegerField(
+        default=1,
+        db_index=True,
+        editable=False,
+        help_text="Estimated reading time in minutes",
+    )
+    # Weighted title/excerpt/content vector, maintained on PostgreSQL only
+    search_vector = SearchVectorField(null=True, editable=False)
 
     objects = PostManager()
 
     class Meta:
         ordering = ["-published_date", "-created_at"]
+        # Created by migrations 0007 and 0008 on PostgreSQL only
+        indexes = [
+            GinIndex(fields=["search_vector"], name="blog_post_search_gin"),
+            GinIndex(
+                fields=["title"],
+                opclasses=["gin_trgm_ops"],
+                name="blog_post_title_trgm",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         # Auto-generate slug from title if not provided
         if not self.slug:
             self.slug = slugify(self.title)
+
+        # Content metrics are stored rather than recomputed per request;
+        # skip them when content was deferred and cannot have changed
+        if "content" not in self.get_deferred_fields():
+            self.update_content_metrics()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "content" in update_fields:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "word_count",
+                    "reading_time",
+                }
         super().save(*args, **kwargs)
 
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or SEARCH_FIELDS.intersection(update_fields):
+            self.update_search_vector()
+
+    def update_search_vector(self):
+        """Recompute the stored search vector in SQL (PostgreSQL only)."""
+        if connections[self._state.db].vendor != "postgresql":
+            return
+        type(self)._base_manager.using(self._state.db).filter(pk=self.pk).update(
+            search_vector=post_search_vector()
+        )
+
+    def update_content_metrics(self):
+        """Recompute word_count and reading_time from content."""
+        self.word_count = count_words(self.content)
+        self.reading_time = estimate_reading_time(self.word_count)
+
     def __str__(self):
         return self.title
 
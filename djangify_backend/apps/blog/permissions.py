@@ -16,12 +16,13 @@ class IsAuthorOrReadOnly(permissions.BasePermission):
 class CommentPermission(permissions.BasePermission):
     """
     Custom permission for comments:
-    - Anyone can create a comment
+    - Anyone can create a comment or read approved ones
     - Only staff can approve comments
     - Comment authors can only edit their own comments
     """
     def has_permission(self, request, view):
-        if request.method == 'POST':
+        # Approved comments are public; they are embedded in post payloads
+        if request.method == 'POST' or request.method in permissions.SAFE_METHODS:
             return True
         return request.user and request.user.is_authenticated
 
@@ -0,0 +1,182 @@
+import threading
+from typing import Dict, List
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import connections
+from django.db.models import F, Func, Q
+
+# Text search configuration (stemming and stop words) for post vectors
+SEARCH_CONFIG = getattr(settings, "BLOG_SEARCH_CONFIG", "english")
+
+# Stop words of PostgreSQL's "english" configuration (its snowball english.stop
+# list), which never reach a search vector or query under that configuration
+ENGLISH_STOP_WORDS = frozenset(
+    "i me my myself we our ours ourselves you your yours yourself yourselves he "
+    "him his himself she her hers herself it its itself they them their theirs "
+    "themselves what which who whom this that these those am is are was were be "
+    "been being have has had having do does did doing a an the and but if or "
+    "because as until while of at by for with about against between into through "
+    "during before after above below to from up down in out on off over under "
+    "again further then once here there when where why how all any both each few "
+    "more most other some such no nor not only own same so than too very s t can "
+    "will just don should now".split()
+)
+
+# Post fields feeding the stored search vector; saving any of them refreshes it
+SEARCH_FIELDS = frozenset({"title", "excerpt", "content"})
+
+# Longest ranked result list cached per query; larger searches run uncached
+SEARCH_CACHE_MAX_RESULTS = getattr(settings, "BLOG_SEARCH_CACHE_MAX_RESULTS", 1000)
+
+# Distinct queries tracked per worker for the top searches report
+SEARCH_STATS_MAX_QUERIES = getattr(settings, "BLOG_SEARCH_STATS_MAX_QUERIES", 500)
+
+
+class StripTags(Func):
+    """Replace HTML tags with spaces in SQL (PostgreSQL)."""
+
+    function = "REGEXP_REPLACE"
+    template = "%(function)s(%(expressions)s, '<[^>]+>', ' ', 'g')"
+
+
+def post_search_vector():
+    """
+    Weighted vector over a post: title (A), excerpt (B), content (C).
+
+    Markup is stripped from content so tag and attribute names never match.
+    """
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("excerpt", weight="B", config=SEARCH_CONFIG)
+        + SearchVector(StripTags("content"), weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def supports_full_text(queryset) -> bool:
+    """Whether the queryset's database can use the stored search vector."""
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def full_text_search(queryset, text, headline=True):
+    """
+    Filter posts by the stored vector and rank them.
+
+    Annotates search_rank and, when ``headline`` is set, search_headline:
+    a content excerpt with matches wrapped in <mark> tags. Callers order by
+    search_rank themselves so explicit orderings still apply.
+    """
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+    queryset = queryset.filter(search_vector=query).annotate(
+        search_rank=SearchRank(F("search_vector"), query)
+    )
+    if headline:
+        queryset = queryset.annotate(
+            search_headline=SearchHeadline(
+                StripTags("content"),
+                query,
+                config=SEARCH_CONFIG,
+                start_sel="<mark>",
+                stop_sel="</mark>",
+                max_fragments=2,
+                fragment_delimiter=" … ",
+            )
+        )
+    return queryset
+
+
+def icontains_search(queryset, text):
+    """Substring match on title, content and excerpt, for other databases."""
+    return queryset.filter(
+        Q(title__icontains=text)
+        | Q(content__icontains=text)
+        | Q(excerpt__icontains=text)
+    ).distinct()
+
+
+def search_posts(queryset, text, headline=False):
+    """Full-text search on PostgreSQL, substring search elsewhere."""
+    if supports_full_text(queryset):
+        return full_text_search(queryset, text, headline=headline).order_by(
+            "-search_rank", *queryset.query.order_by
+        )
+    return icontains_search(queryset, text)
+
+
+def normalize_search_query(text: str) -> str:
+    """
+    Canonical form of a search, keying its cached results and statistics.
+
+    Case and whitespace never matter. Plain term lists match whatever their
+    order, since every term must match either way, and drop the stop words
+    the "english" configuration ignores. Queries with quoted phrases,
+    exclusions or ``or`` keep their terms in order.
+    """
+    terms = text.lower().split()
+    if any('"' in term or term.startswith("-") or term == "or" for term in terms):
+        return " ".join(terms)
+    if SEARCH_CONFIG == "english":
+        # A query of nothing but stop words keeps them rather than going empty
+        terms = [term for term in terms if term not in ENGLISH_STOP_WORDS] or terms
+    return " ".join(sorted(set(terms)))
+
+
+class SearchStats:
+    """
+    Per-worker counters of normalized search queries.
+
+    At most ``max_queries`` queries are tracked; a new query replaces the
+    least searched one, so popular searches stay while the long tail churns.
+    """
+
+    def __init__(self, max_queries: int = SEARCH_STATS_MAX_QUERIES):
+        self.max_queries = max_queries
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _get(self, query: str) -> Dict[str, int]:
+        stats = self._stats.get(query)
+        if stats is None:
+            if len(self._stats) >= self.max_queries:
+                least = min(self._stats, key=lambda key: self._stats[key]["count"])
+                del self._stats[least]
+            stats = self._stats[query] = {"count": 0, "hits": 0, "misses": 0}
+        return stats
+
+    def record_search(self, query: str) -> None:
+        """Count a search request, whether or not its response was cached."""
+        with self._lock:
+            self._get(query)["count"] += 1
+
+    def record_lookup(self, query: str, hit: bool) -> None:
+        """Count a result cache lookup for a search."""
+        with self._lock:
+            self._get(query)["hits" if hit else "misses"] += 1
+
+    def top(self, limit: int = 20) -> List[Dict]:
+        """Most frequent searches, with their result cache hit ratio."""
+        with self._lock:
+            items = [(query, dict(stats)) for query, stats in self._stats.items()]
+        items.sort(key=lambda item: (-item[1]["count"], item[0]))
+        report = []
+        for query, stats in items[:limit]:
+            lookups = stats["hits"] + stats["misses"]
+            report.append(
+                {
+                    "query": query,
+                    **stats,
+                    "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else None,
+                }
+            )
+        return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+search_stats = SearchStats()
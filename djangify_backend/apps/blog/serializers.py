@@ -1,6 +1,18 @@
+from django.conf import settings
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 from djangify_backend.apps.blog.models import Category, Tag, Post, Comment
 
+# Approved comments embedded in a post; the rest are paged from comments_url
+EMBEDDED_COMMENTS_LIMIT = getattr(settings, "BLOG_EMBEDDED_COMMENTS_LIMIT", 5)
+
+
+def get_annotated_post_count(obj):
+    # Taxonomy querysets annotate post_count (TaxonomyManager.with_post_count);
+    # count per object only when the instance came from elsewhere
+    count = getattr(obj, "post_count", None)
+    return obj.posts.count() if count is None else count
+
 
 class CategorySerializer(serializers.ModelSerializer):
     post_count = serializers.SerializerMethodField()
@@ -16,9 +28,10 @@ class CategorySerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        field_sources = {"post_count": ["post_count"]}
 
     def get_post_count(self, obj):
-        return obj.posts.count()
+        return get_annotated_post_count(obj)
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -27,9 +40,10 @@ class TagSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tag
         fields = ["id", "name", "slug", "post_count", "created_at", "updated_at"]
+        field_sources = {"post_count": ["post_count"]}
 
     def get_post_count(self, obj):
-        return obj.posts.count()
+        return get_annotated_post_count(obj)
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -48,13 +62,67 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ["is_approved"]
 
 
+class TaxonomySummarySerializer(serializers.Serializer):
+    """Name and slug of a category or tag, for compact representations."""
+
+    name = serializers.CharField(read_only=True)
+    slug = serializers.SlugField(read_only=True)
+
+
+class PostListSerializer(serializers.ModelSerializer):
+    """
+    Compact post representation for list endpoints.
+
+    Leaves out content and comments and reduces category and tags to name
+    and slug. Full-text search results also carry their rank and a
+    highlighted excerpt.
+    """
+
+    category = TaxonomySummarySerializer(read_only=True)
+    tags = TaxonomySummarySerializer(many=True, read_only=True)
+    published_date = serializers.DateTimeField(format="%Y-%m-%dT%H:%M:%SZ")
+
+    class Meta:
+        model = Post
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "excerpt",
+            "featured_image",
+            "category",
+            "tags",
+            "status",
+            "published_date",
+            "is_featured",
+            "created_at",
+            "updated_at",
+            "reading_time",
+            "word_count",
+        ]
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+
+        # Annotated by PostSearchFilter and FuzzySearchFilter on PostgreSQL
+        if hasattr(instance, "search_rank"):
+            representation["search_rank"] = round(instance.search_rank, 4)
+        if hasattr(instance, "search_headline"):
+            representation["search_headline"] = instance.search_headline
+        if hasattr(instance, "similarity"):
+            representation["similarity"] = round(instance.similarity, 4)
+
+        return representation
+
+
 class PostSerializer(serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
     comments = serializers.SerializerMethodField()
+    comment_count = serializers.SerializerMethodField()
+    comments_url = serializers.SerializerMethodField()
     published_date = serializers.DateTimeField(format="%Y-%m-%dT%H:%M:%SZ")
-    reading_time = serializers.SerializerMethodField()
-    word_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
@@ -76,28 +144,45 @@ class PostSerializer(serializers.ModelSerializer):
             "meta_description",
             "meta_keywords",
             "comments",
+            "comment_count",
+            "comments_url",
             "reading_time",
             "word_count",
         ]
-        read_only_fields = ["created_at", "updated_at"]
+        read_only_fields = ["created_at", "updated_at", "reading_time", "word_count"]
+        # Attributes read by method fields, for sparse fieldsets
+        field_sources = {
+            "comments": ["latest_comments"],
+            "comment_count": ["approved_comment_count"],
+            "comments_url": ["slug"],
+        }
 
     def get_comments(self, obj):
-        comments = obj.comments.filter(is_approved=True)
+        # PostViewSet prefetches the latest approved comments into
+        # latest_comments; query them only for instances loaded elsewhere
+        comments = getattr(obj, "latest_comments", None)
+        if comments is None:
+            comments = Comment.objects.approved().filter(post=obj)[
+                :EMBEDDED_COMMENTS_LIMIT
+            ]
         return CommentSerializer(comments, many=True).data
 
-    def get_reading_time(self, obj):
-        word_count = len(obj.content.split())
-        minutes = word_count / 200
-        return round(minutes) if minutes >= 1 else 1
+    def get_comment_count(self, obj):
+        count = getattr(obj, "approved_comment_count", None)
+        return obj.comments.filter(is_approved=True).count() if count is None else count
 
-    def get_word_count(self, obj):
-        return len(obj.content.split())
+    def get_comments_url(self, obj):
+        return reverse(
+            "post-comments",
+            kwargs={"post_slug": obj.slug},
+            request=self.context.get("request"),
+        )
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
 
         # Add category name for convenience
-        if instance.category:
+        if "category" in self.fields and instance.category:
             representation["category_name"] = instance.category.name
 
         return representation
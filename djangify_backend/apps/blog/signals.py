@@ -0,0 +1,16 @@
+from djangify_backend.apps.core.cache import cache_registry
+from djangify_backend.apps.blog.models import Post, Category, Tag, Comment
+
+# Cached payloads and the related models embedded in them. Keep in step with
+# the nested serializers in serializers.py.
+cache_registry.register(
+    "post",
+    Post,
+    lookup_field="slug",
+    depends_on={Category: "category", Tag: "tags", Comment: "comments"},
+)
+cache_registry.register(
+    "category", Category, lookup_field="slug", depends_on={Post: "posts"}
+)
+cache_registry.register("tag", Tag, lookup_field="slug", depends_on={Post: "posts"})
+cache_registry.register("comment", Comment)
@@ -1,3 +1,97 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
 
-# Create your tests here.
+from djangify_backend.apps.blog.models import (
+    Category,
+    Comment,
+    Post,
+    Tag,
+    count_words,
+    estimate_reading_time,
+)
+from djangify_backend.apps.core.cache import local_cache
+from djangify_backend.apps.core.testing import LOCMEM_CACHES, CacheResetMixin
+
+
+class PostMetricsTests(SimpleTestCase):
+    def test_adjacent_elements_are_separate_words(self):
+        self.assertEqual(count_words("<p>Hello</p><p>World</p>"), 2)
+        self.assertEqual(count_words("<ul><li>one</li><li>two</li></ul>"), 2)
+        self.assertEqual(count_words("<p>a&nbsp;b<br>c</p>"), 3)
+        self.assertEqual(count_words(None), 0)
+
+    def test_reading_time_is_at_least_one_minute(self):
+        self.assertEqual(estimate_reading_time(0), 1)
+        self.assertEqual(estimate_reading_time(450), 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QueryCountTests(CacheResetMixin, TestCase):
+    """Uncached reads run a fixed number of queries, however many rows."""
+
+    def setUp(self):
+        super().setUp()
+        self.tags = []
+
+    def add_posts(self, count):
+        start = len(self.tags)
+        self.tags += [
+            Tag.objects.create(name=f"Tag {i}", slug=f"tag-{i}", title="Tag")
+            for i in range(start, start + count)
+        ]
+        for i in range(start, start + count):
+            category = Category.objects.create(
+                name=f"Category {i}", slug=f"category-{i}", title="Category"
+            )
+            post = Post.objects.create(
+                title=f"Post {i}",
+                slug=f"post-{i}",
+                content="<p>Content</p>",
+                category=category,
+                status="published",
+                published_date=timezone.now(),
+            )
+            post.tags.set(self.tags)
+            Comment.objects.create(
+                post=post,
+                name="Reader",
+                email="reader@example.com",
+                content="Nice",
+                is_approved=True,
+            )
+
+    def assert_queries(self, expected, url):
+        cache.clear()
+        local_cache.clear()
+        with self.assertNumQueries(expected):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_reads_do_not_query_per_row(self):
+        # Max(updated_at) validators and the annotated page, which holds
+        # every row and so needs no COUNT(*)
+        cases = [
+            (2, "/api/v1/blog/categories/"),
+            (2, "/api/v1/blog/tags/"),
+            # A full page also counts the rows
+            (3, "/api/v1/blog/tags/?page_size=1"),
+            # Validators, the post, then category, tags and latest comments
+            (5, "/api/v1/blog/posts/post-0/"),
+        ]
+        for posts in (2, 6):
+            self.add_posts(posts)
+            for expected, url in cases:
+                with self.subTest(posts=len(self.tags), url=url):
+                    self.assert_queries(expected, url)
+
+    def test_nested_post_counts_match_the_taxonomy_endpoints(self):
+        self.add_posts(3)
+        post = self.client.get("/api/v1/blog/posts/post-0/").json()["data"]
+
+        for tag in post["tags"]:
+            response = self.client.get(f"/api/v1/blog/tags/{tag['slug']}/")
+            self.assertEqual(tag["post_count"], response.json()["data"]["post_count"])
+            self.assertEqual(tag["post_count"], 3)
+        category = post["category"]
+        response = self.client.get(f"/api/v1/blog/categories/{category['slug']}/")
+        self.assertEqual(category["post_count"], response.json()["data"]["post_count"])
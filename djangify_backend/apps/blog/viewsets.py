@@ -2,14 +2,26 @@ from rest_framework import filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django_filters.rest_framework import DjangoFilterBackend
+from djangify_backend.apps.core.filters import FuzzySearchFilter
 from djangify_backend.apps.core.viewsets import BaseViewSet
 from djangify_backend.apps.core.mixins import FileHandlingMixin
 from djangify_backend.apps.core.utils import FileHandler
-from djangify_backend.apps.blog.models import Post, Category, Tag, Comment
+from djangify_backend.apps.blog.models import (
+    Post,
+    Category,
+    Tag,
+    Comment,
+)
 from djangify_backend.apps.blog.serializers import (
+    EMBEDDED_COMMENTS_LIMIT,
     PostSerializer,
+    PostListSerializer,
     CategorySerializer,
     TagSerializer,
     CommentSerializer,
@@ -19,11 +31,19 @@ from djangify_backend.apps.core.throttling import (
     UserBurstRateThrottle,
     UserSustainedRateThrottle,
 )
+from djangify_backend.apps.blog.filters import PostSearchFilter
+from djangify_backend.apps.blog.search import (
+    normalize_search_query,
+    search_stats,
+)
 from djangify_backend.apps.blog.permissions import IsAuthorOrReadOnly, CommentPermission
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Whether category and tag post counts leave out drafts
+POST_COUNT_PUBLISHED_ONLY = getattr(settings, "BLOG_POST_COUNT_PUBLISHED_ONLY", False)
+
 
 class PostViewSet(FileHandlingMixin, BaseViewSet):
     """
@@ -49,34 +69,101 @@ class PostViewSet(FileHandlingMixin, BaseViewSet):
     allowed_types = FileHandler.ALLOWED_IMAGE_TYPES
     max_file_size = 10 * 1024 * 1024  # 10MB
 
-    # Filtering and searching
+    # Filtering and searching; search runs last so it can rank the ordered
+    # queryset
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        PostSearchFilter,
+        FuzzySearchFilter,
     ]
-    filterset_fields = ["category__slug", "tags__slug", "status", "is_featured"]
+    filterset_fields = {
+        "category__slug": ["exact"],
+        "tags__slug": ["exact"],
+        "status": ["exact"],
+        "is_featured": ["exact"],
+        "reading_time": ["exact", "lte", "gte"],
+        "word_count": ["lte", "gte"],
+    }
     search_fields = ["title", "content", "excerpt"]
-    ordering_fields = ["created_at", "published_date", "title"]
+    fuzzy_search_field = "title"
+    ordering_fields = [
+        "created_at",
+        "published_date",
+        "title",
+        "reading_time",
+        "word_count",
+    ]
     ordering = ["-published_date"]
+    cursor_ordering = ["-published_date", "-id"]
+
+    def get_serializer_class(self):
+        """Use the compact representation for list responses."""
+        if self.action == "list":
+            return PostListSerializer
+        return super().get_serializer_class()
 
     def get_queryset(self):
         """
         Override to optimize query with select_related and prefetch_related.
         Filters unpublished posts for non-staff users.
         """
-        queryset = (
-            super()
-            .get_queryset()
-            .select_related("category")
-            .prefetch_related("tags", "comments")
-        )
+        queryset = super().get_queryset().select_related(None).prefetch_related(None)
+
+        if self.action == "list":
+            # Lists never load content; its metrics are stored columns
+            queryset = (
+                queryset.select_related("category")
+                .prefetch_related(
+                    Prefetch("tags", queryset=Tag.objects.only("id", "name", "slug"))
+                )
+                .defer("content")
+            )
+        else:
+            # Category and tags are prefetched with annotated post counts;
+            # select_related would leave the nested serializers counting per row
+            approved_count = (
+                Comment.objects.approved()
+                .select_related(None)
+                .filter(post=OuterRef("pk"))
+                .order_by()
+                .values("post")
+                .annotate(count=Count("pk"))
+                .values("count")
+            )
+            latest_comments = (
+                Comment.objects.approved()
+                .select_related(None)
+                .order_by("-created_at", "-id")[:EMBEDDED_COMMENTS_LIMIT]
+            )
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "category",
+                    queryset=Category.objects.with_post_count(
+                        POST_COUNT_PUBLISHED_ONLY
+                    ),
+                ),
+                Prefetch(
+                    "tags",
+                    queryset=Tag.objects.with_post_count(POST_COUNT_PUBLISHED_ONLY),
+                ),
+                Prefetch(
+                    "comments", queryset=latest_comments, to_attr="latest_comments"
+                ),
+            ).annotate(approved_comment_count=Coalesce(Subquery(approved_count), 0))
 
         if not self.request.user.is_staff:
             queryset = queryset.filter(status="published")
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """Count searches here, so ones answered from the list cache count too."""
+        text = request.query_params.get(PostSearchFilter.search_param, "").strip()
+        if text:
+            search_stats.record_search(normalize_search_query(text))
+        return super().list(request, *args, **kwargs)
+
     def create(self, request, *args, **kwargs):
         """Override create to handle validation errors."""
         try:
@@ -91,6 +178,20 @@ class PostViewSet(FileHandlingMixin, BaseViewSet):
         except ValidationError as e:
             return self.error_response(str(e))
 
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="top-searches",
+        permission_classes=[IsAdminUser],
+    )
+    def top_searches(self, request):
+        """Most frequent searches on this worker, with result cache hit ratios."""
+        try:
+            limit = min(max(int(request.query_params.get("limit", 20)), 1), 100)
+        except ValueError:
+            return self.error_response("limit must be an integer")
+        return self.success_response(data=search_stats.top(limit))
+
     @action(detail=True, methods=["POST"])
     def upload_featured_image(self, request, slug=None):
         """Custom action for featured image upload."""
@@ -145,7 +246,7 @@ class CategoryViewSet(BaseViewSet):
     throttle_classes = [UserBurstRateThrottle, UserSustainedRateThrottle]
 
     def get_queryset(self):
-        return super().get_queryset().prefetch_related("posts")
+        return Category.objects.with_post_count(POST_COUNT_PUBLISHED_ONLY)
 
 
 class TagViewSet(BaseViewSet):
@@ -164,7 +265,7 @@ class TagViewSet(BaseViewSet):
     throttle_classes = [UserBurstRateThrottle, UserSustainedRateThrottle]
 
     def get_queryset(self):
-        return super().get_queryset().prefetch_related("posts")
+        return Tag.objects.with_post_count(POST_COUNT_PUBLISHED_ONLY)
 
 
 class CommentViewSet(BaseViewSet):
@@ -179,6 +280,7 @@ class CommentViewSet(BaseViewSet):
     filterset_fields = ["is_approved"]
     ordering_fields = ["created_at"]
     ordering = ["-created_at"]
+    cursor_ordering = ["-created_at", "-id"]
     cache_key_prefix = "comment"
     throttle_classes = [
         WriteOperationThrottle,
@@ -190,6 +292,11 @@ class CommentViewSet(BaseViewSet):
         """Filter comments based on user permissions and post."""
         queryset = Comment.objects.select_related("post")
 
+        # Nested under posts/<post_slug>/comments/
+        post_slug = self.kwargs.get("post_slug")
+        if post_slug is not None:
+            queryset = queryset.filter(post__slug=post_slug)
+
         if self.request.user.is_staff:
             return queryset
 
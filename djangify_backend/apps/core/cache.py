@@ -0,0 +1,889 @@
+"""
+Cache helpers shared by the API viewsets.
+
+Cached list and retrieve payloads are stored under versioned keys. Every
+``cache_key_prefix`` owns a generation counter kept in the Django cache, and
+the current generation is part of every key built for that prefix. Bumping
+the counter makes all keys built from the previous value unreachable, so a
+write invalidates every cached page in O(1) without scanning or deleting keys.
+
+Two narrower scopes live under each prefix: ``<prefix>:list`` versions only
+the list pages and ``<prefix>:obj:<lookup>`` versions a single object, keyed
+by the viewset's lookup_field value (a slug for most endpoints). Changes to
+models embedded in a payload (a post's category, tags or comments) bump just
+those scopes through the dependency registry at the bottom of this module.
+
+An optional per-worker LRU tier (LOCAL_CACHE setting) sits in front of the
+shared cache. Payload keys are versioned, so local copies stay coherent as
+long as the generation counters are fresh; those are reused locally for
+only a second or so.
+
+Every get, set, delete, invalidate, generation read and lock attempt is
+timed into per-prefix counters (``metrics``) that the cache metrics
+endpoint and the Server-Timing header report.
+
+Entries are pickled before they reach the shared cache and zlib-compressed
+above a size threshold (CACHE_COMPRESSION setting). A leading marker byte
+records the encoding, so reads decode transparently whatever the setting
+was when the entry was written.
+"""
+
+import bisect
+import logging
+import pickle
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import DatabaseError
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+# ==============================
+# Metrics
+# ==============================
+
+# Upper bounds, in milliseconds, of the latency histogram buckets
+LATENCY_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250)
+
+CACHE_OPERATIONS = ("get", "set", "delete", "invalidate", "generation", "lock")
+
+# Per-request totals collected for the Server-Timing header
+_request_timings: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar(
+    "cache_request_timings", default=None
+)
+
+
+def get_key_prefix(key: str) -> str:
+    """Cache prefix a payload, lock or generation key belongs to."""
+    parts = key.split(":", 2)
+    if parts[0] in (LOCK_KEY_PREFIX, GENERATION_KEY_PREFIX) and len(parts) > 1:
+        return parts[1]
+    return parts[0]
+
+
+class CacheMetrics:
+    """
+    In-process counters and latency histograms per cache prefix and operation.
+
+    Recording takes one lock acquisition and a few integer updates, so it can
+    stay on for every request. Counters are per worker and reset on restart.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def _new_stats(self) -> Dict[str, Any]:
+        return {
+            "count": 0,
+            "hits": 0,
+            "misses": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "histogram": [0] * (len(self.buckets) + 1),
+            "sized": 0,
+            "bytes": 0,
+            "max_bytes": 0,
+            "stored_bytes": 0,
+            "encoded": 0,
+            "codec_ms": 0.0,
+        }
+
+    def record(
+        self,
+        prefix: str,
+        operation: str,
+        duration: float,
+        hit: Optional[bool] = None,
+        size: Optional[int] = None,
+        stored_size: Optional[int] = None,
+        codec_time: Optional[float] = None,
+    ) -> None:
+        """
+        Record one cache operation.
+
+        Args:
+            prefix: Cache prefix the key belongs to
+            operation: One of CACHE_OPERATIONS
+            duration: Elapsed time in seconds
+            hit: For reads, whether a value was found
+            size: Size of the value written, in bytes
+            stored_size: Size actually sent to the cache after compression
+            codec_time: Seconds spent compressing or decompressing
+        """
+        duration_ms = duration * 1000
+        with self._lock:
+            stats = self._stats.get((prefix, operation))
+            if stats is None:
+                stats = self._stats[(prefix, operation)] = self._new_stats()
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            stats["histogram"][bisect.bisect_left(self.buckets, duration_ms)] += 1
+            if hit is not None:
+                stats["hits" if hit else "misses"] += 1
+            if size is not None:
+                stats["sized"] += 1
+                stats["bytes"] += size
+                stats["max_bytes"] = max(stats["max_bytes"], size)
+                stats["stored_bytes"] += size if stored_size is None else stored_size
+            if codec_time is not None:
+                stats["encoded"] += 1
+                stats["codec_ms"] += codec_time * 1000
+
+        timings = _request_timings.get()
+        if timings is not None:
+            total = timings.setdefault(operation, [0, 0.0])
+            total[0] += 1
+            total[1] += duration_ms
+
+    @contextmanager
+    def timer(self, prefix: str, operation: str, **kwargs):
+        """Time the enclosed block and record it; yields a dict for ``hit``/``size``."""
+        result = dict(kwargs)
+        start = time.perf_counter()
+        try:
+            yield result
+        finally:
+            self.record(prefix, operation, time.perf_counter() - start, **result)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return derived statistics grouped by prefix, then operation."""
+        labels = [f"le_{bound}ms" for bound in self.buckets] + ["inf"]
+        report: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            items = [(key, dict(stats)) for key, stats in self._stats.items()]
+        for (prefix, operation), stats in sorted(items):
+            lookups = stats["hits"] + stats["misses"]
+            report.setdefault(prefix, {})[operation] = {
+                "count": stats["count"],
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else None,
+                "avg_ms": round(stats["total_ms"] / stats["count"], 3),
+                "max_ms": round(stats["max_ms"], 3),
+                "histogram": dict(zip(labels, stats["histogram"])),
+                "avg_bytes": (
+                    stats["bytes"] // stats["sized"] if stats["sized"] else None
+                ),
+                "max_bytes": stats["max_bytes"] or None,
+                "compression_ratio": (
+                    round(stats["bytes"] / stats["stored_bytes"], 3)
+                    if stats["stored_bytes"]
+                    else None
+                ),
+                "codec_ms": round(stats["codec_ms"], 3),
+                "avg_codec_ms": (
+                    round(stats["codec_ms"] / stats["encoded"], 3)
+                    if stats["encoded"]
+                    else None
+                ),
+            }
+        return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+metrics = CacheMetrics()
+
+
+def start_request_timing():
+    """Start collecting cache timings for the current request."""
+    return _request_timings.set({})
+
+
+def stop_request_timing(token) -> Dict[str, List[float]]:
+    """
+    Stop collecting cache timings for the current request.
+
+    Returns:
+        Dict[str, List[float]]: Operation -> [count, total milliseconds]
+    """
+    timings = _request_timings.get() or {}
+    _request_timings.reset(token)
+    return timings
+
+
+def format_server_timing(timings: Dict[str, List[float]]) -> str:
+    """Format per-request cache timings as a Server-Timing header value."""
+    return ", ".join(
+        f'cache-{operation};dur={total:.3f};desc="{count} {operation}"'
+        for operation, (count, total) in timings.items()
+    )
+
+
+# ==============================
+# Compression
+# ==============================
+
+COMPRESSION_DEFAULTS = {
+    "ENABLED": True,
+    "MIN_SIZE": 1024,
+    "LEVEL": 6,
+}
+COMPRESSION_SETTINGS = {
+    **COMPRESSION_DEFAULTS,
+    **getattr(settings, "CACHE_COMPRESSION", {}),
+}
+
+RAW_MARKER = b"\x00"
+ZLIB_MARKER = b"\x01"
+
+
+def encode_value(value: Any, stats: Optional[Dict] = None) -> bytes:
+    """
+    Pickle a value, compressing it when it is at least MIN_SIZE bytes.
+
+    Args:
+        value: Value to store
+        stats: Optional dict receiving ``size``, ``stored_size`` and
+            ``codec_time`` for the cache metrics
+
+    Returns:
+        bytes: Marker byte followed by the (possibly compressed) pickle
+    """
+    raw = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    encoded = RAW_MARKER + raw
+    codec_time = None
+    if COMPRESSION_SETTINGS["ENABLED"] and len(raw) >= COMPRESSION_SETTINGS["MIN_SIZE"]:
+        start = time.perf_counter()
+        compressed = zlib.compress(raw, COMPRESSION_SETTINGS["LEVEL"])
+        codec_time = time.perf_counter() - start
+        # Incompressible values are kept raw so reads skip decompression
+        if len(compressed) < len(raw):
+            encoded = ZLIB_MARKER + compressed
+    if stats is not None:
+        stats.update(size=len(raw), stored_size=len(encoded), codec_time=codec_time)
+    return encoded
+
+
+def decode_value(stored: Any, stats: Optional[Dict] = None) -> Any:
+    """
+    Reverse encode_value(); values written without a marker are returned as-is.
+
+    Args:
+        stored: Value read from the shared cache
+        stats: Optional dict receiving ``codec_time`` when decompressing
+    """
+    if not isinstance(stored, bytes) or not stored:
+        return stored
+    marker, body = stored[:1], stored[1:]
+    if marker == ZLIB_MARKER:
+        start = time.perf_counter()
+        body = zlib.decompress(body)
+        if stats is not None:
+            stats["codec_time"] = time.perf_counter() - start
+    elif marker != RAW_MARKER:
+        return stored
+    return pickle.loads(body)
+
+
+# ==============================
+# Local (Per-Worker) Cache
+# ==============================
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe, in-process LRU cache with a per-entry TTL.
+
+    Keeps hit, miss and eviction counters for the cache metrics endpoint.
+    """
+
+    def __init__(self, max_entries: int = 1000, timeout: float = 30):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a live value, marking it as most recently used."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        timeout = self.timeout if timeout is None else timeout
+        if timeout <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters describing how well the local tier is doing."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class TieredCache:
+    """
+    Cache-like wrapper reading through a LocalCache into the shared cache.
+
+    Writes go to both tiers. Exposes the subset of the Django cache API used
+    by DRF throttles so it can be assigned to their ``cache`` attribute.
+    """
+
+    def __init__(self, local: Optional[LocalCache], shared=cache):
+        self.local = local
+        self.shared = shared
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.local.get(key, _MISSING) if self.local else _MISSING
+        if value is _MISSING:
+            value = self.shared.get(key, _MISSING)
+            if value is not _MISSING and self.local:
+                self.local.set(key, value)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT) -> None:
+        self.shared.set(key, value, timeout)
+        if self.local:
+            self.local.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self.shared.delete(key)
+        if self.local:
+            self.local.delete(key)
+
+
+LOCAL_CACHE_DEFAULTS = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 1000,
+    "TIMEOUT": 30,
+    "GENERATION_TIMEOUT": 1,
+    "THROTTLE_TIMEOUT": 0,
+}
+LOCAL_CACHE_SETTINGS = {
+    **LOCAL_CACHE_DEFAULTS,
+    **getattr(settings, "LOCAL_CACHE", {}),
+}
+
+local_cache: Optional[LocalCache] = (
+    LocalCache(LOCAL_CACHE_SETTINGS["MAX_ENTRIES"], LOCAL_CACHE_SETTINGS["TIMEOUT"])
+    if LOCAL_CACHE_SETTINGS["ENABLED"]
+    else None
+)
+
+throttle_cache = TieredCache(
+    LocalCache(
+        LOCAL_CACHE_SETTINGS["MAX_ENTRIES"], LOCAL_CACHE_SETTINGS["THROTTLE_TIMEOUT"]
+    )
+    if LOCAL_CACHE_SETTINGS["ENABLED"] and LOCAL_CACHE_SETTINGS["THROTTLE_TIMEOUT"]
+    else None
+)
+
+
+def get_entry(key: str) -> Optional[Dict]:
+    """
+    Get a cached entry, preferring the local tier while the entry is fresh.
+
+    Stale entries are always re-read from the shared cache so a refresh made
+    by another worker is picked up.
+    """
+    with metrics.timer(get_key_prefix(key), "get") as result:
+        if local_cache is not None:
+            entry = local_cache.get(key)
+            if entry is not None and time.time() < entry["fresh_until"]:
+                result["hit"] = True
+                return entry
+        entry = decode_value(cache.get(key), result)
+        result["hit"] = entry is not None
+    if entry is not None and local_cache is not None:
+        local_cache.set(key, entry)
+    return entry
+
+
+def set_entry(key: str, entry: Dict, timeout: int) -> None:
+    """Store a cached entry in the shared cache and the local tier."""
+    with metrics.timer(get_key_prefix(key), "set") as result:
+        cache.set(key, encode_value(entry, result), timeout)
+    if local_cache is not None:
+        local_cache.set(key, entry)
+
+
+# ==============================
+# Generation Counters
+# ==============================
+
+GENERATION_KEY_PREFIX = "generation"
+# Seconds an object scope's generation counter lives; keep it above the
+# payload timeouts so live objects rarely reseed
+OBJECT_GENERATION_TIMEOUT = getattr(
+    settings, "CACHE_OBJECT_GENERATION_TIMEOUT", 60 * 60 * 24
+)
+
+
+def get_generation_key(namespace: str) -> str:
+    """Return the cache key holding the generation counter for a namespace."""
+    return f"{GENERATION_KEY_PREFIX}:{namespace}"
+
+
+def _initial_generation() -> int:
+    """
+    Seed value for a missing counter.
+
+    Seeding from the clock rather than a constant means a counter that was
+    evicted from the cache never restarts at a value older keys still use.
+    """
+    return int(time.time() * 1000)
+
+
+def get_generation_timeout(namespace: str) -> Optional[int]:
+    """
+    Lifetime of a namespace's generation counter.
+
+    Object scopes are created for every looked-up identifier, including ones
+    that never matched, so their counters expire rather than piling up. An
+    expired counter reseeds from the clock, which costs only a cache miss.
+    """
+    if ":obj:" in namespace:
+        return OBJECT_GENERATION_TIMEOUT
+    return None
+
+
+def get_generation(namespace: str) -> int:
+    """
+    Get the current generation for a namespace, creating it if missing.
+
+    Args:
+        namespace: Cache namespace, usually a viewset's cache_key_prefix
+
+    Returns:
+        int: Current generation number
+    """
+    with metrics.timer(get_key_prefix(namespace), "generation") as result:
+        generation = cache.get(get_generation_key(namespace))
+        result["hit"] = generation is not None
+        if generation is None:
+            generation = _create_generation(namespace)
+    return generation
+
+
+def _create_generation(namespace: str) -> int:
+    """Seed a missing generation counter, keeping one created concurrently."""
+    key = get_generation_key(namespace)
+    initial = _initial_generation()
+    # add() is a no-op when another worker created the counter first
+    cache.add(key, initial, get_generation_timeout(namespace))
+    return cache.get(key, initial)
+
+
+def get_generations(*namespaces: str) -> List[int]:
+    """
+    Get the current generations for several namespaces in one cache round trip.
+
+    Args:
+        namespaces: Cache namespaces to look up
+
+    Returns:
+        List[int]: Generation numbers in the order the namespaces were given
+    """
+    keys = [get_generation_key(namespace) for namespace in namespaces]
+    found = {}
+    # Timed as one operation of the first (the requesting view's) namespace
+    with metrics.timer(get_key_prefix(namespaces[0]), "generation") as result:
+        if local_cache is not None:
+            for key in keys:
+                generation = local_cache.get(key)
+                if generation is not None:
+                    found[key] = generation
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            found.update(cache.get_many(missing))
+        result["hit"] = len(found) == len(keys)
+
+        generations = []
+        for key, namespace in zip(keys, namespaces):
+            generation = found[key] if key in found else _create_generation(namespace)
+            if local_cache is not None and key in missing:
+                local_cache.set(
+                    key, generation, LOCAL_CACHE_SETTINGS["GENERATION_TIMEOUT"]
+                )
+            generations.append(generation)
+    return generations
+
+
+def bump_generation(namespace: str) -> int:
+    """
+    Increment the generation for a namespace, invalidating its cached keys.
+
+    Args:
+        namespace: Cache namespace to invalidate
+
+    Returns:
+        int: New generation number
+    """
+    key = get_generation_key(namespace)
+    with metrics.timer(get_key_prefix(namespace), "invalidate"):
+        try:
+            generation = cache.incr(key)
+        except ValueError:
+            # Counter was never created or has been evicted
+            generation = _initial_generation()
+            cache.set(key, generation, get_generation_timeout(namespace))
+    if local_cache is not None:
+        local_cache.set(key, generation, LOCAL_CACHE_SETTINGS["GENERATION_TIMEOUT"])
+    return generation
+
+
+def get_list_namespace(prefix: str) -> str:
+    """Namespace versioning only the list pages of a prefix."""
+    return f"{prefix}:list"
+
+
+def get_object_namespace(prefix: str, identifier) -> str:
+    """Namespace versioning a single cached object of a prefix."""
+    return f"{prefix}:obj:{identifier}"
+
+
+def invalidate_objects(prefix: str, identifiers: Iterable) -> None:
+    """
+    Invalidate specific cached objects of a prefix along with its list pages.
+
+    Args:
+        prefix: Cache prefix owning the objects
+        identifiers: Identifiers of the objects whose payloads changed
+    """
+    identifiers = set(identifiers)
+    if not identifiers:
+        return
+    bump_generation(get_list_namespace(prefix))
+    for identifier in identifiers:
+        bump_generation(get_object_namespace(prefix, identifier))
+
+
+# ==============================
+# Stale-While-Revalidate
+# ==============================
+
+LOCK_KEY_PREFIX = "lock"
+
+
+def acquire_lock(key: str, timeout: int) -> bool:
+    """Try to take a short-lived lock shared by all workers."""
+    with metrics.timer(get_key_prefix(key), "lock"):
+        return cache.add(f"{LOCK_KEY_PREFIX}:{key}", 1, timeout)
+
+
+def release_lock(key: str) -> None:
+    """Release a lock taken with acquire_lock()."""
+    with metrics.timer(get_key_prefix(key), "delete"):
+        cache.delete(f"{LOCK_KEY_PREFIX}:{key}")
+
+
+def make_entry(value: Any, timeout: int) -> Dict:
+    """Wrap a value with the time after which it is considered stale."""
+    return {"value": value, "fresh_until": time.time() + timeout}
+
+
+def get_or_refresh(
+    key: str,
+    compute: Callable[[], Any],
+    timeout: int,
+    stale_timeout: int,
+    lock_timeout: int = 10,
+    lock_wait: float = 0.5,
+    entry: Optional[Dict[str, Any]] = None,
+) -> Tuple[Any, bool]:
+    """
+    Get a cached value, recomputing it at most once across workers.
+
+    Entries have a soft TTL (``timeout``) and a hard TTL (``timeout`` plus
+    ``stale_timeout``). Past the soft TTL one caller recomputes under a lock
+    while everyone else keeps receiving the stale value; if recomputing hits
+    a database error the stale value is served instead. On a hard miss,
+    callers that lose the lock wait up to ``lock_wait`` seconds for the
+    winner's value before computing it themselves.
+
+    Args:
+        key: Cache key of the entry
+        compute: Callable producing a fresh value
+        timeout: Seconds a value stays fresh
+        stale_timeout: Extra seconds a stale value may still be served
+        lock_timeout: Seconds before an abandoned lock expires
+        lock_wait: Seconds to wait for another worker on a hard miss
+        entry: The entry already read from ``key`` by the caller, if any,
+            which saves reading it again
+
+    Returns:
+        Tuple[Any, bool]: The value and whether it came from the cache
+    """
+    if entry is None:
+        entry = get_entry(key)
+
+    if entry is not None:
+        if time.time() < entry["fresh_until"] or not acquire_lock(key, lock_timeout):
+            return entry["value"], True
+        try:
+            value = compute()
+        except DatabaseError as e:
+            logger.warning(f"Serving stale cache entry {key}: {str(e)}")
+            return entry["value"], True
+        else:
+            set_entry(key, make_entry(value, timeout), timeout + stale_timeout)
+            return value, False
+        finally:
+            release_lock(key)
+
+    locked = acquire_lock(key, lock_timeout)
+    if not locked:
+        deadline = time.monotonic() + lock_wait
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            entry = get_entry(key)
+            if entry is not None:
+                return entry["value"], True
+
+    try:
+        value = compute()
+        set_entry(key, make_entry(value, timeout), timeout + stale_timeout)
+        return value, False
+    finally:
+        if locked:
+            release_lock(key)
+
+
+# ==============================
+# Model Signal Registration
+# ==============================
+
+
+def register_cache_prefix(model, prefix: str, lookup_field: str = "pk") -> None:
+    """
+    Bump the generation for ``prefix`` whenever ``model`` is saved or deleted.
+
+    Writes that bypass the API viewsets (admin, shell, management commands)
+    then invalidate cached responses just like API writes do. The object
+    scopes for both the old and the new ``lookup_field`` value are bumped
+    too, so a renamed slug never resolves to a payload cached for it before.
+    """
+    stash = f"_cache_lookup_{prefix}"
+
+    def remember_lookup(sender, instance, raw=False, **kwargs):
+        if raw or instance.pk is None or lookup_field == "pk":
+            return
+        previous = (
+            model._base_manager.filter(pk=instance.pk)
+            .values_list(lookup_field, flat=True)
+            .first()
+        )
+        setattr(instance, stash, previous)
+
+    def invalidate(sender, instance, **kwargs):
+        bump_generation(prefix)
+        identifiers = {
+            getattr(instance, lookup_field),
+            instance.__dict__.pop(stash, None),
+        }
+        invalidate_objects(prefix, identifiers - {None})
+
+    uid = f"cache-generation:{model._meta.label_lower}:{prefix}"
+    pre_save.connect(
+        remember_lookup, sender=model, weak=False, dispatch_uid=f"{uid}:pre_save"
+    )
+    post_save.connect(invalidate, sender=model, weak=False, dispatch_uid=f"{uid}:save")
+    post_delete.connect(
+        invalidate, sender=model, weak=False, dispatch_uid=f"{uid}:delete"
+    )
+
+
+def _invalidate_on_m2m_change(model, prefix: str) -> None:
+    """Treat changes to ``model``'s own many-to-many fields as writes to it."""
+
+    def invalidate(sender, action, **kwargs):
+        if action in ("post_add", "post_remove", "post_clear"):
+            bump_generation(prefix)
+
+    for field in model._meta.many_to_many:
+        m2m_changed.connect(
+            invalidate,
+            sender=field.remote_field.through,
+            weak=False,
+            dispatch_uid=f"cache-generation:{model._meta.label_lower}:{prefix}:{field.name}",
+        )
+
+
+# ==============================
+# Dependency Graph
+# ==============================
+
+
+class CacheDependencyRegistry:
+    """
+    Declarative map of cache prefixes to the models their payloads embed.
+
+    Registering ``"post"`` with ``depends_on={Category: "category"}`` means
+    a saved or deleted Category invalidates only the cached posts filed under
+    it (plus the post list pages), rather than every cached post.
+    """
+
+    def __init__(self):
+        self.models: Dict[str, type] = {}
+        self.lookup_fields: Dict[str, str] = {}
+        self.dependencies: Dict[str, Dict[type, str]] = {}
+
+    def register(
+        self,
+        prefix: str,
+        model,
+        lookup_field: str = "pk",
+        depends_on: Optional[Dict[type, str]] = None,
+    ) -> None:
+        """
+        Register a cached model and the related models embedded in its payload.
+
+        Args:
+            prefix: Cache prefix used by the model's viewset
+            model: Model whose payloads are cached under the prefix
+            lookup_field: Field the viewset routes detail requests on
+            depends_on: Related model -> query lookup from ``model`` to it
+        """
+        self.models[prefix] = model
+        self.lookup_fields[prefix] = lookup_field
+        self.dependencies[prefix] = dict(depends_on or {})
+
+        register_cache_prefix(model, prefix, lookup_field)
+        _invalidate_on_m2m_change(model, prefix)
+
+        for related_model, relation in self.dependencies[prefix].items():
+            self._connect_dependency(prefix, model, related_model, relation)
+
+    def _connect_dependency(self, prefix: str, model, related_model, relation):
+        uid = f"cache-dependency:{prefix}:{related_model._meta.label_lower}:{relation}"
+        stash = f"_cache_affected_{prefix}_{relation}"
+
+        lookup_field = self.lookup_fields[prefix]
+
+        def affected(instance) -> Set:
+            """Lookup values of cached objects currently related to ``instance``."""
+            if instance.pk is None:
+                return set()
+            return set(
+                model._base_manager.filter(**{relation: instance.pk}).values_list(
+                    lookup_field, flat=True
+                )
+            )
+
+        def before_change(sender, instance, raw=False, **kwargs):
+            # Capture the old relations so moved objects invalidate both sides
+            if not raw:
+                setattr(instance, stash, affected(instance))
+
+        def after_save(sender, instance, raw=False, **kwargs):
+            if raw:
+                return
+            identifiers = instance.__dict__.pop(stash, set()) | affected(instance)
+            invalidate_objects(prefix, identifiers)
+
+        def after_delete(sender, instance, **kwargs):
+            invalidate_objects(prefix, instance.__dict__.pop(stash, set()))
+
+        pre_save.connect(
+            before_change,
+            sender=related_model,
+            weak=False,
+            dispatch_uid=f"{uid}:pre_save",
+        )
+        post_save.connect(
+            after_save,
+            sender=related_model,
+            weak=False,
+            dispatch_uid=f"{uid}:post_save",
+        )
+        pre_delete.connect(
+            before_change,
+            sender=related_model,
+            weak=False,
+            dispatch_uid=f"{uid}:pre_delete",
+        )
+        post_delete.connect(
+            after_delete,
+            sender=related_model,
+            weak=False,
+            dispatch_uid=f"{uid}:post_delete",
+        )
+
+        field = model._meta.get_field(relation.split("__")[0])
+        if not field.many_to_many or "__" in relation:
+            return
+
+        def on_m2m_change(sender, instance, action, pk_set=None, **kwargs):
+            if isinstance(instance, model):
+                if action in ("post_add", "post_remove", "post_clear"):
+                    invalidate_objects(prefix, {getattr(instance, lookup_field)})
+            elif action == "pre_clear":
+                setattr(instance, stash, affected(instance))
+            elif action == "post_clear":
+                invalidate_objects(prefix, instance.__dict__.pop(stash, set()))
+            elif action in ("post_add", "post_remove") and pk_set:
+                invalidate_objects(
+                    prefix,
+                    model._base_manager.filter(pk__in=pk_set).values_list(
+                        lookup_field, flat=True
+                    ),
+                )
+
+        # Reverse relations (Tag.posts) hold the through model directly
+        through = field.through if field.auto_created else field.remote_field.through
+        m2m_changed.connect(
+            on_m2m_change, sender=through, weak=False, dispatch_uid=f"{uid}:m2m"
+        )
+
+
+cache_registry = CacheDependencyRegistry()
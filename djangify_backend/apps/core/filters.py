@@ -0,0 +1,114 @@
+import math
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.signals import request_finished
+from django.db import DatabaseError, connections
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+# Trigram similarity (0-1) a title needs to match a fuzzy query by default
+FUZZY_SEARCH_THRESHOLD = getattr(settings, "FUZZY_SEARCH_THRESHOLD", 0.3)
+# Lowest threshold a client may ask for; below it the trigram index matches
+# so many rows that fuzzy search approaches a full scan
+FUZZY_SEARCH_MIN_THRESHOLD = getattr(settings, "FUZZY_SEARCH_MIN_THRESHOLD", 0.1)
+
+
+def supports_trigram(queryset) -> bool:
+    """Whether the queryset's database has pg_trgm similarity."""
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def set_similarity_threshold(queryset, threshold: float) -> None:
+    """
+    Set pg_trgm.similarity_threshold, the cut-off of the ``%`` operator.
+
+    The operator takes no argument, so the threshold is a session setting.
+    Querysets are evaluated after filtering, outside any block a
+    transaction-local value could be scoped to, so the connection is
+    flagged instead and reset_similarity_threshold restores the default
+    when the request finishes, before a persistent connection is reused.
+    """
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, false)",
+            [str(threshold)],
+        )
+    connection.similarity_threshold_set = True
+
+
+def reset_similarity_threshold(**kwargs) -> None:
+    """Restore the default threshold on connections a request changed it on."""
+    for connection in connections.all(initialized_only=True):
+        if not getattr(connection, "similarity_threshold_set", False):
+            continue
+        connection.similarity_threshold_set = False
+        if connection.connection is None:
+            # Already closed, and a new session starts from the default
+            continue
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("RESET pg_trgm.similarity_threshold")
+        except DatabaseError:
+            # Never hand the setting on to the next request
+            connection.close()
+
+
+request_finished.connect(
+    reset_similarity_threshold, dispatch_uid="reset_similarity_threshold"
+)
+
+
+def fuzzy_search(queryset, field: str, text: str, threshold: float):
+    """
+    Filter rows whose ``field`` is trigram-similar to ``text``.
+
+    Matching uses the ``%`` operator, which the trigram index serves, and
+    annotates ``similarity`` for ranking. Other databases fall back to a
+    case-insensitive substring match without typo tolerance.
+    """
+    if not supports_trigram(queryset):
+        return queryset.filter(**{f"{field}__icontains": text})
+
+    set_similarity_threshold(queryset, threshold)
+    return queryset.filter(**{f"{field}__trigram_similar": text}).annotate(
+        similarity=TrigramSimilarity(field, text)
+    )
+
+
+class FuzzySearchFilter(BaseFilterBackend):
+    """
+    Opt-in typo-tolerant search on a view's ``fuzzy_search_field``.
+
+    ``?fuzzy=<text>`` matches titles by trigram similarity, best match first
+    unless the request asks for an explicit ordering. ``?similarity=`` tunes
+    the threshold between FUZZY_SEARCH_MIN_THRESHOLD and 1.
+    """
+
+    search_param = "fuzzy"
+    threshold_param = "similarity"
+    # Orders matches by similarity, which keyset cursors cannot follow
+    ranks_results = True
+
+    def get_threshold(self, request) -> float:
+        try:
+            threshold = float(request.query_params[self.threshold_param])
+        except (KeyError, ValueError):
+            return FUZZY_SEARCH_THRESHOLD
+        if not math.isfinite(threshold):
+            # nan compares false both ways and would slip through the clamp
+            return FUZZY_SEARCH_THRESHOLD
+        return min(max(threshold, FUZZY_SEARCH_MIN_THRESHOLD), 1.0)
+
+    def filter_queryset(self, request, queryset, view):
+        field = getattr(view, "fuzzy_search_field", None)
+        text = request.query_params.get(self.search_param, "").strip()
+        if not field or not text:
+            return queryset
+
+        queryset = fuzzy_search(queryset, field, text, self.get_threshold(request))
+        if request.query_params.get(api_settings.ORDERING_PARAM) or (
+            "similarity" not in queryset.query.annotations
+        ):
+            return queryset
+        return queryset.order_by("-similarity", *queryset.query.order_by)
@@ -0,0 +1,86 @@
+import statistics
+import time
+from unittest import mock
+from urllib import parse
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from djangify_backend.apps.core.pagination import CustomPagination
+
+
+class PerLinkPagination(CustomPagination):
+    """Baseline building every link from a fresh parse of the request URL."""
+
+    def get_link(self, **params) -> str:
+        return self.with_query_params(self.request.build_absolute_uri(), params)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the next, previous, first and last links of a page-number "
+        "response, against rebuilding each link from the request URL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--filters", type=int, default=3, help="Repeated ?tags__slug= values"
+        )
+
+    def handle(self, *args, **options):
+        request = Request(
+            APIRequestFactory(SERVER_NAME="localhost").get(
+                "/api/v1/blog/posts/",
+                {
+                    "page": 3,
+                    "page_size": 12,
+                    "status": "published",
+                    "search": "django orm",
+                    "tags__slug": [f"tag-{i}" for i in range(options["filters"])],
+                },
+            )
+        )
+        paths = [("per-link", PerLinkPagination), ("cached", CustomPagination)]
+
+        self.stdout.write(f"{'path':<12}{'us/response':>14}{'parses':>9}")
+        links = {}
+        for name, pagination_class in paths:
+            pagination = self.make_pagination(pagination_class, request)
+            median = self.time_response(pagination, options)
+            parses, links[name] = self.count_parses(pagination)
+            self.stdout.write(f"{name:<12}{median:>14.2f}{parses:>9}")
+
+        if len(set(map(tuple, links.values()))) != 1:
+            self.stderr.write("Links differ between paths")
+
+    def make_pagination(self, pagination_class, request):
+        """A paginator on the middle page, so every link is rendered."""
+        pagination = pagination_class()
+        pagination.request = request
+        pagination.keyset = False
+        pagination.count_approximate = False
+        pagination.page = Paginator(range(1000), 12).page(3)
+        return pagination
+
+    def time_response(self, pagination, options):
+        """Median microseconds per paginated response envelope."""
+        timings = []
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            for _ in range(options["iterations"]):
+                # Each response comes from a new request in production
+                pagination._link_request = None
+                pagination.get_paginated_response([])
+            elapsed = time.perf_counter() - start
+            timings.append(elapsed / options["iterations"] * 1e6)
+        return statistics.median(timings)
+
+    def count_parses(self, pagination):
+        """URL parses for one response, and the links it produced."""
+        pagination._link_request = None
+        with mock.patch.object(parse, "urlsplit", wraps=parse.urlsplit) as urlsplit:
+            data = pagination.get_paginated_response([]).data
+        links = [data[key] for key in ("next", "previous", "first", "last")]
+        return urlsplit.call_count, links
@@ -1,10 +1,149 @@
 # djangify_backend/apps/core/pagination.py
 
+from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import (
+    EmptyPage,
+    Page,
+    PageNotAnInteger,
+    Paginator as DjangoPaginator,
+)
+from django.db import connections
+from django.db.models import F, Q
+from django.utils.functional import cached_property
 from collections import OrderedDict
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib import parse
+import base64
+import binascii
+import datetime
+import hashlib
+import json
+import logging
+
+from djangify_backend.apps.core.cache import get_list_namespace
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_count(queryset) -> int:
+    """
+    Row count estimated by the PostgreSQL planner, without scanning rows.
+
+    Accuracy depends on table statistics (ANALYZE); treat it as approximate.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class LookaheadPage(Page):
+    """Page whose next page is known from a look-ahead row, not the count."""
+
+    def __init__(self, object_list, number, paginator, more: bool):
+        super().__init__(object_list, number, paginator)
+        self.more = more
+
+    def has_next(self) -> bool:
+        return self.more
+
+
+class CountingPaginator(DjangoPaginator):
+    """
+    Django paginator that asks the pagination class for its count.
+
+    Pages are fetched with one row past their end. When none follows, the
+    page is the last one and settles the count, so results that fit on a
+    page (or the last page of larger ones) never run COUNT(*). The row
+    also decides whether a next page exists, so when the count is a
+    planner estimate below the real one, trailing rows stay reachable.
+    """
+
+    def __init__(self, object_list, per_page, pagination=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.pagination = pagination
+
+    @cached_property
+    def count(self) -> int:
+        if self.pagination is None:
+            return super().count
+        return self.pagination.get_count(self.object_list)
+
+    @property
+    def approximate(self) -> bool:
+        """Whether the count is a planner estimate."""
+        if self.pagination is None:
+            return False
+        self.count  # get_count() sets count_approximate
+        return self.pagination.count_approximate
+
+    def validate_number(self, number) -> int:
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # Past the estimate; page() checks for rows instead
+            if self.approximate and int(number) > 1:
+                return int(number)
+            raise
+
+    def page(self, number) -> Page:
+        if self.pagination is None or self.orphans:
+            return super().page(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        more = len(rows) > self.per_page
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        if not more and "count" not in self.__dict__:
+            # The last page: its offset and rows give the exact count
+            self.count = bottom + len(rows)
+            self.pagination.count_approximate = False
+        return LookaheadPage(rows[: self.per_page], number, self, more=more)
+
+
+class ResultIdsPaginator(DjangoPaginator):
+    """
+    Paginator over an ordered list of primary keys, such as cached search
+    results. The count is the list's length and each page loads only its
+    own rows, kept in list order.
+    """
+
+    def __init__(self, result_ids, per_page, queryset=None, **kwargs):
+        super().__init__(result_ids, per_page, **kwargs)
+        self.queryset = queryset
+
+    def _get_page(self, result_ids, number, paginator):
+        rows = {obj.pk: obj for obj in self.queryset.filter(pk__in=result_ids)}
+        return super()._get_page(
+            [rows[pk] for pk in result_ids if pk in rows], number, paginator
+        )
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """JSON encoder keeping full microsecond precision for cursor positions."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
 
 
 class CustomPagination(PageNumberPagination):
@@ -14,59 +153,227 @@ class CustomPagination(PageNumberPagination):
     - Page size query parameter support
     - First and last page URLs
     - Consistent response format
+    - Opt-in keyset pagination with ``?cursor=`` on views that declare a
+      ``cursor_ordering``, which skips COUNT(*) and OFFSET entirely; a
+      cursor combined with another ordering or a ranked search is a 400
+    - Counts cached per filter signature on cached viewsets, and planner
+      estimates on PostgreSQL for large results (flagged ``count_approximate``)
+    - Pages sliced from ``view.result_ids`` when a filter resolved the
+      results to a cached list of primary keys
     """
 
     page_size = 12  # Default page size
     page_size_query_param = "page_size"
     max_page_size = 100
     page_query_param = "page"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    # Cache counts under the view's cache generation (CacheMixin views only)
+    count_cache_enabled = getattr(settings, "PAGINATION_COUNT_CACHE", True)
+    # Planner estimates at or above this many rows replace exact counts;
+    # None always counts exactly
+    count_estimate_threshold = getattr(
+        settings, "PAGINATION_COUNT_ESTIMATE_THRESHOLD", None
+    )
 
-    def remove_query_param(self, url: str, key: str) -> str:
+    def paginate_queryset(self, queryset, request, view=None) -> Optional[List]:
         """
-        Given a URL and a key, remove that query parameter from the URL.
+        Paginate by page number, or by keyset when a cursor is requested.
+
+        Sending ``cursor`` (empty for the first page) opts into keyset mode
+        on views with a ``cursor_ordering``; other clients are unaffected.
         """
-        parsed = parse.urlparse(url)
-        query_dict = dict(parse.parse_qsl(parsed.query))
-        query_dict.pop(key, None)
-        new_query = parse.urlencode(query_dict)
-        return parse.urlunparse(
-            (
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                parsed.params,
-                new_query,
-                parsed.fragment,
+        self.keyset = self.is_keyset_request(request, view)
+        if not self.keyset:
+            self.view = view
+            self.count_approximate = False
+            return super().paginate_queryset(queryset, request, view)
+
+        conflicts = self.get_keyset_conflicts(request, view)
+        if conflicts:
+            raise ParseError(
+                f"{self.cursor_query_param} cannot be combined with "
+                f"{', '.join(conflicts)}"
             )
+        return self.paginate_keyset(queryset, request, view.cursor_ordering)
+
+    def is_keyset_request(self, request, view=None) -> bool:
+        """Whether the request opted into keyset pagination on a view supporting it."""
+        return (
+            bool(getattr(view, "cursor_ordering", None))
+            and self.cursor_query_param in request.query_params
         )
 
+    def get_keyset_conflicts(self, request, view) -> List[str]:
+        """
+        Query parameters ordering the results other than by cursor_ordering.
+
+        Cursors encode a position in cursor_ordering, so an explicit
+        ``ordering`` or a backend ranking its matches (``ranks_results``)
+        would order the first page differently from the pages after it.
+        """
+        conflicts = []
+        ordering = request.query_params.get(api_settings.ORDERING_PARAM, "")
+        fields = [field.strip() for field in ordering.split(",") if field.strip()]
+        if fields and fields != list(view.cursor_ordering):
+            conflicts.append(api_settings.ORDERING_PARAM)
+        for backend in getattr(view, "filter_backends", ()):
+            param = getattr(backend, "search_param", None)
+            if (
+                getattr(backend, "ranks_results", False)
+                and request.query_params.get(param, "").strip()
+            ):
+                conflicts.append(param)
+        return conflicts
+
+    def remove_query_param(self, url: str, key: str) -> str:
+        """
+        Given a URL and a key, remove that query parameter from the URL.
+        """
+        return self.with_query_params(url, {key: None})
+
     def replace_query_param(self, url: str, key: str, value: Any) -> str:
         """
         Given a URL and a key/value pair, set or replace that query parameter in the URL.
         """
-        parsed = parse.urlparse(url)
-        query_dict = dict(parse.parse_qsl(parsed.query))
-        query_dict[key] = value
-        new_query = parse.urlencode(query_dict)
-        return parse.urlunparse(
-            (
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                parsed.params,
-                new_query,
-                parsed.fragment,
+        return self.with_query_params(url, {key: value})
+
+    def with_query_params(self, url: str, params: Dict[str, Any]) -> str:
+        """
+        Set or remove (value None) query parameters, keeping repeated keys.
+        """
+        parsed = parse.urlsplit(url)
+        query = parse.parse_qsl(parsed.query, keep_blank_values=True)
+        return self.build_url(parsed, query, params)
+
+    def build_url(
+        self,
+        parsed: parse.SplitResult,
+        query: List[Tuple[str, str]],
+        params: Dict[str, Any],
+    ) -> str:
+        """Rebuild a parsed URL with ``params`` replacing their keys in ``query``."""
+        query = [(key, value) for key, value in query if key not in params]
+        query.extend((key, value) for key, value in params.items() if value is not None)
+        return parse.urlunsplit(parsed._replace(query=parse.urlencode(query)))
+
+    def get_link(self, **params) -> str:
+        """
+        URL of the current request with ``params`` set (None removes one).
+
+        The request URL is parsed once per response, and the query string
+        without the overridden keys is encoded once per set of keys, so
+        each link only encodes the parameters that change.
+        """
+        if getattr(self, "_link_request", None) is not self.request:
+            parsed = parse.urlsplit(self.request.build_absolute_uri())
+            self._link_url = parsed._replace(query="")
+            self._link_query = parse.parse_qsl(parsed.query, keep_blank_values=True)
+            self._link_encoded: Dict[frozenset, str] = {}
+            self._link_request = self.request
+
+        keys = frozenset(params)
+        rest = self._link_encoded.get(keys)
+        if rest is None:
+            rest = self._link_encoded[keys] = parse.urlencode(
+                [(key, value) for key, value in self._link_query if key not in keys]
             )
+        changed = parse.urlencode(
+            [(key, value) for key, value in params.items() if value is not None]
+        )
+        query = "&".join(part for part in (rest, changed) if part)
+        return parse.urlunsplit(self._link_url._replace(query=query))
+
+    def django_paginator_class(self, queryset, page_size: int) -> DjangoPaginator:
+        """Build the Django paginator, delegating its count to get_count()."""
+        result_ids = getattr(getattr(self, "view", None), "result_ids", None)
+        if result_ids is not None:
+            return ResultIdsPaginator(result_ids, page_size, queryset=queryset)
+        return CountingPaginator(queryset, page_size, pagination=self)
+
+    # =====================================
+    # Counts
+    # =====================================
+
+    def get_filter_signature(self, request) -> str:
+        """
+        Digest of the query parameters that can change the row count.
+
+        Paging, ordering and format parameters are dropped and the rest
+        sorted, so equivalent URLs share one cached count.
+        """
+        ignored = {
+            self.page_query_param,
+            self.page_size_query_param,
+            self.cursor_query_param,
+            api_settings.ORDERING_PARAM,
+            api_settings.URL_FORMAT_OVERRIDE,
+        }
+        params = sorted(
+            (key, value.strip())
+            for key, values in request.query_params.lists()
+            if key not in ignored
+            for value in values
+            if value.strip()
         )
+        return hashlib.md5(repr(params).encode()).hexdigest()
+
+    def get_count(self, queryset) -> int:
+        """
+        Count the filtered queryset, reusing a cached count when possible.
+
+        The cache key carries the view's list generation, so any write to
+        the prefix (or a model its payload depends on) drops cached counts.
+        """
+        view = getattr(self, "view", None)
+        if (
+            not self.count_cache_enabled
+            or not hasattr(view, "get_cache_key")
+            or view.bypasses_cache(self.request)
+        ):
+            count, self.count_approximate = self.count_queryset(queryset)
+            return count
+
+        namespace = view.get_cache_namespace()
+        key = view.get_cache_key(
+            "count",
+            scopes=(get_list_namespace(namespace),),
+            filters=self.get_filter_signature(self.request),
+            aud=view.get_cache_audience(self.request),
+            **view.kwargs,
+        )
+        (count, self.count_approximate), _ = view.get_or_refresh_response(
+            key, lambda: self.count_queryset(queryset)
+        )
+        return count
+
+    def count_queryset(self, queryset) -> Tuple[int, bool]:
+        """
+        Returns:
+            Tuple[int, bool]: The count and whether it is a planner estimate
+        """
+        threshold = self.count_estimate_threshold
+        if threshold is not None and connections[queryset.db].vendor == "postgresql":
+            try:
+                estimate = estimate_count(queryset)
+            except Exception as e:
+                logger.error(f"Error estimating count: {str(e)}")
+            else:
+                if estimate >= threshold:
+                    return estimate, True
+        return queryset.count(), False
 
     def get_paginated_response(self, data: Any) -> Response:
         """
         Enhance the pagination response with additional metadata
         """
+        if self.keyset:
+            return self.get_keyset_response(data)
         return Response(
             OrderedDict(
                 [
                     ("count", self.page.paginator.count),
+                    ("count_approximate", self.count_approximate),
                     ("total_pages", self.page.paginator.num_pages),
                     ("current_page", self.page.number),
                     ("page_size", self.get_page_size(self.request)),
@@ -79,24 +386,188 @@ class CustomPagination(PageNumberPagination):
             )
         )
 
-    def get_first_link(self) -> str:
+    def get_next_link(self) -> Optional[str]:
+        """
+        Get URL for the next page
+        """
+        if not self.page.has_next():
+            return None
+        return self.get_link(**{self.page_query_param: self.page.next_page_number()})
+
+    def get_previous_link(self) -> Optional[str]:
+        """
+        Get URL for the previous page
+        """
+        if not self.page.has_previous():
+            return None
+        page_number = self.page.previous_page_number()
+        if page_number == 1:
+            return self.get_link(**{self.page_query_param: None})
+        return self.get_link(**{self.page_query_param: page_number})
+
+    def get_first_link(self) -> Optional[str]:
         """
         Get URL for the first page
         """
         if not self.page.paginator.num_pages:
             return None
-        url = self.request.build_absolute_uri()
-        return self.remove_query_param(url, self.page_query_param)
+        return self.get_link(**{self.page_query_param: None})
 
-    def get_last_link(self) -> str:
+    def get_last_link(self) -> Optional[str]:
         """
         Get URL for the last page
         """
         if not self.page.paginator.num_pages:
             return None
-        url = self.request.build_absolute_uri()
         page_number = self.page.paginator.num_pages
-        return self.replace_query_param(url, self.page_query_param, page_number)
+        return self.get_link(**{self.page_query_param: page_number})
+
+    # =====================================
+    # Keyset Pagination
+    # =====================================
+
+    def paginate_keyset(self, queryset, request, ordering: Sequence[str]) -> List:
+        """
+        Return the page after (or before) the position encoded in the cursor.
+
+        Rows are ordered by ``ordering`` with NULLs last, and the page is
+        selected with a WHERE clause on the cursor position, so the cost of
+        a page does not depend on how deep it is.
+        """
+        self.request = request
+        self.cursor_page_size = self.get_page_size(request)
+        self.ordering = self.parse_ordering(ordering)
+        self.model = queryset.model
+        position, reverse = self.decode_cursor(
+            request.query_params[self.cursor_query_param]
+        )
+        self.has_cursor = position is not None
+
+        queryset = queryset.order_by(*self.get_order_expressions(reverse))
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(position, reverse))
+        rows = list(queryset[: self.cursor_page_size + 1])
+        has_more = len(rows) > self.cursor_page_size
+        rows = rows[: self.cursor_page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = self.has_cursor, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.has_cursor
+        self.rows = rows
+        return rows
+
+    def parse_ordering(self, ordering: Sequence[str]) -> List[Tuple[str, bool]]:
+        """Split ``-field`` strings into (field name, descending) pairs."""
+        return [(field.lstrip("-"), field.startswith("-")) for field in ordering]
+
+    def get_order_expressions(self, reverse: bool = False) -> List:
+        """Order expressions with NULLs last, or the exact mirror when reversed."""
+        nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        expressions = []
+        for field, descending in self.ordering:
+            if descending != reverse:
+                expressions.append(F(field).desc(**nulls))
+            else:
+                expressions.append(F(field).asc(**nulls))
+        return expressions
+
+    def get_keyset_filter(self, position: Sequence, reverse: bool = False) -> Q:
+        """
+        Build the row-value comparison selecting rows past ``position``.
+
+        Expands ``(a, b, c) > (x, y, z)`` into OR-ed prefixes of equalities,
+        honouring each field's direction and the NULLS LAST ordering.
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (field, descending), value in zip(self.ordering, position):
+            if value is None:
+                # Every non-NULL value sorts before NULL
+                past = Q(**{f"{field}__isnull": False}) if reverse else None
+                same = Q(**{f"{field}__isnull": True})
+            else:
+                lookup = "gt" if descending == reverse else "lt"
+                past = Q(**{f"{field}__{lookup}": value})
+                if not reverse and self.model._meta.get_field(field).null:
+                    past |= Q(**{f"{field}__isnull": True})
+                same = Q(**{field: value})
+            if past is not None:
+                condition |= equal & past
+            equal &= same
+        return condition
+
+    def get_position(self, instance) -> List:
+        """Values of the ordering fields for a row, as stored in cursors."""
+        return [getattr(instance, field) for field, _ in self.ordering]
+
+    def encode_cursor(self, position: Sequence, reverse: bool = False) -> str:
+        """Serialize a position into an opaque, URL-safe cursor."""
+        payload = json.dumps(
+            {"p": list(position), "r": int(reverse)}, cls=CursorEncoder
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> Tuple[Optional[List], bool]:
+        """
+        Parse a cursor produced by encode_cursor().
+
+        Returns:
+            Tuple[Optional[List], bool]: The position (None for the first
+            page) and whether to page backwards
+
+        Raises:
+            NotFound: If the cursor is malformed
+        """
+        if not cursor:
+            return None, False
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values = payload["p"]
+            if len(values) != len(self.ordering):
+                raise ValueError("Cursor does not match the ordering")
+            position = [
+                (
+                    None
+                    if value is None
+                    else self.model._meta.get_field(field).to_python(value)
+                )
+                for (field, _), value in zip(self.ordering, values)
+            ]
+            return position, bool(payload.get("r"))
+        except (binascii.Error, TypeError, KeyError, ValueError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_cursor_link(
+        self, position: Optional[Sequence], reverse: bool = False
+    ) -> str:
+        cursor = "" if position is None else self.encode_cursor(position, reverse)
+        return self.get_link(**{self.cursor_query_param: cursor})
+
+    def get_keyset_response(self, data: Any) -> Response:
+        """
+        Keyset envelope: the page-number fields that need no COUNT(*).
+        """
+        next_link = previous_link = None
+        if self.has_next and self.rows:
+            next_link = self.get_cursor_link(self.get_position(self.rows[-1]))
+        if self.has_previous and self.rows:
+            previous_link = self.get_cursor_link(
+                self.get_position(self.rows[0]), reverse=True
+            )
+        return Response(
+            OrderedDict(
+                [
+                    ("page_size", self.cursor_page_size),
+                    ("next", next_link),
+                    ("previous", previous_link),
+                    ("first", self.get_cursor_link(None)),
+                    ("results", data),
+                ]
+            )
+        )
 
     def get_paginated_response_schema(self, schema: Dict) -> Dict:
         """
@@ -109,6 +580,10 @@ class CustomPagination(PageNumberPagination):
                     "type": "integer",
                     "description": "Total number of items",
                 },
+                "count_approximate": {
+                    "type": "boolean",
+                    "description": "Whether count is a planner estimate",
+                },
                 "total_pages": {
                     "type": "integer",
                     "description": "Total number of pages",
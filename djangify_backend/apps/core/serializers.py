@@ -10,4 +10,20 @@ class SEOModelSerializer(serializers.ModelSerializer):
     class Meta:
         model = SEOModel
         fields = ['meta_title', 'meta_description', 'meta_keywords']
-        
\ No newline at end of file
+        
+
+class ExpandableFieldsMixin:
+    """
+    Serializer mixin nesting the relations named in ``context["expand"]``.
+
+    Meta.expandable_fields maps a field name to the serializer class and
+    keyword arguments used when it is expanded. Otherwise the declared
+    field is kept, usually ids or slugs.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        expandable = getattr(self.Meta, 'expandable_fields', {})
+        for name in self.context.get('expand', ()):
+            if name in expandable:
+                serializer_class, options = expandable[name]
+                self.fields[name] = serializer_class(**options)
@@ -0,0 +1,64 @@
+"""
+Fixtures shared by the apps' test suites.
+
+Mix these into Django test cases ahead of the TestCase base class, e.g.
+``class PostTests(BlogFixturesMixin, TestCase)``.
+"""
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from djangify_backend.apps.blog.models import Category, Post
+from djangify_backend.apps.core.cache import local_cache
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class CacheResetMixin:
+    """Run each test with an API client against empty shared and local caches."""
+
+    client_class = APIClient
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        local_cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        local_cache.clear()
+        super().tearDown()
+
+
+class BlogFixturesMixin(CacheResetMixin):
+    """Empty caches, a "general" category shared by the class and a post factory."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.category = Category.objects.create(
+            name="General", slug="general", title="General"
+        )
+
+    def make_post(self, slug, content="<p>Content</p>", status="published", **kwargs):
+        """
+        Create a post in the shared category.
+
+        Args:
+            slug: Slug of the post; its title-cased form is the default title
+            content: HTML content
+            status: Post status
+            **kwargs: Other Post fields, overriding ``title`` and
+                ``published_date`` (now) as well
+        """
+        fields = {"title": slug.title(), "published_date": timezone.now(), **kwargs}
+        return Post.objects.create(
+            slug=slug,
+            content=content,
+            category=self.category,
+            status=status,
+            **fields,
+        )
@@ -1,3 +1,947 @@
-from django.test import TestCase
+import os
+import re
+from unittest import mock
+from urllib import parse
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.core.signals import request_finished
+from django.db import DatabaseError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from djangify_backend.apps.blog.models import Category, Comment, Post, Tag
+from djangify_backend.apps.blog.search import normalize_search_query, search_stats
+from djangify_backend.apps.core.cache import (
+    COMPRESSION_SETTINGS,
+    GENERATION_KEY_PREFIX,
+    LOCAL_CACHE_SETTINGS,
+    RAW_MARKER,
+    ZLIB_MARKER,
+    LocalCache,
+    acquire_lock,
+    decode_value,
+    encode_value,
+    format_server_timing,
+    get_entry,
+    get_generation_key,
+    get_generations,
+    get_or_refresh,
+    local_cache,
+    make_entry,
+    metrics,
+    release_lock,
+    set_entry,
+)
+from djangify_backend.apps.core.filters import (
+    FUZZY_SEARCH_THRESHOLD,
+    FuzzySearchFilter,
+)
+from djangify_backend.apps.core.pagination import CustomPagination
+from djangify_backend.apps.core.testing import (
+    LOCMEM_CACHES,
+    BlogFixturesMixin,
+    CacheResetMixin,
+)
+from djangify_backend.apps.portfolio.models import Portfolio, Technology
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GetOrRefreshTests(CacheResetMixin, SimpleTestCase):
+    """Stale-while-revalidate behaviour of get_or_refresh."""
+
+    key = "post:retrieve:refresh-test"
+
+    def store(self, value, fresh_for):
+        set_entry(self.key, make_entry(value, fresh_for), 60)
+
+    def get(self, compute):
+        return get_or_refresh(self.key, compute, timeout=30, stale_timeout=30)
+
+    def test_fresh_hit_skips_compute(self):
+        self.store("cached", 30)
+        compute = mock.Mock(return_value="fresh")
+        self.assertEqual(self.get(compute), ("cached", True))
+        compute.assert_not_called()
+
+    def test_miss_computes_and_stores(self):
+        compute = mock.Mock(return_value="fresh")
+        self.assertEqual(self.get(compute), ("fresh", False))
+        self.assertEqual(self.get(compute), ("fresh", True))
+        compute.assert_called_once()
+
+    def test_stale_hit_refreshes_once_under_the_lock(self):
+        self.store("stale", -1)
+        compute = mock.Mock(return_value="fresh")
+
+        # Another worker holds the lock: keep serving the stale value
+        self.assertTrue(acquire_lock(self.key, 10))
+        self.assertEqual(self.get(compute), ("stale", True))
+        compute.assert_not_called()
+        release_lock(self.key)
+
+        self.assertEqual(self.get(compute), ("fresh", False))
+        self.assertEqual(self.get(compute), ("fresh", True))
+        compute.assert_called_once()
+
+    def test_database_error_serves_stale_value(self):
+        self.store("stale", -1)
+        compute = mock.Mock(side_effect=DatabaseError("connection lost"))
+        with self.assertLogs("djangify_backend.apps.core.cache", "WARNING"):
+            self.assertEqual(self.get(compute), ("stale", True))
+
+        # The lock was released, so the next request retries the refresh
+        compute.side_effect = None
+        compute.return_value = "fresh"
+        self.assertEqual(self.get(compute), ("fresh", False))
+
+
+class LocalCacheTests(SimpleTestCase):
+    """LRU bounds and TTL expiry of the per-worker tier."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        local = LocalCache(max_entries=2, timeout=30)
+        local.set("a", 1)
+        local.set("b", 2)
+        self.assertEqual(local.get("a"), 1)
+
+        local.set("c", 3)
+        self.assertIsNone(local.get("b"))
+        self.assertEqual((local.get("a"), local.get("c")), (1, 3))
+        self.assertEqual(local.stats()["evictions"], 1)
+
+    def test_entries_expire_after_their_timeout(self):
+        local = LocalCache(timeout=30)
+        with mock.patch("time.monotonic", return_value=1000):
+            local.set("default", 1)
+            local.set("short", 2, timeout=5)
+            local.set("disabled", 3, timeout=0)
+        with mock.patch("time.monotonic", return_value=1010):
+            self.assertEqual(local.get("default"), 1)
+            self.assertIsNone(local.get("short"))
+            self.assertIsNone(local.get("disabled"))
+        with mock.patch("time.monotonic", return_value=1031):
+            self.assertEqual(local.get("default", "expired"), "expired")
+        self.assertEqual(local.stats()["size"], 0)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_generations_are_reused_for_the_staleness_window(self):
+        cache.clear()
+        local_cache.clear()
+        self.addCleanup(local_cache.clear)
+        window = LOCAL_CACHE_SETTINGS["GENERATION_TIMEOUT"]
+
+        with mock.patch("time.monotonic", return_value=1000):
+            (generation,) = get_generations("window-test")
+        # Another worker bumps the counter in the shared cache only
+        cache.incr(get_generation_key("window-test"))
+
+        with mock.patch("time.monotonic", return_value=1000 + window - 0.1):
+            self.assertEqual(get_generations("window-test"), [generation])
+        with mock.patch("time.monotonic", return_value=1000 + window + 0.1):
+            self.assertEqual(get_generations("window-test"), [generation + 1])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheEncodingTests(CacheResetMixin, SimpleTestCase):
+    """Marker-prefixed, optionally compressed shared cache entries."""
+
+    def test_small_values_are_stored_raw(self):
+        value = {"data": {"title": "Post"}, "status": 200}
+        encoded = encode_value(value)
+        self.assertEqual(encoded[:1], RAW_MARKER)
+        self.assertEqual(decode_value(encoded), value)
+
+    def test_large_values_are_compressed(self):
+        value = {"content": b"<p>Repeated content</p>" * 500, "status": 200}
+        stats = {}
+        encoded = encode_value(value, stats)
+        self.assertEqual(encoded[:1], ZLIB_MARKER)
+        self.assertLess(stats["stored_size"], stats["size"])
+        self.assertEqual(decode_value(encoded), value)
+
+    def test_incompressible_values_stay_raw(self):
+        value = os.urandom(COMPRESSION_SETTINGS["MIN_SIZE"] * 4)
+        encoded = encode_value(value)
+        self.assertEqual(encoded[:1], RAW_MARKER)
+        self.assertEqual(decode_value(encoded), value)
+
+    def test_entries_cached_before_the_marker_are_read_as_is(self):
+        entry = make_entry({"content": b"<p>Legacy</p>" * 500}, 30)
+        self.assertEqual(decode_value(entry), entry)
+        self.assertEqual(decode_value(b"legacy bytes"), b"legacy bytes")
+
+        cache.set("post:retrieve:legacy", entry)
+        self.assertEqual(get_entry("post:retrieve:legacy"), entry)
+
+    def test_entries_round_trip_through_the_shared_cache(self):
+        entry = make_entry({"content": b"<p>Stored content</p>" * 500}, 30)
+        set_entry("post:retrieve:stored", entry, 60)
+        self.assertEqual(cache.get("post:retrieve:stored")[:1], ZLIB_MARKER)
+
+        local_cache.clear()
+        self.assertEqual(get_entry("post:retrieve:stored"), entry)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class LookupCacheKeyTests(BlogFixturesMixin, TestCase):
+    """
+    Cache key matrix for viewsets routed by slug.
+
+    Each case names a detail route, a factory creating an object with a given
+    slug, and the field shown in the payload, so the same checks run against
+    every slug-routed viewset.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = get_user_model().objects.create_superuser(
+            username="admin", email="admin@example.com", password="password"
+        )
+
+    # =====================================
+    # Factories
+    # =====================================
+
+    def make_category(self, slug):
+        return Category.objects.create(name=slug.title(), slug=slug, title=slug)
+
+    def make_tag(self, slug):
+        return Tag.objects.create(name=slug.title(), slug=slug, title=slug)
+
+    def make_technology(self, slug):
+        return Technology.objects.create(
+            name=slug.title(), slug=slug, icon=f"{slug}.svg"
+        )
+
+    def make_project(self, slug):
+        return Portfolio.objects.create(
+            title=slug.title(),
+            slug=slug,
+            description="Project description",
+            short_description="Project",
+        )
+
+    def cases(self):
+        return [
+            ("/api/v1/blog/posts/", self.make_post, "title"),
+            ("/api/v1/blog/categories/", self.make_category, "name"),
+            ("/api/v1/blog/tags/", self.make_tag, "name"),
+            ("/api/v1/portfolio/projects/", self.make_project, "title"),
+            ("/api/v1/portfolio/technologies/", self.make_technology, "name"),
+        ]
+
+    def get_detail(self, base, slug):
+        return self.client.get(f"{base}{slug}/")
+
+    # =====================================
+    # Matrix
+    # =====================================
+
+    def test_distinct_slugs_do_not_collide(self):
+        for base, factory, field in self.cases():
+            with self.subTest(base=base):
+                factory("first-item")
+                factory("second-item")
+
+                first = self.get_detail(base, "first-item")
+                second = self.get_detail(base, "second-item")
+
+                self.assertEqual(first.status_code, 200)
+                self.assertEqual(second.status_code, 200)
+                self.assertEqual(first.json()["data"][field], "First-Item")
+                self.assertEqual(second.json()["data"][field], "Second-Item")
+                self.assertEqual(self.get_detail(base, "missing").status_code, 404)
+
+    def test_renamed_slug_is_not_served_from_cache(self):
+        for base, factory, field in self.cases():
+            with self.subTest(base=base):
+                obj = factory("old-slug")
+                self.assertEqual(self.get_detail(base, "old-slug").status_code, 200)
+
+                obj.slug = "new-slug"
+                obj.save()
+
+                self.assertEqual(self.get_detail(base, "old-slug").status_code, 404)
+                self.assertEqual(self.get_detail(base, "new-slug").status_code, 200)
+                obj.delete()
+
+    def test_missing_slug_is_served_once_created(self):
+        for base, factory, field in self.cases():
+            with self.subTest(base=base):
+                self.assertEqual(self.get_detail(base, "late-item").status_code, 404)
+                with self.assertNumQueries(0):
+                    response = self.get_detail(base, "late-item")
+                self.assertEqual(response.status_code, 404)
+
+                factory("late-item")
+                self.assertEqual(self.get_detail(base, "late-item").status_code, 200)
+
+    @override_settings(ALLOWED_HOSTS=["internal", "public.example.com"])
+    def test_absolute_urls_are_cached_per_host(self):
+        self.make_post("first-post")
+        self.make_post("second-post")
+        requests = [
+            ({"HTTP_HOST": "internal"}, "http://internal/"),
+            ({"HTTP_HOST": "public.example.com", "secure": True}, "https://public"),
+        ]
+        for headers, origin in requests:
+            with self.subTest(origin=origin):
+                response = self.client.get(
+                    "/api/v1/blog/posts/", {"page_size": 1}, **headers
+                )
+                self.assertTrue(response.json()["next"].startswith(origin))
+
+                response = self.client.get("/api/v1/blog/posts/first-post/", **headers)
+                self.assertTrue(
+                    response.json()["data"]["comments_url"].startswith(origin)
+                )
+
+    def test_object_generations_expire(self):
+        for index in range(3):
+            self.get_detail("/api/v1/blog/posts/", f"bogus-{index}")
+        keys = [key for key in cache._cache if ":post:obj:bogus-" in key]
+        self.assertEqual(len(keys), 3)
+        # Prefix-wide counters stay; per-slug counters carry an expiry
+        self.assertTrue(all(cache._expire_info[key] is not None for key in keys))
+        self.assertIsNone(
+            cache._expire_info[cache.make_key(get_generation_key("post"))]
+        )
+
+    def test_model_save_invalidates_detail(self):
+        for base, factory, field in self.cases():
+            with self.subTest(base=base):
+                obj = factory("cached-item")
+                self.get_detail(base, "cached-item")
+
+                setattr(obj, field, "Changed")
+                obj.save()
+
+                response = self.get_detail(base, "cached-item")
+                self.assertEqual(response.json()["data"][field], "Changed")
+                obj.delete()
+                self.assertEqual(self.get_detail(base, "cached-item").status_code, 404)
+
+    def test_sparse_fieldsets_are_cached_separately(self):
+        for base, factory, field in self.cases():
+            with self.subTest(base=base):
+                factory("sparse-item")
+
+                response = self.client.get(f"{base}sparse-item/?fields={field}")
+                self.assertEqual(list(response.json()["data"]), [field])
+
+                response = self.get_detail(base, "sparse-item")
+                self.assertIn("slug", response.json()["data"])
+
+                response = self.client.get(f"{base}sparse-item/?omit=slug")
+                self.assertNotIn("slug", response.json()["data"])
+                self.assertIn(field, response.json()["data"])
+
+    def test_unknown_sparse_fields_are_rejected(self):
+        for base, factory, field in self.cases():
+            factory("sparse-item")
+            for url, param in ((base, "fields"), (f"{base}sparse-item/", "omit")):
+                with self.subTest(url=url, param=param):
+                    response = self.client.get(
+                        url, {param: f"{field},nonexistent,bogus"}
+                    )
+                    self.assertEqual(response.status_code, 400)
+                    self.assertEqual(
+                        response.json()["data"],
+                        {
+                            param: [
+                                "Unknown field: bogus",
+                                "Unknown field: nonexistent",
+                            ]
+                        },
+                    )
+
+    def test_api_update_and_destroy_invalidate_detail(self):
+        # Projects are the only slug-routed viewset writable through the API
+        base = "/api/v1/portfolio/projects/"
+        self.client.force_authenticate(self.admin)
+        self.make_project("api-item")
+        self.get_detail(base, "api-item")
+
+        response = self.client.patch(
+            f"{base}api-item/", {"slug": "api-renamed"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.get_detail(base, "api-item").status_code, 404)
+        self.assertEqual(self.get_detail(base, "api-renamed").status_code, 200)
+
+        response = self.client.delete(f"{base}api-renamed/")
+        self.assertEqual(response.status_code, 204, response.content)
+        self.assertEqual(self.get_detail(base, "api-renamed").status_code, 404)
+
+    def test_dependency_changes_invalidate_post_detail(self):
+        post = self.make_post("with-comments")
+        response = self.get_detail("/api/v1/blog/posts/", "with-comments")
+        self.assertEqual(response.json()["data"]["comments"], [])
+
+        comment = Comment.objects.create(
+            post=post, name="Reader", email="reader@example.com", content="Nice"
+        )
+        comment.is_approved = True
+        comment.save()
+
+        response = self.get_detail("/api/v1/blog/posts/", "with-comments")
+        self.assertEqual(len(response.json()["data"]["comments"]), 1)
+
+        post.category.name = "Renamed"
+        post.category.save()
+
+        response = self.get_detail("/api/v1/blog/posts/", "with-comments")
+        self.assertEqual(response.json()["data"]["category"]["name"], "Renamed")
+
+    def test_nested_comment_lists_do_not_collide(self):
+        for slug in ("first-post", "second-post"):
+            Comment.objects.create(
+                post=self.make_post(slug),
+                name="Reader",
+                email="reader@example.com",
+                content=f"On {slug}",
+                is_approved=True,
+            )
+
+        for slug in ("first-post", "second-post"):
+            response = self.client.get(f"/api/v1/blog/posts/{slug}/comments/")
+            self.assertEqual(response.json()["count"], 1)
+            self.assertEqual(response.json()["results"][0]["content"], f"On {slug}")
+
+    def test_fuzzy_title_lists_are_cached_separately(self):
+        for base, make, field in (self.cases()[0], self.cases()[3]):
+            with self.subTest(base=base):
+                make("alpha-release")
+                make("beta-release")
+                response = self.client.get(base, {"fuzzy": "alpha"})
+                self.assertEqual(
+                    [item[field] for item in response.json()["results"]],
+                    ["Alpha-Release"],
+                )
+                response = self.client.get(base, {"fuzzy": "beta"})
+                self.assertEqual(response.json()["count"], 1)
+                self.assertEqual(response.json()["results"][0][field], "Beta-Release")
+
+    def test_dependency_changes_invalidate_project_detail(self):
+        project = self.make_project("with-tech")
+        technology = self.make_technology("python")
+        response = self.get_detail("/api/v1/portfolio/projects/", "with-tech")
+        self.assertEqual(response.json()["data"]["technologies"], [])
+
+        project.technologies.add(technology)
+        response = self.get_detail("/api/v1/portfolio/projects/", "with-tech")
+        self.assertEqual(len(response.json()["data"]["technologies"]), 1)
+
+        # Technologies are nested only when expanded
+        url = "/api/v1/portfolio/projects/with-tech/?expand=technologies"
+        self.assertEqual(
+            self.client.get(url).json()["data"]["technologies"][0]["name"], "Python"
+        )
+        technology.name = "Python 3"
+        technology.save()
+        response = self.client.get(url)
+        self.assertEqual(response.json()["data"]["technologies"][0]["name"], "Python 3")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AudienceCacheTests(BlogFixturesMixin, TestCase):
+    """Responses cached for staff must never be served to other audiences."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.staff = get_user_model().objects.create_user(
+            username="staff", password="password", is_staff=True
+        )
+        cls.reader = get_user_model().objects.create_user(
+            username="reader", password="password"
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.make_post(
+            "draft-post", "<p>Unpublished</p>", status="draft", published_date=None
+        )
+
+    def test_staff_list_does_not_leak_to_anonymous(self):
+        self.client.force_authenticate(self.staff)
+        self.assertEqual(self.client.get("/api/v1/blog/posts/").json()["count"], 1)
+
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get("/api/v1/blog/posts/").json()["count"], 0)
+
+        self.client.force_authenticate(self.reader)
+        self.assertEqual(self.client.get("/api/v1/blog/posts/").json()["count"], 0)
+
+    def test_staff_detail_does_not_leak_to_anonymous(self):
+        self.client.force_authenticate(self.staff)
+        response = self.client.get("/api/v1/blog/posts/draft-post/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Cookie", response["Vary"])
+
+        self.client.force_authenticate(None)
+        response = self.client.get("/api/v1/blog/posts/draft-post/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_staff_bypass_skips_cache(self):
+        from djangify_backend.apps.blog.viewsets import PostViewSet
+
+        with mock.patch.object(PostViewSet, "cache_bypass_staff", True):
+            self.client.force_authenticate(self.staff)
+            self.client.get("/api/v1/blog/posts/")
+            self.client.get("/api/v1/blog/posts/draft-post/")
+
+        self.assertFalse(
+            [key for key in cache._cache if ":aud:staff" in key],
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheMetricsTests(BlogFixturesMixin, TestCase):
+    """Server-Timing headers and the cache metrics endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = get_user_model().objects.create_superuser(
+            username="admin", email="admin@example.com", password="password"
+        )
+
+    def setUp(self):
+        super().setUp()
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.make_post("timed-post")
+
+    def get_timings(self, response):
+        timings = {}
+        for entry in response["Server-Timing"].split(", "):
+            match = re.fullmatch(r'cache-(\w+);dur=\d+\.\d{3};desc="(\d+) \1"', entry)
+            self.assertIsNotNone(match, entry)
+            timings[match[1]] = int(match[2])
+        return timings
+
+    def test_server_timing_format(self):
+        self.assertEqual(
+            format_server_timing({"get": [2, 1.5], "generation": [1, 0.25]}),
+            'cache-get;dur=1.500;desc="2 get", '
+            'cache-generation;dur=0.250;desc="1 generation"',
+        )
+
+    def test_server_timing_includes_generations_and_locks(self):
+        timings = self.get_timings(self.client.get("/api/v1/blog/posts/timed-post/"))
+        self.assertGreaterEqual(timings.keys(), {"get", "set", "generation", "lock"})
+
+        # Cache hits still read the generations their keys are built from
+        timings = self.get_timings(self.client.get("/api/v1/blog/posts/timed-post/"))
+        self.assertEqual(timings["get"], 1)
+        self.assertIn("generation", timings)
+        self.assertNotIn("lock", timings)
+
+    def test_metrics_endpoint_counts_hits_and_misses(self):
+        def get_stats():
+            self.client.force_authenticate(self.admin)
+            response = self.client.get("/api/v1/cache/metrics/")
+            self.client.force_authenticate(None)
+            self.assertEqual(response.status_code, 200)
+            return response.json()["prefixes"]["post"]
+
+        self.client.get("/api/v1/blog/posts/timed-post/")
+        first = get_stats()
+        self.assertEqual(first["get"]["hits"], 0)
+        self.assertGreater(first["get"]["misses"], 0)
+        self.assertGreater(first["lock"]["count"], 0)
+
+        self.client.get("/api/v1/blog/posts/timed-post/")
+        stats = get_stats()
+        self.assertEqual(
+            (stats["get"]["hits"], stats["get"]["misses"]),
+            (1, first["get"]["misses"]),
+        )
+        # Hits read the same generations as the miss, but take no lock
+        self.assertEqual(stats["generation"]["count"], 2 * first["generation"]["count"])
+        self.assertEqual(stats["lock"]["count"], first["lock"]["count"])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ConditionalGetTests(BlogFixturesMixin, TestCase):
+    """If-None-Match answers 304 whether or not the response is cached."""
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.make_post("post")
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def drop_responses(self):
+        """Evict cached responses, keeping the generation counters."""
+        for key in list(cache._cache):
+            if GENERATION_KEY_PREFIX not in key:
+                cache.delete(key.split(":", 2)[2])
+
+    def test_list_and_detail_answer_not_modified(self):
+        for url in ("/api/v1/blog/categories/", "/api/v1/blog/posts/post/"):
+            with self.subTest(url=url):
+                etag = self.client.get(url)["ETag"]
+
+                # Cached: the stored validators answer without a query
+                with self.assertNumQueries(0):
+                    response = self.revalidate(url, etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+
+                # Uncached: validators are recomputed before serializing
+                self.drop_responses()
+                self.assertEqual(self.revalidate(url, etag).status_code, 304)
+                self.assertEqual(self.revalidate(url, '"stale"').status_code, 200)
+
+    def test_writes_change_the_etag(self):
+        for url in ("/api/v1/blog/categories/", "/api/v1/blog/posts/post/"):
+            with self.subTest(url=url):
+                etag = self.client.get(url)["ETag"]
+                self.post.category.name = f"Renamed {url}"
+                self.post.category.save()
+                self.post.save()
+
+                response = self.revalidate(url, etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_hit_reads_the_entry_once(self):
+        url = "/api/v1/blog/posts/post/"
+        self.client.get(url)
+
+        with (
+            mock.patch(
+                "djangify_backend.apps.core.cache.get_entry", wraps=get_entry
+            ) as reads,
+            mock.patch("djangify_backend.apps.core.viewsets.get_entry", reads),
+        ):
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(reads.call_count, 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class KeysetPaginationTests(BlogFixturesMixin, TestCase):
+    """Cursor pages over posts ordered by -published_date, -id."""
+
+    def setUp(self):
+        super().setUp()
+        published = timezone.now()
+        # Three posts share a date and two have none, which sorts last
+        self.posts = [
+            self.make_post(
+                f"post-{index}", published_date=published if index < 3 else None
+            )
+            for index in range(5)
+        ]
+
+    def get_page(self, url="/api/v1/blog/posts/", **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def slugs(self, page):
+        return [post["slug"] for post in page["results"]]
+
+    def test_pages_forward_and_back_across_nulls_and_ties(self):
+        page = self.get_page(cursor="", page_size=2)
+        self.assertEqual(self.slugs(page), ["post-2", "post-1"])
+        self.assertIsNone(page["previous"])
+
+        page = self.get_page(page["next"])
+        self.assertEqual(self.slugs(page), ["post-0", "post-4"])
+
+        page = self.get_page(page["next"])
+        self.assertEqual(self.slugs(page), ["post-3"])
+        self.assertIsNone(page["next"])
+
+        page = self.get_page(page["previous"])
+        self.assertEqual(self.slugs(page), ["post-0", "post-4"])
+
+        page = self.get_page(page["previous"])
+        self.assertEqual(self.slugs(page), ["post-2", "post-1"])
+        self.assertIsNone(page["previous"])
+
+    def test_cursors_reject_other_orderings(self):
+        url = "/api/v1/blog/posts/"
+        for params in ({"ordering": "title"}, {"ordering": "-published_date"}):
+            with self.subTest(params=params):
+                response = self.client.get(url, {"cursor": "", **params})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("ordering", response.json()["message"])
+                # Page numbers still honour the ordering
+                self.assertEqual(self.client.get(url, params).status_code, 200)
+
+        page = self.get_page(cursor="", ordering="-published_date,-id")
+        self.assertEqual(self.slugs(page)[:2], ["post-2", "post-1"])
+
+    def test_cursors_reject_ranked_searches(self):
+        for param in ("search", "fuzzy"):
+            with self.subTest(param=param):
+                response = self.client.get(
+                    "/api/v1/blog/posts/", {"cursor": "", param: "post"}
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(param, response.json()["message"])
+
+    def test_malformed_and_tampered_cursors_are_not_found(self):
+        pagination = CustomPagination()
+        pagination.ordering = pagination.parse_ordering(["-published_date", "-id"])
+        for cursor in (
+            "not-a-cursor!",
+            pagination.encode_cursor([None]),
+            pagination.encode_cursor(["not a date", 1]),
+            pagination.encode_cursor([None, "x"]),
+            pagination.encode_cursor([None, 1])[:-2],
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.client.get("/api/v1/blog/posts/", {"cursor": cursor})
+                self.assertEqual(response.status_code, 404)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PaginationCountTests(BlogFixturesMixin, TestCase):
+    """Counts cached per filter signature and audience, and estimated counts."""
+
+    url = "/api/v1/blog/posts/"
+
+    def setUp(self):
+        super().setUp()
+        self.make_post("featured", is_featured=True)
+        self.make_post("also-featured", is_featured=True)
+        self.make_post("plain")
+        self.make_post("draft", status="draft")
+
+    def count(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        counted = any("COUNT(" in query["sql"] for query in queries)
+        return response.json()["count"], counted
+
+    def test_count_is_reused_until_a_write(self):
+        self.assertEqual(self.count(page_size=1), (3, True))
+        # A different page size is a different page but the same count
+        self.assertEqual(self.count(page_size=2), (3, False))
+
+        self.make_post("another")
+        self.assertEqual(self.count(page_size=1), (4, True))
+
+    def test_last_pages_are_counted_from_their_rows(self):
+        self.assertEqual(self.count(), (3, False))
+        self.assertEqual(self.count(page_size=2, page=2), (3, False))
+        response = self.client.get(self.url, {"page_size": 2, "page": 3})
+        self.assertEqual(response.status_code, 404)
+
+    def test_filters_and_audiences_are_counted_separately(self):
+        self.assertEqual(self.count(page_size=1), (3, True))
+        self.assertEqual(self.count(is_featured="true", page_size=1), (2, True))
+
+        self.client.force_authenticate(
+            get_user_model().objects.create_user(
+                username="staff", password="password", is_staff=True
+            )
+        )
+        self.assertEqual(self.count(page_size=1), (4, True))
+
+    def test_large_counts_use_the_planner_estimate(self):
+        pagination = CustomPagination()
+        pagination.count_estimate_threshold = 1000
+        queryset = Post.objects.all()
+        postgres = mock.MagicMock()
+        postgres.__getitem__.return_value.vendor = "postgresql"
+        estimate = "djangify_backend.apps.core.pagination.estimate_count"
+
+        with mock.patch("djangify_backend.apps.core.pagination.connections", postgres):
+            with mock.patch(estimate, return_value=25000):
+                self.assertEqual(pagination.count_queryset(queryset), (25000, True))
+            with mock.patch(estimate, return_value=10):
+                self.assertEqual(pagination.count_queryset(queryset), (4, False))
+            with mock.patch(estimate, side_effect=DatabaseError("no plan")):
+                with self.assertLogs("djangify_backend.apps.core.pagination"):
+                    self.assertEqual(pagination.count_queryset(queryset), (4, False))
+
+        # Other databases always count exactly
+        with mock.patch(estimate) as estimate_count:
+            self.assertEqual(pagination.count_queryset(queryset), (4, False))
+        estimate_count.assert_not_called()
+
+    def test_pages_past_a_low_estimate_are_served(self):
+        for slug in ("fourth", "fifth"):
+            self.make_post(slug)
+        postgres = mock.MagicMock()
+        postgres.__getitem__.return_value.vendor = "postgresql"
+
+        with (
+            mock.patch.object(CustomPagination, "count_estimate_threshold", 1),
+            mock.patch("djangify_backend.apps.core.pagination.connections", postgres),
+            mock.patch(
+                "djangify_backend.apps.core.pagination.estimate_count", return_value=2
+            ),
+        ):
+            slugs = []
+            url = f"{self.url}?page_size=2"
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                page = response.json()
+                slugs.extend(post["slug"] for post in page["results"])
+                url = page["next"]
+                if url:
+                    self.assertEqual(
+                        (page["count"], page["count_approximate"]), (2, True)
+                    )
+
+            # The last page settles the exact count
+            self.assertEqual(len(slugs), 5)
+            self.assertEqual(page["current_page"], 3)
+            self.assertEqual((page["count"], page["count_approximate"]), (5, False))
+            response = self.client.get(self.url, {"page_size": 2, "page": 4})
+            self.assertEqual(response.status_code, 404)
+
+
+class PaginationLinkTests(SimpleTestCase):
+    def test_links_parse_the_request_url_once(self):
+        request = Request(
+            APIRequestFactory(SERVER_NAME="localhost").get(
+                "/api/v1/blog/posts/", {"page": 3, "tags__slug": ["a", "b"]}
+            )
+        )
+        pagination = CustomPagination()
+        pagination.request = request
+        pagination.keyset = False
+        pagination.count_approximate = False
+        pagination.page = Paginator(range(100), 10).page(3)
+
+        with mock.patch.object(parse, "urlsplit", wraps=parse.urlsplit) as urlsplit:
+            data = pagination.get_paginated_response([]).data
+        self.assertEqual(urlsplit.call_count, 1)
+
+        base = "http://localhost/api/v1/blog/posts/?tags__slug=a&tags__slug=b"
+        self.assertEqual(data["next"], f"{base}&page=4")
+        self.assertEqual(data["previous"], f"{base}&page=2")
+        self.assertEqual(data["first"], base)
+        self.assertEqual(data["last"], f"{base}&page=10")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SearchResultCacheTests(BlogFixturesMixin, TestCase):
+    """Equivalent searches share one cached, ranked list of post ids."""
+
+    def setUp(self):
+        super().setUp()
+        search_stats.reset()
+        self.addCleanup(search_stats.reset)
+        for slug, content in (
+            ("first", "<p>Django caching</p>"),
+            ("second", "<p>Caching with Django</p>"),
+            ("third", "<p>Python packaging</p>"),
+        ):
+            self.make_post(slug, content)
+
+    def search(self, text, **params):
+        response = self.client.get("/api/v1/blog/posts/", {"search": text, **params})
+        return response.json()
+
+    def test_normalized_queries_share_results(self):
+        first = self.search("Django caching")
+        second = self.search("  CACHING   django ")
+        self.assertEqual(first["count"], 2)
+        self.assertEqual(first["results"], second["results"])
+
+        stats = {row["query"]: row for row in search_stats.top()}
+        query = normalize_search_query("django caching")
+        self.assertEqual(stats[query]["count"], 2)
+        self.assertEqual((stats[query]["hits"], stats[query]["misses"]), (1, 1))
+
+    def test_pages_are_sliced_from_cached_ids(self):
+        slugs = [
+            self.search("django", page_size=1, page=page)["results"][0]["slug"]
+            for page in (1, 2)
+        ]
+        self.assertCountEqual(slugs, ["first", "second"])
+        self.assertEqual(self.search("django", page_size=1)["total_pages"], 2)
+
+    def test_fuzzy_filter_is_not_served_from_cached_ids(self):
+        # FuzzySearchFilter runs after search and narrows its results
+        self.search("django")
+        response = self.search("django", fuzzy="first")
+        self.assertEqual(response["count"], len(response["results"]))
+        self.assertEqual([post["slug"] for post in response["results"]], ["first"])
+        self.assertEqual(response["total_pages"], 1)
+
+    def test_normalization_drops_stop_words_outside_phrases(self):
+        self.assertEqual(
+            normalize_search_query("the django"), normalize_search_query("django")
+        )
+        self.assertEqual(normalize_search_query(" The  Cache "), "cache")
+        self.assertEqual(normalize_search_query("The"), "the")
+        self.assertEqual(
+            normalize_search_query('"Cache the" Django'), '"cache the" django'
+        )
+
+    def test_stop_words_share_cached_results(self):
+        first = self.search("django")
+        second = self.search("the django")
+        self.assertEqual(first["count"], 2)
+        self.assertEqual(first["results"], second["results"])
+
+        stats = {row["query"]: row for row in search_stats.top()}
+        self.assertEqual((stats["django"]["hits"], stats["django"]["misses"]), (1, 1))
+
+    def test_post_changes_drop_cached_results(self):
+        self.assertEqual(self.search("django")["count"], 2)
+        self.make_post("fourth", "<p>Django admin</p>")
+        self.assertEqual(self.search("django")["count"], 3)
+
+    def test_top_searches_are_staff_only(self):
+        self.search("django")
+        url = "/api/v1/blog/posts/top-searches/"
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_authenticate(
+            get_user_model().objects.create_user(
+                username="staff", password="password", is_staff=True
+            )
+        )
+        self.assertEqual(self.client.get(url).json()["data"][0]["query"], "django")
+
+
+class FuzzySearchFilterTests(TestCase):
+    def test_similarity_threshold_is_clamped(self):
+        backend = FuzzySearchFilter()
+        request = mock.Mock(query_params={})
+        self.assertEqual(backend.get_threshold(request), FUZZY_SEARCH_THRESHOLD)
+        for value, expected in (
+            ("0.5", 0.5),
+            ("0", 0.1),
+            ("7", 1.0),
+            ("x", FUZZY_SEARCH_THRESHOLD),
+            ("nan", FUZZY_SEARCH_THRESHOLD),
+            ("inf", FUZZY_SEARCH_THRESHOLD),
+            ("-inf", FUZZY_SEARCH_THRESHOLD),
+        ):
+            request.query_params = {"similarity": value}
+            self.assertEqual(backend.get_threshold(request), expected)
+
+    def test_threshold_is_reset_when_the_request_finishes(self):
+        changed, untouched = mock.MagicMock(), mock.MagicMock()
+        changed.similarity_threshold_set = True
+        untouched.similarity_threshold_set = False
+        with mock.patch(
+            "djangify_backend.apps.core.filters.connections"
+        ) as connections:
+            connections.all.return_value = [changed, untouched]
+            request_finished.send(sender=None)
+
+        cursor = changed.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with("RESET pg_trgm.similarity_threshold")
+        self.assertFalse(changed.similarity_threshold_set)
+        untouched.cursor.assert_not_called()
@@ -1,4 +1,5 @@
 from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
+from djangify_backend.apps.core.cache import throttle_cache
 
 
 class BurstRateThrottle(AnonRateThrottle):
@@ -7,6 +8,7 @@ class BurstRateThrottle(AnonRateThrottle):
     """
 
     scope = "burst"
+    cache = throttle_cache
     rate = "10/minute"  # Adjust as needed
 
 
@@ -16,6 +18,7 @@ class SustainedRateThrottle(AnonRateThrottle):
     """
 
     scope = "sustained"
+    cache = throttle_cache
     rate = "100/hour"  # Adjust as needed
 
 
@@ -25,6 +28,7 @@ class UserBurstRateThrottle(UserRateThrottle):
     """
 
     scope = "user_burst"
+    cache = throttle_cache
     rate = "20/minute"  # Adjust as needed
 
 
@@ -34,6 +38,7 @@ class UserSustainedRateThrottle(UserRateThrottle):
     """
 
     scope = "user_sustained"
+    cache = throttle_cache
     rate = "200/hour"  # Adjust as needed
 
 
@@ -43,6 +48,8 @@ class APIEndpointThrottle(UserRateThrottle):
     Subclass this for different endpoints with different rates
     """
 
+    cache = throttle_cache
+
     def parse_rate(self, rate):
         """
         Override to allow dynamic rate setting
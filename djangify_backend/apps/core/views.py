@@ -1,7 +1,8 @@
 from django.shortcuts import render
 from rest_framework import viewsets, status
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from typing import Any, Dict
@@ -9,6 +10,7 @@ import logging
 from django.utils.http import urlsafe_base64_decode
 from django.contrib.auth.tokens import default_token_generator
 from .emails import EmailService
+from .cache import local_cache, metrics, throttle_cache
 
 logger = logging.getLogger(__name__)
 
@@ -106,3 +108,19 @@ def request_password_reset(request):
             {"detail": "User with this email does not exist"},
             status=status.HTTP_404_NOT_FOUND,
         )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def cache_metrics(request):
+    """Report per-worker cache statistics."""
+    return Response(
+        {
+            "prefixes": metrics.snapshot(),
+            "local": local_cache.stats() if local_cache else None,
+            "throttle_local": (
+                throttle_cache.local.stats() if throttle_cache.local else None
+            ),
+        },
+        status=status.HTTP_200_OK,
+    )
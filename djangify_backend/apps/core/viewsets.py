@@ -1,13 +1,33 @@
 from rest_framework import viewsets, mixins, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.core.cache import cache
+from rest_framework.exceptions import NotFound, ParseError, ValidationError
+from rest_framework.renderers import JSONRenderer
 from django.conf import settings
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.db.models import Max, Prefetch
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 from django.utils.translation import gettext_lazy as _
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict, FrozenSet, Iterator, Set, Tuple
+import hashlib
 import logging
+import time
+from djangify_backend.apps.core.cache import (
+    bump_generation,
+    cache_registry,
+    format_server_timing,
+    get_entry,
+    get_generations,
+    get_list_namespace,
+    get_object_namespace,
+    get_or_refresh,
+    invalidate_objects,
+    make_entry,
+    set_entry,
+    start_request_timing,
+    stop_request_timing,
+)
 from djangify_backend.apps.core.throttling import (
     WriteOperationThrottle,
     UserBurstRateThrottle,
@@ -21,28 +41,554 @@ class CacheMixin:
     """
     Mixin to add caching support to ViewSets.
     Provides configurable cache timeouts and key generation.
+
+    Keys include the generation counter of the viewset's cache namespace,
+    so invalidate_cache() drops every cached list page and object at once.
+    List and object keys also carry the generation of their narrower scope,
+    which the dependency registry bumps when an embedded model changes.
+
+    Querysets may differ by role (staff see drafts), so keys are segmented
+    by audience: anonymous, authenticated or staff. Segmenting by role
+    rather than by user keeps at most three variants per response.
     """
 
     cache_timeout: int = getattr(
         settings, "DEFAULT_CACHE_TIMEOUT", 300
     )  # 5 minutes default
     cache_key_prefix: str = ""
+    # Seconds past cache_timeout during which a stale entry may still be served
+    cache_stale_timeout: int = getattr(settings, "CACHE_STALE_TIMEOUT", 60 * 60)
+    cache_lock_timeout: int = 10  # Seconds before an abandoned refresh lock expires
+    # Seconds a failed lookup is remembered so repeated 404s skip the database
+    cache_negative_timeout: int = getattr(settings, "CACHE_NEGATIVE_TIMEOUT", 60)
+    # Cache the rendered JSON body so hits skip serialization and rendering
+    cache_rendered: bool = getattr(settings, "CACHE_RENDERED_RESPONSES", True)
+    # Serve staff straight from the database instead of the "staff" segment
+    cache_bypass_staff: bool = getattr(settings, "CACHE_BYPASS_STAFF", False)
+    # Request headers that select the audience, for downstream HTTP caches
+    cache_vary_headers: Tuple[str, ...] = ("Authorization", "Cookie")
+    # Report the request's cache operations in a Server-Timing header
+    cache_server_timing: bool = getattr(settings, "CACHE_SERVER_TIMING", True)
+
+    def initial(self, request, *args, **kwargs):
+        if self.cache_server_timing:
+            self._cache_timing_token = start_request_timing()
+        super().initial(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Attach the cache timings collected during this request."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        token = self.__dict__.pop("_cache_timing_token", None)
+        if token is not None:
+            timings = stop_request_timing(token)
+            if timings:
+                response["Server-Timing"] = format_server_timing(timings)
+        return response
+
+    def get_cache_namespace(self) -> str:
+        """Namespace whose generation counter versions this viewset's keys."""
+        return self.cache_key_prefix or self.basename
 
-    def get_cache_key(self, view_name: str, **kwargs) -> str:
-        """Generate a unique cache key for the request."""
-        key_parts = [self.cache_key_prefix, self.basename, view_name]
+    def get_cache_key(self, view_name: str, scopes=(), **kwargs) -> str:
+        """
+        Generate a unique cache key for the request.
+
+        Args:
+            view_name: Name of the cached view
+            scopes: Extra generation namespaces the cached value depends on
+            **kwargs: Values identifying the cached response
+        """
+        generations = get_generations(self.get_cache_namespace(), *scopes)
+        key_parts = [
+            self.cache_key_prefix,
+            self.basename,
+            view_name,
+            "g" + ".".join(str(generation) for generation in generations),
+        ]
         key_parts.extend(f"{k}:{v}" for k, v in sorted(kwargs.items()))
         return ":".join(filter(None, key_parts))
 
+    def get_cache_audience(self, request) -> str:
+        """
+        Audience segment the response for this request is cached under.
+
+        Returns:
+            str: "staff", "auth" or "anon"
+        """
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return "anon"
+        return "staff" if user.is_staff else "auth"
+
+    def bypasses_cache(self, request) -> bool:
+        """Whether this request skips reading and writing the response cache."""
+        return self.cache_bypass_staff and self.get_cache_audience(request) == "staff"
+
+    def get_cache_origin(self, request) -> str:
+        """
+        Scheme and host the response was built for.
+
+        Cached bodies embed absolute URLs (pagination links, ``comments_url``),
+        so responses built for one host must never be replayed on another.
+        """
+        return f"{request.scheme}://{request.get_host()}"
+
+    def get_lookup_value(self, kwargs: Optional[Dict] = None) -> Any:
+        """Value of the lookup field in the URL kwargs (a slug on most routes)."""
+        kwargs = self.kwargs if kwargs is None else kwargs
+        return kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+
+    def get_object_cache_key(self, view_name: str, identifier, **kwargs) -> str:
+        """
+        Generate a cache key for a single object's response.
+
+        Args:
+            view_name: Name of the cached view
+            identifier: Lookup field value identifying the object
+            **kwargs: Further values identifying the cached response
+        """
+        scope = get_object_namespace(self.get_cache_namespace(), identifier)
+        kwargs[self.lookup_field] = identifier
+        kwargs.setdefault("origin", self.get_cache_origin(self.request))
+        return self.get_cache_key(view_name, scopes=(scope,), **kwargs)
+
+    def get_list_cache_key(self, request) -> str:
+        """Generate a cache key for a list request from its query parameters."""
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            for value in values
+        )
+        digest = hashlib.md5(repr(params).encode()).hexdigest()
+        scope = get_list_namespace(self.get_cache_namespace())
+        # URL kwargs distinguish nested lists, e.g. comments per post slug
+        return self.get_cache_key(
+            "list",
+            scopes=(scope,),
+            query=digest,
+            origin=self.get_cache_origin(request),
+            fmt=self.get_cache_format(request),
+            aud=self.get_cache_audience(request),
+            **self.kwargs,
+        )
+
+    def invalidate_cache(self, *identifiers) -> None:
+        """
+        Invalidate all cached responses in this viewset's namespace.
+
+        Args:
+            identifiers: Lookup values whose object scopes are bumped as well,
+                e.g. both the old and new slug of a renamed object
+        """
+        namespace = self.get_cache_namespace()
+        bump_generation(namespace)
+        invalidate_objects(namespace, {i for i in identifiers if i is not None})
+
     def cache_response(
         self, key: str, data: Any, timeout: Optional[int] = None
     ) -> None:
         """Cache the response data with the specified key."""
-        cache.set(key, data, timeout or self.cache_timeout)
+        timeout = timeout or self.cache_timeout
+        set_entry(key, make_entry(data, timeout), timeout + self.cache_stale_timeout)
+
+    def cache_missing(self, key: str) -> None:
+        """
+        Remember that a lookup found nothing, for cache_negative_timeout seconds.
+
+        The key carries the object scope of the missing lookup value, so
+        creating an object with that value invalidates the entry at once.
+        """
+        timeout = self.cache_negative_timeout
+        if timeout:
+            set_entry(key, make_entry(True, timeout), timeout)
 
     def get_cached_response(self, key: str) -> Optional[Any]:
-        """Retrieve cached response data."""
-        return cache.get(key)
+        """Retrieve cached response data while it is still fresh."""
+        entry = get_entry(key)
+        if entry is not None and time.time() < entry["fresh_until"]:
+            return entry["value"]
+        return None
+
+    def can_cache_rendered(self, request) -> bool:
+        """Whether the response for this request can be cached as JSON bytes."""
+        renderer = getattr(request, "accepted_renderer", None)
+        return self.cache_rendered and isinstance(renderer, JSONRenderer)
+
+    def get_cache_format(self, request) -> str:
+        """Cache key component separating rendered bodies from plain data."""
+        return "json" if self.can_cache_rendered(request) else "data"
+
+    def render_for_cache(self, response: Response) -> Dict:
+        """
+        Render a response once and capture what is needed to replay it.
+
+        Returns:
+            Dict: Encoded body, content type and status code
+        """
+        response.accepted_renderer = self.request.accepted_renderer
+        response.accepted_media_type = self.request.accepted_media_type
+        response.renderer_context = self.get_renderer_context()
+        response.render()
+        return {
+            "content": response.content,
+            "content_type": response["Content-Type"],
+            "status": response.status_code,
+        }
+
+    def build_payload(self, response: Response) -> Dict:
+        """Capture a response for caching, as rendered bytes when possible."""
+        if self.can_cache_rendered(self.request):
+            return self.render_for_cache(response)
+        return {"data": response.data, "status": response.status_code}
+
+    def build_cached_response(self, payload: Dict) -> HttpResponse:
+        """Replay a cached payload, without re-rendering when it holds bytes."""
+        if "content" in payload:
+            response = HttpResponse(
+                payload["content"],
+                content_type=payload["content_type"],
+                status=payload["status"],
+            )
+        else:
+            response = Response(payload["data"], status=payload["status"])
+        self.set_validator_headers(response, payload)
+        patch_vary_headers(response, self.cache_vary_headers)
+        return response
+
+    # Conditional GET
+
+    conditional_field: str = "updated_at"
+
+    def make_validators(self, cache_key: str, *parts) -> Dict:
+        """
+        Build ETag and Last-Modified validators for a response.
+
+        The ETag hashes the versioned cache key, so a change to an embedded
+        model produces a new tag even when the object's own timestamp is
+        unchanged. The last element of ``parts`` is the modification time.
+        """
+        digest = hashlib.md5(
+            ":".join(str(part) for part in (cache_key, *parts)).encode()
+        ).hexdigest()
+        last_modified = parts[-1] if parts else None
+        return {
+            "etag": quote_etag(digest),
+            "last_modified": last_modified.timestamp() if last_modified else None,
+        }
+
+    def get_object_validators(self, cache_key: str) -> Optional[Dict]:
+        """
+        Compute validators for the requested object without loading it.
+
+        Runs a single ``pk, updated_at`` query with prefetches dropped.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if not self.supports_conditional(queryset.model):
+            return None
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = (
+            queryset.prefetch_related(None)
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            .values_list("pk", self.conditional_field)
+            .first()
+        )
+        return self.make_validators(cache_key, *row) if row else None
+
+    def get_list_validators(self, cache_key: str, queryset) -> Optional[Dict]:
+        """
+        Compute list validators from max(updated_at).
+
+        The query parameters and the prefix generation are already part of
+        the cache key, so deletes and inserts change the ETag without a
+        COUNT(*) here.
+        """
+        if not self.supports_conditional(queryset.model):
+            return None
+        last_modified = queryset.order_by().aggregate(
+            last_modified=Max(self.conditional_field)
+        )["last_modified"]
+        return self.make_validators(cache_key, last_modified)
+
+    def get_page_validators(self, cache_key: str, rows) -> Optional[Dict]:
+        """
+        Compute validators for an already fetched keyset page.
+
+        Keyset pages avoid COUNT(*), so the tag covers the rows on the page.
+        """
+        if not rows or not self.supports_conditional(type(rows[0])):
+            return None
+        stamps = [(row.pk, getattr(row, self.conditional_field)) for row in rows]
+        return self.make_validators(
+            cache_key, stamps, max(stamp for _, stamp in stamps)
+        )
+
+    def uses_keyset_pagination(self, request) -> bool:
+        """Whether the paginator pages this request by cursor."""
+        is_keyset_request = getattr(self.paginator, "is_keyset_request", None)
+        return bool(is_keyset_request and is_keyset_request(request, self))
+
+    def supports_conditional(self, model) -> bool:
+        fields = {field.name for field in model._meta.get_fields()}
+        return self.conditional_field in fields
+
+    def honours_if_modified_since(self) -> bool:
+        """
+        Whether Last-Modified alone proves a cached object is unchanged.
+
+        Payloads embedding related models (see cache_registry) can change
+        without the object's own timestamp moving, so those rely on ETags.
+        """
+        return not cache_registry.dependencies.get(self.get_cache_namespace())
+
+    def get_not_modified_response(
+        self, request, validators: Optional[Dict], use_last_modified: bool = False
+    ) -> Optional[HttpResponse]:
+        """Return a 304 response if the request's validators still match."""
+        if not validators or request.method not in ("GET", "HEAD"):
+            return None
+        last_modified = validators.get("last_modified") if use_last_modified else None
+        response = get_conditional_response(
+            request._request,
+            etag=validators.get("etag"),
+            last_modified=int(last_modified) if last_modified else None,
+        )
+        if response is not None:
+            self.set_validator_headers(response, validators)
+            patch_vary_headers(response, self.cache_vary_headers)
+        return response
+
+    def set_validator_headers(self, response, validators: Dict) -> None:
+        if validators.get("etag"):
+            response["ETag"] = validators["etag"]
+        if validators.get("last_modified"):
+            response["Last-Modified"] = http_date(validators["last_modified"])
+
+    def get_or_refresh_response(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        timeout: Optional[int] = None,
+        entry: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Get cached response data, serving stale data while one request refreshes it.
+
+        Pass ``entry`` when the key was already read, to skip a second read.
+
+        Returns:
+            Tuple[Any, bool]: The response data and whether it came from the cache
+        """
+        return get_or_refresh(
+            key,
+            compute,
+            timeout or self.cache_timeout,
+            self.cache_stale_timeout,
+            lock_timeout=self.cache_lock_timeout,
+            entry=entry,
+        )
+
+
+def _select_related_paths(tree: Dict, prefix: str = "") -> Iterator[str]:
+    """Flatten a query's select_related tree into ``a__b`` lookups."""
+    for name, subtree in tree.items():
+        yield prefix + name
+        yield from _select_related_paths(subtree, f"{prefix}{name}__")
+
+
+class SparseFieldsMixin:
+    """
+    Mixin to trim read responses to the fields a client asks for.
+
+    ``?fields=title,slug`` keeps only the listed serializer fields and
+    ``?omit=content`` drops the listed ones. The selection is pushed down
+    to the queryset: unused columns are deferred, and select_related and
+    prefetch lookups for relations nobody asked for are dropped.
+
+    Serializer fields that do not read a model attribute of their own name
+    (method fields, ``source="*"``) declare the attributes they read in
+    ``Meta.field_sources``. An undeclared one keeps the queryset as is;
+    the response is still trimmed.
+
+    ``?expand=images`` asks for relations listed in ``expandable_fields``
+    to be nested rather than collapsed to ids or slugs. The names reach
+    the serializer as ``context["expand"]`` (see ExpandableFieldsMixin).
+    """
+
+    fields_query_param: str = "fields"
+    omit_query_param: str = "omit"
+    expand_query_param: str = "expand"
+    expandable_fields: Tuple[str, ...] = ()
+
+    def parse_list_param(self, param: str) -> FrozenSet[str]:
+        """Comma-separated names from a read request's query parameter."""
+        request = getattr(self, "request", None)
+        if request is None or request.method not in ("GET", "HEAD"):
+            return frozenset()
+        return frozenset(
+            name.strip()
+            for value in request.query_params.getlist(param)
+            for name in value.split(",")
+            if name.strip()
+        )
+
+    def get_sparse_fieldset(self) -> Tuple[Optional[FrozenSet[str]], FrozenSet[str]]:
+        """
+        Parse the fields and omit query parameters of a read request.
+
+        Returns:
+            Tuple: Field names to keep (None keeps all) and field names to drop
+        """
+        fields = self.parse_list_param(self.fields_query_param)
+        return fields or None, self.parse_list_param(self.omit_query_param)
+
+    def get_expanded_fields(self) -> FrozenSet[str]:
+        """Requested relations that this view allows to be expanded."""
+        return self.parse_list_param(self.expand_query_param) & frozenset(
+            self.expandable_fields
+        )
+
+    def get_sparse_cache_kwargs(self) -> Dict:
+        """Cache key values for the requested shape, empty for the default one."""
+        fields, omit = self.get_sparse_fieldset()
+        expand = self.get_expanded_fields()
+        if fields is None and not omit and not expand:
+            return {}
+        selection = (
+            sorted(fields) if fields is not None else None,
+            sorted(omit),
+            sorted(expand),
+        )
+        return {"fields": hashlib.md5(repr(selection).encode()).hexdigest()}
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["expand"] = self.get_expanded_fields()
+        return context
+
+    def trim_fields(self, serializer):
+        """
+        Drop the serializer fields excluded by the request, in place.
+
+        Raises:
+            ValidationError: If fields or omit name a field the serializer
+            does not have
+        """
+        fields, omit = self.get_sparse_fieldset()
+        if fields is None and not omit:
+            return serializer
+        target = getattr(serializer, "child", serializer)
+        available = set(target.fields)
+        errors = {}
+        for param, names in (
+            (self.fields_query_param, fields or frozenset()),
+            (self.omit_query_param, omit),
+        ):
+            invalid = sorted(names - available)
+            if invalid:
+                errors[param] = [
+                    _("Unknown field: %(name)s") % {"name": name} for name in invalid
+                ]
+        if errors:
+            raise ValidationError(errors)
+        for name in list(target.fields):
+            if name in omit or (fields is not None and name not in fields):
+                target.fields.pop(name)
+        return serializer
+
+    def get_serializer(self, *args, **kwargs):
+        return self.trim_fields(super().get_serializer(*args, **kwargs))
+
+    def get_required_attributes(self, serializer) -> Optional[Set[str]]:
+        """
+        Model attributes read by the serializer's remaining fields.
+
+        Returns:
+            Optional[Set[str]]: Attribute names, or None when a field's
+            dependencies are unknown
+        """
+        meta = getattr(serializer, "Meta", None)
+        declared = getattr(meta, "field_sources", {})
+        attributes = set()
+        for name, field in serializer.fields.items():
+            if name in declared:
+                attributes.update(declared[name])
+            elif field.source == "*":
+                return None
+            else:
+                attributes.add(field.source.split(".")[0])
+        return attributes
+
+    def restrict_queryset(self, queryset, attributes: Set[str]):
+        """
+        Load only the columns and relations in ``attributes``.
+
+        Columns the view itself reads (primary key, lookup, validator and
+        ordering fields) are always kept.
+        """
+        model = queryset.model
+        attributes = attributes | {
+            model._meta.pk.name,
+            self.lookup_field,
+            getattr(self, "conditional_field", None),
+        }
+        for ordering in (
+            getattr(self, "cursor_ordering", None),
+            getattr(self, "ordering", None),
+        ):
+            if isinstance(ordering, str):
+                ordering = [ordering]
+            attributes.update(name.lstrip("-") for name in ordering or ())
+
+        select_related = queryset.query.select_related
+        if isinstance(select_related, dict):
+            queryset = queryset.select_related(None).select_related(
+                *(
+                    path
+                    for path in _select_related_paths(select_related)
+                    if path.split("__")[0] in attributes
+                )
+            )
+        elif select_related:
+            # select_related() without fields follows every foreign key
+            attributes.update(
+                field.name for field in model._meta.concrete_fields if field.is_relation
+            )
+
+        prefetches = [
+            lookup
+            for lookup in queryset._prefetch_related_lookups
+            if (lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup).split(
+                "__"
+            )[0]
+            in attributes
+        ]
+        columns = [
+            field.name
+            for field in model._meta.concrete_fields
+            if field.name in attributes or field.attname in attributes
+        ]
+        queryset = (
+            queryset.prefetch_related(None).prefetch_related(*prefetches).only(*columns)
+        )
+        # Unselected annotations stay usable in filters and ordering
+        queryset.query.set_annotation_mask(
+            name for name in queryset.query.annotations if name in attributes
+        )
+        return queryset
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields, omit = self.get_sparse_fieldset()
+        if fields is None and not omit:
+            return queryset
+
+        serializer = self.trim_fields(
+            self.get_serializer_class()(context=self.get_serializer_context())
+        )
+        attributes = self.get_required_attributes(serializer)
+        if attributes is None:
+            return queryset
+        return self.restrict_queryset(queryset, attributes)
 
 
 class ResponseMixin:
@@ -102,7 +648,7 @@ class ResponseMixin:
         )
 
 
-class BaseViewSet(CacheMixin, ResponseMixin, viewsets.ModelViewSet):
+class BaseViewSet(SparseFieldsMixin, CacheMixin, ResponseMixin, viewsets.ModelViewSet):
     """
     Base ViewSet combining caching and response formatting with standard CRUD operations.
     Implements common functionality for all ViewSets in the application.
@@ -114,20 +660,64 @@ class BaseViewSet(CacheMixin, ResponseMixin, viewsets.ModelViewSet):
         UserSustainedRateThrottle,
     ]
 
-    @method_decorator(cache_page(300))  # Cache list view for 5 minutes
     def list(self, request, *args, **kwargs):
-        """List objects with caching and standard response format."""
+        """
+        List objects with caching and standard response format.
+
+        Answers 304 Not Modified before serializing when If-None-Match matches.
+        """
+        bypass = self.bypasses_cache(request)
+        cache_key = self.get_list_cache_key(request)
+        cached = None if bypass else self.get_cached_response(cache_key)
+
+        if cached is not None:
+            not_modified = self.get_not_modified_response(request, cached)
+            if not_modified is not None:
+                return not_modified
+            return self.build_cached_response(cached)
+
         try:
             queryset = self.filter_queryset(self.get_queryset())
-            page = self.paginate_queryset(queryset)
+            page = None
+            if self.uses_keyset_pagination(request):
+                page = self.paginate_queryset(queryset)
+                validators = self.get_page_validators(cache_key, page)
+            else:
+                validators = self.get_list_validators(cache_key, queryset)
+            not_modified = self.get_not_modified_response(request, validators)
+            if not_modified is not None:
+                return not_modified
+
+            if page is None:
+                page = self.paginate_queryset(queryset)
 
             if page is not None:
                 serializer = self.get_serializer(page, many=True)
-                return self.get_paginated_response(serializer.data)
-
-            serializer = self.get_serializer(queryset, many=True)
-            return self.success_response(
-                data=serializer.data, message=_("Objects retrieved successfully")
+                response = self.get_paginated_response(serializer.data)
+            else:
+                serializer = self.get_serializer(queryset, many=True)
+                response = self.success_response(
+                    data=serializer.data, message=_("Objects retrieved successfully")
+                )
+
+            payload = self.build_payload(response)
+            payload.update(validators or {})
+            if not bypass:
+                self.cache_response(cache_key, payload)
+            return self.build_cached_response(payload)
+        except NotFound as e:
+            # Page number or cursor out of range
+            return self.error_response(
+                message=str(e.detail), status_code=status.HTTP_404_NOT_FOUND
+            )
+        except ParseError as e:
+            # Query parameters that cannot be combined
+            return self.error_response(
+                message=str(e.detail), status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except ValidationError as e:
+            return self.error_response(
+                message=_("Invalid query parameters"), data=e.detail
             )
         except Exception as e:
             logger.error(f"Error in list view: {str(e)}")
@@ -137,22 +727,80 @@ class BaseViewSet(CacheMixin, ResponseMixin, viewsets.ModelViewSet):
             )
 
     def retrieve(self, request, *args, **kwargs):
-        """Retrieve a single object with caching."""
-        cache_key = self.get_cache_key("retrieve", pk=kwargs.get("pk"))
-        cached_data = self.get_cached_response(cache_key)
+        """
+        Retrieve a single object with caching.
+
+        Stale entries are served while a single request refreshes them.
+        JSON responses are cached as rendered bytes and replayed as-is,
+        separately for each audience (see get_cache_audience).
+        Matching If-None-Match/If-Modified-Since headers get a 304 before
+        any serialization; on a cache miss the validators come from a
+        single ``pk, updated_at`` query. Lookups that found nothing are
+        remembered briefly, so repeated requests for dead URLs return 404
+        without querying.
+        """
+        bypass = self.bypasses_cache(request)
+        lookup_value = self.get_lookup_value(kwargs)
+        audience = self.get_cache_audience(request)
+        cache_key = self.get_object_cache_key(
+            "retrieve",
+            lookup_value,
+            fmt=self.get_cache_format(request),
+            aud=audience,
+            **self.get_sparse_cache_kwargs(),
+        )
+        missing_key = self.get_object_cache_key("missing", lookup_value, aud=audience)
+        use_last_modified = self.honours_if_modified_since()
 
-        if cached_data:
-            return self.success_response(
-                data=cached_data, message=_("Object retrieved from cache")
+        def compute():
+            instance = self.get_object()
+            response = self.success_response(
+                data=self.get_serializer(instance).data,
+                message=_("Object retrieved successfully"),
+            )
+            payload = self.build_payload(response)
+            if self.supports_conditional(type(instance)):
+                payload.update(
+                    self.make_validators(
+                        cache_key,
+                        instance.pk,
+                        getattr(instance, self.conditional_field),
+                    )
+                )
+            return payload
+
+        cached = None if bypass else get_entry(cache_key)
+        if cached is None and not bypass and self.get_cached_response(missing_key):
+            return self.error_response(
+                message=_("Failed to retrieve object"),
+                status_code=status.HTTP_404_NOT_FOUND,
             )
 
         try:
-            instance = self.get_object()
-            serializer = self.get_serializer(instance)
-            self.cache_response(cache_key, serializer.data)
-
-            return self.success_response(
-                data=serializer.data, message=_("Object retrieved successfully")
+            if cached is None:
+                not_modified = self.get_not_modified_response(
+                    request, self.get_object_validators(cache_key), use_last_modified
+                )
+                if not_modified is not None:
+                    return not_modified
+
+            if bypass:
+                payload = compute()
+            else:
+                payload = self.get_or_refresh_response(
+                    cache_key, compute, entry=cached
+                )[0]
+        except ValidationError as e:
+            return self.error_response(
+                message=_("Invalid query parameters"), data=e.detail
+            )
+        except Http404 as e:
+            if not bypass:
+                self.cache_missing(missing_key)
+            logger.info(f"Object not found in retrieve view: {str(e)}")
+            return self.error_response(
+                message=_("Failed to retrieve object"),
+                status_code=status.HTTP_404_NOT_FOUND,
             )
         except Exception as e:
             logger.error(f"Error in retrieve view: {str(e)}")
@@ -161,12 +809,20 @@ class BaseViewSet(CacheMixin, ResponseMixin, viewsets.ModelViewSet):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
+        not_modified = self.get_not_modified_response(
+            request, payload, use_last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+        return self.build_cached_response(payload)
+
     def create(self, request, *args, **kwargs):
         """Create a new object."""
         try:
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             self.perform_create(serializer)
+            self.invalidate_cache()
 
             return self.success_response(
                 data=serializer.data,
@@ -187,11 +843,13 @@ class BaseViewSet(CacheMixin, ResponseMixin, viewsets.ModelViewSet):
                 instance, data=request.data, partial=kwargs.get("partial", False)
             )
             serializer.is_valid(raise_exception=True)
+            previous_lookup = getattr(instance, self.lookup_field)
             self.perform_update(serializer)
 
-            # Invalidate cache
-            cache_key = self.get_cache_key("retrieve", pk=instance.pk)
-            cache.delete(cache_key)
+            # Invalidate cache, under the old lookup value too if it changed
+            self.invalidate_cache(
+                previous_lookup, getattr(serializer.instance, self.lookup_field)
+            )
 
             return self.success_response(
                 data=serializer.data, message=_("Object updated successfully")
@@ -206,11 +864,11 @@ class BaseViewSet(CacheMixin, ResponseMixin, viewsets.ModelViewSet):
         """Delete an object."""
         try:
             instance = self.get_object()
-            # Invalidate cache before deletion
-            cache_key = self.get_cache_key("retrieve", pk=instance.pk)
-            cache.delete(cache_key)
-
+            lookup_value = getattr(instance, self.lookup_field)
             self.perform_destroy(instance)
+            # Invalidate cache
+            self.invalidate_cache(lookup_value)
+
             return self.success_response(
                 message=_("Object deleted successfully"),
                 status_code=status.HTTP_204_NO_CONTENT,
@@ -228,6 +886,7 @@ class BaseViewSet(CacheMixin, ResponseMixin, viewsets.ModelViewSet):
             serializer = self.get_serializer(data=request.data, many=True)
             serializer.is_valid(raise_exception=True)
             self.perform_bulk_create(serializer)
+            self.invalidate_cache()
 
             return self.success_response(
                 data=serializer.data,
@@ -4,4 +4,8 @@ class PortfolioConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'djangify_backend.apps.portfolio'
     verbose_name = 'Portfolio'
+
+    def ready(self):
+        # Connect cache invalidation signals
+        from djangify_backend.apps.portfolio import signals  # noqa: F401
     
\ No newline at end of file
@@ -0,0 +1,49 @@
+# Generated by Django 5.1.15 on 2026-10-17 23:41
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+TITLE_TRGM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["title"], name="portfolio_title_trgm", opclasses=["gin_trgm_ops"]
+)
+
+
+def create_title_trgm_index(apps, schema_editor):
+    # pg_trgm and GIN indexes exist on PostgreSQL only; other databases fall
+    # back to substring matching for fuzzy search
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.add_index(
+        apps.get_model("portfolio", "Portfolio"), TITLE_TRGM_INDEX.clone()
+    )
+
+
+def drop_title_trgm_index(apps, schema_editor):
+    # The extension is left installed: other apps' indexes may use it
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.remove_index(
+        apps.get_model("portfolio", "Portfolio"), TITLE_TRGM_INDEX.clone()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "portfolio",
+            "0012_alter_portfolio_options_alter_portfolioimage_options_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="portfolio", index=TITLE_TRGM_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_title_trgm_index, drop_title_trgm_index),
+            ],
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
@@ -191,6 +192,14 @@ class Portfolio(TimeStampedModel, SEOModel):
         ordering = ["order", "-created_at"]
         verbose_name = "Portfolio"
         verbose_name_plural = "Portfolios"
+        # Trigram index for fuzzy title search, created on PostgreSQL only
+        indexes = [
+            GinIndex(
+                fields=["title"],
+                opclasses=["gin_trgm_ops"],
+                name="portfolio_title_trgm",
+            )
+        ]
 
     def __str__(self):
         return self.title
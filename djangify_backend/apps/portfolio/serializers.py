@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from djangify_backend.apps.portfolio.models import Technology, Portfolio, PortfolioImage
 from djangify_backend.apps.core.serializers import (
+    ExpandableFieldsMixin,
     TimeStampedModelSerializer,
     SEOModelSerializer,
 )
@@ -23,13 +24,18 @@ class PortfolioImageSerializer(TimeStampedModelSerializer):
         ] + TimeStampedModelSerializer.Meta.fields
 
 
-class PortfolioSerializer(TimeStampedModelSerializer, SEOModelSerializer):
+class PortfolioSerializer(
+    ExpandableFieldsMixin, TimeStampedModelSerializer, SEOModelSerializer
+):
     """
-    Portfolio serializer that maintains project-based API structure
+    Portfolio serializer that maintains project-based API structure.
+    Technologies are listed by slug and images by id unless expanded.
     """
 
-    technologies = TechnologySerializer(many=True, read_only=True)
-    images = PortfolioImageSerializer(many=True, read_only=True)
+    technologies = serializers.SlugRelatedField(
+        slug_field="slug", many=True, read_only=True
+    )
+    images = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
 
     class Meta:
         model = Portfolio
@@ -51,3 +57,14 @@ class PortfolioSerializer(TimeStampedModelSerializer, SEOModelSerializer):
             + TimeStampedModelSerializer.Meta.fields
             + SEOModelSerializer.Meta.fields
         )
+        expandable_fields = {
+            "technologies": (TechnologySerializer, {"many": True, "read_only": True}),
+            "images": (PortfolioImageSerializer, {"many": True, "read_only": True}),
+        }
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        # Annotated by FuzzySearchFilter on PostgreSQL
+        if hasattr(instance, "similarity"):
+            representation["similarity"] = round(instance.similarity, 4)
+        return representation
@@ -0,0 +1,13 @@
+from djangify_backend.apps.core.cache import cache_registry
+from djangify_backend.apps.portfolio.models import Portfolio, Technology, PortfolioImage
+
+# Cached payloads and the related models embedded in them. Keep in step with
+# the nested serializers in serializers.py.
+cache_registry.register(
+    "project",
+    Portfolio,
+    lookup_field="slug",
+    depends_on={Technology: "technologies", PortfolioImage: "images"},
+)
+cache_registry.register("technology", Technology, lookup_field="slug")
+cache_registry.register("portfolio_image", PortfolioImage)
@@ -1,7 +1,9 @@
+from django.db.models import Prefetch
 from rest_framework import filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from djangify_backend.apps.core.filters import FuzzySearchFilter
 from djangify_backend.apps.core.viewsets import BaseViewSet
 from djangify_backend.apps.core.utils import FileHandler
 from djangify_backend.apps.core.mixins import FileHandlingMixin
@@ -46,15 +48,37 @@ class ProjectViewSet(FileHandlingMixin, BaseViewSet):
         DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
+        FuzzySearchFilter,
     ]
     filterset_fields = ["technologies__slug", "is_featured"]
     search_fields = ["title", "description", "short_description"]
+    fuzzy_search_field = "title"
     ordering_fields = ["order", "created_at", "title"]
     ordering = ["order", "-created_at"]
+    cursor_ordering = ["order", "-created_at", "id"]
     cache_key_prefix = "project"  # Keep for API consistency
+    expandable_fields = ("technologies", "images")
 
     def get_queryset(self):
-        return super().get_queryset().prefetch_related("technologies", "images")
+        """
+        Prefetch full related rows only for expanded relations; collapsed
+        ones need just the slug or id.
+        """
+        expand = self.get_expanded_fields()
+        technologies = Technology.objects.all()
+        if "technologies" not in expand:
+            technologies = technologies.only("id", "slug")
+        images = PortfolioImage.objects.all()
+        if "images" not in expand:
+            images = images.only("id", "portfolio_id")
+        return (
+            super()
+            .get_queryset()
+            .prefetch_related(
+                Prefetch("technologies", queryset=technologies),
+                Prefetch("images", queryset=images),
+            )
+        )
 
     @action(detail=True, methods=["post"])
     def toggle_featured(self, request, slug=None):
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'djangify_backend.apps.search'
+    verbose_name = 'Search'
+
+    def ready(self):
+        # Keep the in-memory index in step with posts and projects
+        from djangify_backend.apps.search import signals  # noqa: F401
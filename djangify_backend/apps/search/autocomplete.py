@@ -0,0 +1,170 @@
+"""
+Prefix autocomplete over tag, category and technology names.
+
+Each source is held as a sorted array of lowercase name keys, one per word
+start, so "rest" finds "Django REST Framework". A prefix query is two
+bisections and a slice, with no database access.
+
+Sources are rebuilt lazily: the existing cache signals bump the generation
+of a model's namespace on every write, and a source whose generations moved
+since it was built reloads on its next query. Generations are read through
+the local cache tier, so a warm query needs no network round trip either.
+"""
+
+import heapq
+import threading
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from django.conf import settings
+from django.db.models import Count
+from djangify_backend.apps.blog.models import Category, Tag
+from djangify_backend.apps.core.cache import get_generations
+from djangify_backend.apps.portfolio.models import Technology
+from djangify_backend.apps.search.index import TOKEN_RE
+
+# Sorts after every character, bounding the keys that start with a prefix
+MAX_CHAR = chr(0x10FFFF)
+
+
+class Suggestion(NamedTuple):
+    name: str
+    slug: str
+    count: int
+
+
+class PrefixIndex:
+    """Immutable sorted-array index of suggestion names."""
+
+    def __init__(self, suggestions: Sequence[Suggestion]):
+        self.suggestions = list(suggestions)
+        entries = sorted(
+            (key, position)
+            for position, suggestion in enumerate(self.suggestions)
+            for key in self.word_keys(suggestion.name)
+        )
+        self.keys = [key for key, _ in entries]
+        self.positions = [position for _, position in entries]
+
+    @staticmethod
+    def word_keys(name: str) -> set:
+        """The lowercase name from the start of each of its words."""
+        name = name.lower()
+        return {name[match.start() :] for match in TOKEN_RE.finditer(name)} | {name}
+
+    def complete(self, prefix: str, limit: int) -> List[Suggestion]:
+        """Most used suggestions with a word starting with ``prefix``."""
+        prefix = prefix.lower()
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + MAX_CHAR, start)
+        matches = {self.suggestions[i] for i in self.positions[start:end]}
+        return heapq.nsmallest(
+            limit, matches, key=lambda suggestion: (-suggestion.count, suggestion.name)
+        )
+
+
+class AutocompleteSource:
+    """A model's names and usage counts, versioned by cache generations."""
+
+    type: str = ""
+    # Cache namespaces whose writes change the names or the counts
+    namespaces: Tuple[str, ...] = ()
+
+    def load(self) -> List[Suggestion]:
+        raise NotImplementedError
+
+
+class TaxonomySource(AutocompleteSource):
+    """Blog taxonomy counted like the taxonomy endpoints count it."""
+
+    model = None
+
+    def load(self):
+        published_only = getattr(settings, "BLOG_POST_COUNT_PUBLISHED_ONLY", False)
+        return [
+            Suggestion(*row)
+            for row in self.model.objects.with_post_count(published_only).values_list(
+                "name", "slug", "post_count"
+            )
+        ]
+
+
+class TagSource(TaxonomySource):
+    type = "tag"
+    namespaces = ("tag", "post")
+    model = Tag
+
+
+class CategorySource(TaxonomySource):
+    type = "category"
+    namespaces = ("category", "post")
+    model = Category
+
+
+class TechnologySource(AutocompleteSource):
+    type = "technology"
+    namespaces = ("technology", "project")
+
+    def load(self):
+        return [
+            Suggestion(*row)
+            for row in Technology.objects.annotate(
+                project_count=Count("portfolios", distinct=True)
+            ).values_list("name", "slug", "project_count")
+        ]
+
+
+AUTOCOMPLETE_SOURCES: Dict[str, AutocompleteSource] = {
+    source.type: source
+    for source in (TagSource(), CategorySource(), TechnologySource())
+}
+
+
+class Autocomplete:
+    """Per-worker prefix indexes, rebuilt when their generations change."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        # type -> (generations the index was built at, index)
+        self.indexes: Dict[str, Tuple[List[int], PrefixIndex]] = {}
+
+    def get_index(self, source: AutocompleteSource) -> PrefixIndex:
+        generations = get_generations(*source.namespaces)
+        built = self.indexes.get(source.type)
+        if built is not None and built[0] == generations:
+            return built[1]
+
+        with self.lock:
+            built = self.indexes.get(source.type)
+            if built is None or built[0] != generations:
+                # Readers keep using the previous index until the swap
+                built = (generations, PrefixIndex(source.load()))
+                self.indexes[source.type] = built
+        return built[1]
+
+    def complete(
+        self, prefix: str, types: Optional[Sequence[str]] = None, limit: int = 10
+    ) -> List[Dict]:
+        """
+        Suggestions whose name has a word starting with ``prefix``.
+
+        Returns:
+            List: Up to ``limit`` suggestions across the requested types,
+            most used first
+        """
+        suggestions = []
+        for source_type in types or AUTOCOMPLETE_SOURCES:
+            index = self.get_index(AUTOCOMPLETE_SOURCES[source_type])
+            suggestions.extend(
+                (suggestion, source_type)
+                for suggestion in index.complete(prefix, limit)
+            )
+        top = heapq.nsmallest(
+            limit, suggestions, key=lambda item: (-item[0].count, item[0].name)
+        )
+        return [{"type": source_type, **item._asdict()} for item, source_type in top]
+
+
+autocomplete = Autocomplete()
@@ -0,0 +1,85 @@
+from typing import Dict, Iterable, Tuple
+from djangify_backend.apps.blog.models import Post
+from djangify_backend.apps.portfolio.models import Portfolio
+
+
+class SearchSource:
+    """
+    Describes how one model is indexed.
+
+    Subclasses name the result ``type``, the queryset of searchable rows
+    and the weighted text of each row. Weights multiply term frequencies,
+    so a title match counts for more than one in the body.
+    """
+
+    type: str = ""
+    model = None
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get_fields(self, obj) -> Iterable[Tuple[str, int]]:
+        raise NotImplementedError
+
+    def get_meta(self, obj) -> Dict:
+        """Stored fields returned with each result, so results need no query."""
+        return {
+            "type": self.type,
+            "id": obj.pk,
+            "title": obj.title,
+            "slug": obj.slug,
+        }
+
+
+class PostSource(SearchSource):
+    type = "post"
+    model = Post
+
+    def get_queryset(self):
+        # Drafts are never searchable
+        return (
+            Post.objects.select_related(None)
+            .prefetch_related(None)
+            .filter(status="published")
+            .only("id", "title", "slug", "excerpt", "content", "published_date")
+        )
+
+    def get_fields(self, obj):
+        return [(obj.title, 3), (obj.excerpt, 2), (obj.content, 1)]
+
+    def get_meta(self, obj):
+        meta = super().get_meta(obj)
+        meta["summary"] = obj.excerpt
+        meta["published_date"] = (
+            obj.published_date.isoformat() if obj.published_date else None
+        )
+        return meta
+
+
+class ProjectSource(SearchSource):
+    type = "project"
+    model = Portfolio
+
+    def get_queryset(self):
+        return Portfolio.objects.prefetch_related("technologies").only(
+            "id", "title", "slug", "short_description", "description"
+        )
+
+    def get_fields(self, obj):
+        technologies = " ".join(tech.name for tech in obj.technologies.all())
+        return [
+            (obj.title, 3),
+            (obj.short_description, 2),
+            (technologies, 2),
+            (obj.description, 1),
+        ]
+
+    def get_meta(self, obj):
+        meta = super().get_meta(obj)
+        meta["summary"] = obj.short_description
+        return meta
+
+
+SOURCES: Dict[str, SearchSource] = {
+    source.type: source for source in (PostSource(), ProjectSource())
+}
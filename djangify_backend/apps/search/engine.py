@@ -0,0 +1,355 @@
+"""
+Per-worker search engine around an InvertedIndex.
+
+Each worker holds its own copy of the index, versioned by the ``search``
+generation counter. A write logs the primary keys it changed in the shared
+cache under the next generation, then bumps the counter. Other workers
+notice the new generation on their next query and re-index just those rows,
+so a write costs work in proportion to the rows it touched, and every worker
+sharing the cache sees it whether or not they share a disk.
+
+Snapshots only speed up start-up. The index is pickled to SEARCH_INDEX
+``PATH`` by a background thread SNAPSHOT_DELAY seconds after a write, along
+with the generation it reflects; a starting worker loads it and replays the
+deltas logged since. When the log cannot bridge the gap (deltas expired,
+the counter was evicted, or a full rebuild was published) the worker
+rebuilds from the database instead.
+
+The snapshot is a local file, so it assumes the workers run on a single
+host. Workers on other hosts still follow the delta log, but build their
+index from the database on start-up.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from djangify_backend.apps.core.cache import (
+    acquire_lock,
+    bump_generation,
+    get_generation,
+    release_lock,
+)
+from djangify_backend.apps.search.documents import SOURCES
+from djangify_backend.apps.search.index import InvertedIndex, tokenize
+
+logger = logging.getLogger(__name__)
+
+GENERATION_NAMESPACE = "search"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_LOCK_KEY = "search:snapshot"
+DELTA_LOCK_KEY = "search:delta"
+# Generation of the newest snapshot on disk, so older copies are not written
+SNAPSHOT_GENERATION_KEY = "search:snapshot:generation"
+
+
+def get_search_settings() -> Dict:
+    """SEARCH_INDEX merged over the defaults, read per call for override_settings."""
+    return {
+        "PATH": None,
+        "DEFAULT_LIMIT": 20,
+        "MAX_LIMIT": 50,
+        "LOCK_TIMEOUT": 10,
+        "SNAPSHOT_DELAY": 30,
+        "MAX_DELTAS": 1000,
+        "DELTA_TIMEOUT": 60 * 60 * 24,
+        **getattr(settings, "SEARCH_INDEX", {}),
+    }
+
+
+def get_delta_key(generation: int) -> str:
+    """Cache key of the rows changed by the write that reached ``generation``."""
+    return f"search:delta:{generation}"
+
+
+@contextmanager
+def shared_lock(key: str):
+    """
+    Hold a lock shared by all workers.
+
+    Waits up to LOCK_TIMEOUT seconds for the current holder; by then the lock
+    has expired, so a lock abandoned by a crashed worker is taken over rather
+    than blocking writes.
+    """
+    timeout = get_search_settings()["LOCK_TIMEOUT"]
+    deadline = time.monotonic() + timeout
+    locked = acquire_lock(key, timeout)
+    while not locked and time.monotonic() < deadline:
+        time.sleep(0.05)
+        locked = acquire_lock(key, timeout)
+    if not locked:
+        logger.warning(f"Proceeding without the {key} lock")
+    try:
+        yield
+    finally:
+        if locked:
+            release_lock(key)
+
+
+class SearchEngine:
+    """Thread-safe owner of the worker's index, its snapshot and generation."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.snapshot_timer: Optional[threading.Timer] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the loaded index; the next query loads or builds it again."""
+        with self.lock:
+            self.cancel_snapshot()
+            self.index = InvertedIndex()
+            self.ready = False
+            self.generation = None
+
+    # =====================================
+    # Loading
+    # =====================================
+
+    def ensure_fresh(self) -> None:
+        """Load the index on first use and apply other workers' writes."""
+        generation = get_generation(GENERATION_NAMESPACE)
+        if self.ready and generation == self.generation:
+            return
+
+        with self.lock:
+            if self.ready and self.apply_deltas(generation):
+                return
+            self.resync(generation)
+
+    def resync(self, generation: int) -> None:
+        """Load the snapshot and replay the log after it, or rebuild from the database."""
+        if self.load_snapshot() and self.apply_deltas(generation):
+            self.ready = True
+            return
+        self.index = self.build_index()
+        self.generation = generation
+        self.ready = True
+        self.schedule_snapshot()
+
+    def apply_deltas(self, generation: int) -> bool:
+        """
+        Re-index the rows changed since this worker's generation.
+
+        Returns:
+            bool: Whether the index now reflects ``generation``; False when
+            the delta log cannot bridge the gap
+        """
+        if self.generation is None or generation < self.generation:
+            return False
+        pending = range(self.generation + 1, generation + 1)
+        if len(pending) > get_search_settings()["MAX_DELTAS"]:
+            return False
+
+        deltas = cache.get_many([get_delta_key(number) for number in pending])
+        if len(deltas) < len(pending):
+            return False
+        changed = defaultdict(set)
+        for delta in deltas.values():
+            for source_type, pks in delta.items():
+                changed[source_type].update(pks)
+        for source_type, pks in changed.items():
+            self.reindex(source_type, pks)
+        self.generation = generation
+        return True
+
+    def build_index(self) -> InvertedIndex:
+        """Index every searchable row in the database."""
+        index = InvertedIndex()
+        for source in SOURCES.values():
+            for obj in source.get_queryset():
+                index.add(
+                    (source.type, obj.pk), source.get_fields(obj), source.get_meta(obj)
+                )
+        return index
+
+    def reindex(self, source_type: str, pks: Iterable) -> None:
+        """Re-read rows of one source, removing rows gone or no longer searchable."""
+        source = SOURCES[source_type]
+        objects = {obj.pk: obj for obj in source.get_queryset().filter(pk__in=pks)}
+        for pk in pks:
+            obj = objects.get(pk)
+            if obj is None:
+                self.index.remove((source_type, pk))
+            else:
+                self.index.add(
+                    (source_type, pk), source.get_fields(obj), source.get_meta(obj)
+                )
+
+    # =====================================
+    # Writes
+    # =====================================
+
+    def rebuild(self) -> int:
+        """
+        Build the index from the database, write a snapshot and publish it.
+
+        The generation is bumped without a delta, so other workers resync
+        from the snapshot rather than replaying the log.
+
+        Returns:
+            int: Number of indexed documents
+        """
+        generation = bump_generation(GENERATION_NAMESPACE)
+        index = self.build_index()
+        with self.lock:
+            self.index = index
+            self.generation = generation
+            self.ready = True
+            state = index.to_state()
+        self.write_snapshot(state, generation, force=True)
+        return len(index)
+
+    def update(self, source_type: str, pks: Iterable) -> None:
+        """
+        Log changed rows of one source for every worker, then apply them here.
+
+        Workers that have not loaded the index yet only log the change.
+        """
+        pks = list(set(pks))
+        search_settings = get_search_settings()
+        with shared_lock(DELTA_LOCK_KEY):
+            # Logged before the bump, so a worker seeing the new generation
+            # always finds its delta
+            generation = get_generation(GENERATION_NAMESPACE) + 1
+            cache.set(
+                get_delta_key(generation),
+                {source_type: pks},
+                search_settings["DELTA_TIMEOUT"],
+            )
+            bump_generation(GENERATION_NAMESPACE)
+
+        if self.ready:
+            self.ensure_fresh()
+            self.schedule_snapshot()
+
+    # =====================================
+    # Snapshots
+    # =====================================
+
+    def schedule_snapshot(self) -> None:
+        """
+        Write a snapshot SNAPSHOT_DELAY seconds from now, off the request path.
+
+        Writes made before it fires are batched into the same snapshot.
+        """
+        search_settings = get_search_settings()
+        if not search_settings["PATH"]:
+            return
+        with self.lock:
+            if self.snapshot_timer is not None:
+                return
+            self.snapshot_timer = threading.Timer(
+                search_settings["SNAPSHOT_DELAY"], self.flush_snapshot
+            )
+            self.snapshot_timer.daemon = True
+            self.snapshot_timer.start()
+
+    def cancel_snapshot(self) -> None:
+        with self.lock:
+            if self.snapshot_timer is not None:
+                self.snapshot_timer.cancel()
+                self.snapshot_timer = None
+
+    def flush_snapshot(self) -> None:
+        """Write the current index, unless a snapshot at least as new exists."""
+        with self.lock:
+            self.snapshot_timer = None
+            if not self.ready:
+                return
+            state, generation = self.index.to_state(), self.generation
+        self.write_snapshot(state, generation)
+
+    def write_snapshot(self, state: Dict, generation: int, force: bool = False) -> None:
+        """
+        Write an index state to disk atomically, if a snapshot path is set.
+
+        Args:
+            state: InvertedIndex.to_state() output
+            generation: Generation the state reflects
+            force: Write even if the snapshot on disk is newer
+        """
+        path = get_search_settings()["PATH"]
+        if not path:
+            return
+        with shared_lock(SNAPSHOT_LOCK_KEY):
+            written = cache.get(SNAPSHOT_GENERATION_KEY)
+            if not force and written is not None and written >= generation:
+                return
+            directory = os.path.dirname(os.fspath(path))
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    dir=directory, delete=False
+                ) as snapshot:
+                    pickle.dump(
+                        {
+                            "version": SNAPSHOT_VERSION,
+                            "generation": generation,
+                            "index": state,
+                        },
+                        snapshot,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(snapshot.name, path)
+            except OSError as e:
+                logger.error(f"Error writing search snapshot {path}: {str(e)}")
+                return
+            cache.set(SNAPSHOT_GENERATION_KEY, generation, None)
+
+    def load_snapshot(self) -> bool:
+        """
+        Replace the index and generation with the snapshot on disk.
+
+        Returns:
+            bool: Whether a snapshot was loaded
+        """
+        path = get_search_settings()["PATH"]
+        if not path:
+            return False
+        try:
+            with open(path, "rb") as snapshot:
+                data = pickle.load(snapshot)
+            if data.get("version") != SNAPSHOT_VERSION:
+                return False
+            index = InvertedIndex.from_state(data["index"])
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error(f"Error loading search snapshot {path}: {str(e)}")
+            return False
+        self.index = index
+        self.generation = data["generation"]
+        return True
+
+    # =====================================
+    # Queries
+    # =====================================
+
+    def search(
+        self, query: str, types: Optional[List[str]] = None, limit: int = 20
+    ) -> Tuple[int, List[Dict]]:
+        """
+        Search the index.
+
+        Only queries that follow another worker's write touch the database,
+        to re-read the rows it changed.
+
+        Returns:
+            Tuple: Number of matches and the stored fields of the top
+            ``limit`` results, each with its score
+        """
+        self.ensure_fresh()
+        with self.lock:
+            count, hits = self.index.search(tokenize(query), limit=limit, types=types)
+        return count, [{**meta, "score": round(score, 4)} for score, _, meta in hits]
+
+
+engine = SearchEngine()
@@ -0,0 +1,227 @@
+"""
+In-memory inverted index with BM25 ranking.
+
+Documents are identified by a ``(type, pk)`` key and mapped to dense integer
+ids. Each term's postings are two parallel arrays: ascending document ids
+and the matching term frequencies. Query cost therefore depends on the
+length of the postings for the query terms, not on the size of the corpus.
+"""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from html import unescape
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+from django.utils.html import strip_tags
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have how i if in into is it its "
+    "not of on or so that the their then there these this to was we were what "
+    "when which will with you your".split()
+)
+
+# BM25 parameters: term frequency saturation and length normalisation
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase index terms.
+
+    Markup and entities are removed first; single characters and common
+    English stop words are dropped.
+    """
+    if not text:
+        return []
+    if "<" in text or "&" in text:
+        text = unescape(strip_tags(text))
+    return [
+        token
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+class InvertedIndex:
+    """
+    Term -> postings index over weighted document fields.
+
+    Not thread-safe; SearchEngine serialises writers.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        # term -> (document ids, term frequencies)
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        # Per document id; removed documents leave a None key behind
+        self.keys: List[Optional[Hashable]] = []
+        self.lengths = array("I")
+        self.terms: List[Tuple[str, ...]] = []
+        self.meta: List[Optional[Dict]] = []
+        self.ids: Dict[Hashable, int] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.ids
+
+    def add(self, key: Hashable, fields: Iterable[Tuple[str, int]], meta: Dict) -> None:
+        """
+        Index a document, replacing any previous version under the same key.
+
+        Args:
+            key: Document key, e.g. ("post", 42)
+            fields: (text, weight) pairs; a term's frequency counts each
+                occurrence ``weight`` times
+            meta: Stored fields returned with search results
+        """
+        self.remove(key)
+
+        frequencies = Counter()
+        for text, weight in fields:
+            for token in tokenize(text):
+                frequencies[token] += weight
+
+        doc = len(self.keys)
+        length = sum(frequencies.values())
+        self.keys.append(key)
+        self.lengths.append(length)
+        self.terms.append(tuple(frequencies))
+        self.meta.append(meta)
+        self.ids[key] = doc
+        self.total_length += length
+
+        for term, frequency in frequencies.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = (array("I"), array("I"))
+            # New ids are always the largest, so appending keeps order
+            postings[0].append(doc)
+            postings[1].append(frequency)
+
+    def remove(self, key: Hashable) -> bool:
+        """Drop a document from every postings list it appears in."""
+        doc = self.ids.pop(key, None)
+        if doc is None:
+            return False
+
+        for term in self.terms[doc]:
+            docs, frequencies = self.postings[term]
+            position = bisect_left(docs, doc)
+            del docs[position]
+            del frequencies[position]
+            if not docs:
+                del self.postings[term]
+
+        self.total_length -= self.lengths[doc]
+        self.keys[doc] = None
+        self.lengths[doc] = 0
+        self.terms[doc] = ()
+        self.meta[doc] = None
+        return True
+
+    def search(
+        self,
+        terms: Sequence[str],
+        limit: int = 20,
+        types: Optional[Iterable[str]] = None,
+    ) -> Tuple[int, List[Tuple[float, Hashable, Dict]]]:
+        """
+        Rank documents containing any of the terms by BM25.
+
+        Args:
+            terms: Query terms, already tokenized
+            limit: Maximum number of results
+            types: Restrict results to keys whose first element is listed
+
+        Returns:
+            Tuple: Number of matching documents and the top ``limit``
+            (score, key, meta) triples, best first
+        """
+        count = len(self.ids)
+        if not count:
+            return 0, []
+        average_length = self.total_length / count or 1
+        lengths = self.lengths
+
+        scores = defaultdict(float)
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            docs, frequencies = postings
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc, frequency in zip(docs, frequencies):
+                norm = K1 * (1 - B + B * lengths[doc] / average_length)
+                scores[doc] += idf * frequency * (K1 + 1) / (frequency + norm)
+
+        if types is not None:
+            types = set(types)
+            scores = {
+                doc: score
+                for doc, score in scores.items()
+                if self.keys[doc][0] in types
+            }
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return len(scores), [
+            (score, self.keys[doc], self.meta[doc]) for doc, score in top
+        ]
+
+    # =====================================
+    # Snapshots
+    # =====================================
+
+    def compact(self) -> "InvertedIndex":
+        """Return a copy without the slots left behind by removed documents."""
+        compacted = InvertedIndex()
+        remap = {}
+        for doc, key in enumerate(self.keys):
+            if key is None:
+                continue
+            remap[doc] = len(compacted.keys)
+            compacted.keys.append(key)
+            compacted.lengths.append(self.lengths[doc])
+            compacted.terms.append(self.terms[doc])
+            compacted.meta.append(self.meta[doc])
+            compacted.ids[key] = remap[doc]
+        compacted.total_length = self.total_length
+        for term, (docs, frequencies) in self.postings.items():
+            compacted.postings[term] = (
+                array("I", (remap[doc] for doc in docs)),
+                array("I", frequencies),
+            )
+        return compacted
+
+    def to_state(self) -> Dict:
+        index = self.compact()
+        return {
+            "postings": index.postings,
+            "keys": index.keys,
+            "lengths": index.lengths,
+            "terms": index.terms,
+            "meta": index.meta,
+            "total_length": index.total_length,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "InvertedIndex":
+        index = cls()
+        index.postings = state["postings"]
+        index.keys = state["keys"]
+        index.lengths = state["lengths"]
+        index.terms = state["terms"]
+        index.meta = state["meta"]
+        index.total_length = state["total_length"]
+        index.ids = {key: doc for doc, key in enumerate(index.keys)}
+        return index
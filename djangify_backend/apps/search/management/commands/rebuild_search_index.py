@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from djangify_backend.apps.search.engine import engine
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the search index from the database, write its snapshot and "
+        "tell running workers to reload it"
+    )
+
+    def handle(self, *args, **options):
+        count = engine.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} documents"))
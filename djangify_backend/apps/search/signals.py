@@ -0,0 +1,65 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from djangify_backend.apps.blog.models import Post
+from djangify_backend.apps.portfolio.models import Portfolio, Technology
+from djangify_backend.apps.search.engine import engine
+
+
+def schedule_update(source_type, pks):
+    """Re-index rows once the surrounding transaction has committed."""
+    pks = set(pks)
+    if pks:
+        transaction.on_commit(lambda: engine.update(source_type, pks))
+
+
+def index_post(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_update("post", [instance.pk])
+
+
+def index_project(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_update("project", [instance.pk])
+
+
+def index_project_technologies(sender, instance, action, pk_set=None, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Portfolio):
+        schedule_update("project", [instance.pk])
+    elif action == "post_clear":
+        # Reverse clear: the projects are no longer known at this point
+        schedule_update("project", getattr(instance, "_search_projects", ()))
+    else:
+        schedule_update("project", pk_set or ())
+
+
+def remember_technology_projects(sender, instance, action=None, **kwargs):
+    # Projects listing a technology must be re-indexed when it is renamed,
+    # deleted or cleared, which the related rows no longer show afterwards
+    if action in (None, "pre_clear") and not isinstance(instance, Portfolio):
+        instance._search_projects = list(
+            instance.portfolios.values_list("pk", flat=True)
+        )
+
+
+def index_technology_projects(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_update("project", instance.portfolios.values_list("pk", flat=True))
+
+
+def index_deleted_technology_projects(sender, instance, **kwargs):
+    schedule_update("project", getattr(instance, "_search_projects", ()))
+
+
+post_save.connect(index_post, sender=Post)
+post_delete.connect(index_post, sender=Post)
+post_save.connect(index_project, sender=Portfolio)
+post_delete.connect(index_project, sender=Portfolio)
+
+through = Portfolio.technologies.through
+m2m_changed.connect(remember_technology_projects, sender=through)
+m2m_changed.connect(index_project_technologies, sender=through)
+post_save.connect(index_technology_projects, sender=Technology)
+pre_delete.connect(remember_technology_projects, sender=Technology)
+post_delete.connect(index_deleted_technology_projects, sender=Technology)
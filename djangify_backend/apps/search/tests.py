@@ -0,0 +1,209 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from djangify_backend.apps.blog.models import Tag
+from djangify_backend.apps.core.cache import get_generation
+from djangify_backend.apps.core.testing import LOCMEM_CACHES, BlogFixturesMixin
+from djangify_backend.apps.portfolio.models import Portfolio, Technology
+from djangify_backend.apps.search.autocomplete import autocomplete
+from djangify_backend.apps.search.engine import (
+    GENERATION_NAMESPACE,
+    SearchEngine,
+    engine,
+    get_delta_key,
+)
+from djangify_backend.apps.search.index import InvertedIndex, tokenize
+
+
+class InvertedIndexTests(SimpleTestCase):
+    def make_index(self):
+        index = InvertedIndex()
+        index.add(("post", 1), [("Django caching", 3), ("<p>Cache keys</p>", 1)], {})
+        index.add(("post", 2), [("Python", 3), ("A note on django", 1)], {})
+        index.add(("project", 3), [("Portfolio", 3), ("Python tooling", 1)], {})
+        return index
+
+    def keys(self, index, query, **kwargs):
+        return [key for _, key, _ in index.search(tokenize(query), **kwargs)[1]]
+
+    def test_tokenize_strips_markup_and_stop_words(self):
+        self.assertEqual(
+            tokenize("<p>The Django&nbsp;ORM is fast_enough</p>"),
+            ["django", "orm", "fast", "enough"],
+        )
+
+    def test_weighted_fields_rank_first(self):
+        index = self.make_index()
+        self.assertEqual(self.keys(index, "django"), [("post", 1), ("post", 2)])
+        self.assertEqual(
+            self.keys(index, "python", types=["project"]), [("project", 3)]
+        )
+        self.assertEqual(index.search(tokenize("missing"))[0], 0)
+
+    def test_remove_and_snapshot_round_trip(self):
+        index = self.make_index()
+        index.remove(("post", 1))
+        self.assertEqual(self.keys(index, "django"), [("post", 2)])
+        self.assertNotIn("caching", index.postings)
+
+        restored = InvertedIndex.from_state(index.to_state())
+        self.assertEqual(len(restored), 2)
+        self.assertEqual(self.keys(restored, "python"), self.keys(index, "python"))
+
+        # Re-adding after a restore must keep postings sorted
+        restored.add(("post", 1), [("Django again", 3)], {})
+        self.assertEqual(self.keys(restored, "django")[0], ("post", 1))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, SEARCH_INDEX={"PATH": None})
+class SearchEndpointTests(BlogFixturesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        engine.reset()
+        self.addCleanup(engine.reset)
+
+    def make_post(self, slug, content, status="published", index=True):
+        with self.captureOnCommitCallbacks(execute=index):
+            return super().make_post(slug, content, status)
+
+    def search(self, query, **params):
+        return self.client.get("/api/v1/search/", {"q": query, **params})
+
+    def test_posts_and_projects_are_searched_together(self):
+        self.make_post("caching", "<p>Caching with redis</p>")
+        self.make_post("draft", "<p>Redis draft</p>", status="draft")
+        with self.captureOnCommitCallbacks(execute=True):
+            project = Portfolio.objects.create(
+                title="Dashboard",
+                slug="dashboard",
+                description="Realtime dashboard",
+                short_description="Dashboard",
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            project.technologies.add(
+                Technology.objects.create(name="Redis", slug="redis", icon="r.svg")
+            )
+
+        response = self.search("redis")
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(
+            [(hit["type"], hit["slug"]) for hit in response.json()["results"]],
+            [("post", "caching"), ("project", "dashboard")],
+        )
+        self.assertEqual(self.search("redis", type="project").json()["count"], 1)
+        self.assertEqual(self.search("redis", type="page").status_code, 400)
+
+    def test_signals_update_the_index(self):
+        post = self.make_post("tips", "<p>Python tips</p>")
+        self.assertEqual(self.search("python").json()["count"], 1)
+
+        post.content = "<p>Rust tips</p>"
+        with self.captureOnCommitCallbacks(execute=True):
+            post.save()
+        self.assertEqual(self.search("python").json()["count"], 0)
+        self.assertEqual(self.search("rust").json()["count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.delete()
+        self.assertEqual(self.search("rust").json()["count"], 0)
+
+    def test_workers_apply_each_others_writes(self):
+        self.make_post("one", "<p>Python one</p>")
+        first, second = SearchEngine(), SearchEngine()
+        self.assertEqual(first.search("python")[0], 1)
+        self.assertEqual(second.search("python")[0], 1)
+
+        # Saved without on_commit, then indexed by different workers
+        two = self.make_post("two", "<p>Python two</p>", index=False)
+        three = self.make_post("three", "<p>Python three</p>", index=False)
+        first.update("post", [two.pk])
+        second.update("post", [three.pk])
+
+        for worker in (first, second):
+            with mock.patch.object(worker, "build_index") as build_index:
+                self.assertEqual(worker.search("python")[0], 3)
+            build_index.assert_not_called()
+
+    def test_gaps_in_the_delta_log_rebuild(self):
+        self.make_post("one", "<p>Python one</p>")
+        other = SearchEngine()
+        other.search("python")
+
+        self.make_post("two", "<p>Python two</p>")
+        cache.delete(get_delta_key(get_generation(GENERATION_NAMESPACE)))
+        with mock.patch.object(
+            other, "build_index", wraps=other.build_index
+        ) as build_index:
+            self.assertEqual(other.search("python")[0], 2)
+        build_index.assert_called_once()
+
+    def test_snapshots_are_written_in_the_background(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.pickle")
+            with self.settings(SEARCH_INDEX={"PATH": path, "SNAPSHOT_DELAY": 3600}):
+                self.make_post("one", "<p>Python one</p>")
+                self.assertEqual(engine.search("python")[0], 1)
+
+                # The write only schedules the snapshot
+                self.make_post("two", "<p>Python two</p>")
+                self.assertFalse(os.path.exists(path))
+                self.assertIsNotNone(engine.snapshot_timer)
+                engine.flush_snapshot()
+                self.assertTrue(os.path.exists(path))
+
+                # A new worker loads it and replays the writes logged since
+                self.make_post("three", "<p>Python three</p>")
+                other = SearchEngine()
+                with mock.patch.object(other, "build_index") as build_index:
+                    self.assertEqual(other.search("python")[0], 3)
+                build_index.assert_not_called()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AutocompleteTests(BlogFixturesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        autocomplete.reset()
+        self.post = self.make_post("post")
+        self.rest = Tag.objects.create(
+            name="Django REST Framework", slug="drf", title="DRF"
+        )
+        self.django = Tag.objects.create(name="Django", slug="django", title="Django")
+        self.post.tags.add(self.django)
+
+    def tearDown(self):
+        autocomplete.reset()
+        super().tearDown()
+
+    def complete(self, prefix, **params):
+        response = self.client.get(
+            "/api/v1/search/autocomplete/", {"q": prefix, **params}
+        )
+        return [(item["type"], item["slug"]) for item in response.json()["results"]]
+
+    def test_prefix_matches_word_starts_most_used_first(self):
+        self.assertEqual(
+            self.complete("dj", type="tag"), [("tag", "django"), ("tag", "drf")]
+        )
+        self.assertEqual(self.complete("rest"), [("tag", "drf")])
+        self.assertEqual(self.complete("gen"), [("category", "general")])
+        self.assertEqual(self.complete("framework x"), [])
+
+    def test_warm_queries_skip_the_database(self):
+        self.complete("dj")
+        with self.assertNumQueries(0):
+            self.complete("dj")
+
+    def test_writes_rebuild_lazily(self):
+        self.complete("dj")
+        Technology.objects.create(name="Django Channels", slug="channels", icon="c.svg")
+        self.post.tags.add(self.rest)
+        self.rest.posts.add(self.make_post("other"))
+        self.assertEqual(
+            self.complete("dj"),
+            [("tag", "drf"), ("tag", "django"), ("technology", "channels")],
+        )
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import autocomplete, search
+
+urlpatterns = [
+    path("", search, name="search"),
+    path("autocomplete/", autocomplete, name="search-autocomplete"),
+]
@@ -0,0 +1,85 @@
+from rest_framework import status
+from rest_framework.decorators import api_view, throttle_classes
+from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+from djangify_backend.apps.core.throttling import (
+    UserBurstRateThrottle,
+    UserSustainedRateThrottle,
+)
+from djangify_backend.apps.search.autocomplete import (
+    AUTOCOMPLETE_SOURCES,
+    autocomplete as autocomplete_index,
+)
+from djangify_backend.apps.search.documents import SOURCES
+from djangify_backend.apps.search.engine import engine, get_search_settings
+
+AUTOCOMPLETE_DEFAULT_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 25
+
+
+def get_types(request, sources):
+    """Parse ``?type=`` into a list of source names, or None for all."""
+    if not request.query_params.get("type"):
+        return None
+    types = [name.strip() for name in request.query_params["type"].split(",")]
+    unknown = sorted(set(types) - set(sources))
+    if unknown:
+        raise ParseError(f"Unknown type: {', '.join(unknown)}")
+    return types
+
+
+def get_limit(request, default: int, maximum: int) -> int:
+    """Parse ``?limit=``, clamped to 1..maximum."""
+    try:
+        limit = int(request.query_params.get("limit", default))
+    except ValueError:
+        raise ParseError("limit must be an integer")
+    return max(1, min(limit, maximum))
+
+
+@api_view(["GET"])
+@throttle_classes([UserBurstRateThrottle, UserSustainedRateThrottle])
+def search(request):
+    """
+    Search posts and projects together.
+
+    Query parameters: ``q`` (required), ``type`` (comma-separated subset of
+    post, project) and ``limit``. Results are ranked by BM25 and served from
+    the in-memory index; the database is only read for rows other workers
+    changed since this worker's last query.
+    """
+    search_settings = get_search_settings()
+    query = request.query_params.get("q", "").strip()
+    types = get_types(request, SOURCES)
+    limit = get_limit(
+        request, search_settings["DEFAULT_LIMIT"], search_settings["MAX_LIMIT"]
+    )
+
+    count, results = engine.search(query, types, limit) if query else (0, [])
+    return Response(
+        {"query": query, "count": count, "results": results},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@throttle_classes([UserBurstRateThrottle, UserSustainedRateThrottle])
+def autocomplete(request):
+    """
+    Complete tag, category and technology names from a prefix.
+
+    Query parameters: ``q`` (the prefix; empty lists the most used names),
+    ``type`` (comma-separated subset of tag, category, technology) and
+    ``limit``. Names match on the start of any word, most used first.
+    """
+    prefix = request.query_params.get("q", "").strip()
+    types = get_types(request, AUTOCOMPLETE_SOURCES)
+    limit = get_limit(request, AUTOCOMPLETE_DEFAULT_LIMIT, AUTOCOMPLETE_MAX_LIMIT)
+
+    return Response(
+        {
+            "query": prefix,
+            "results": autocomplete_index.complete(prefix, types, limit),
+        },
+        status=status.HTTP_200_OK,
+    )
@@ -24,6 +24,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third party apps
     "rest_framework",
     "corsheaders",
@@ -34,6 +35,7 @@ INSTALLED_APPS = [
     "djangify_backend.apps.blog",
     "djangify_backend.apps.portfolio",
     "djangify_backend.apps.core",
+    "djangify_backend.apps.search",
 ]
 
 MIDDLEWARE = [
@@ -273,6 +275,89 @@ CACHES = {
     }
 }
 
+# Cached API responses are versioned by per-prefix generation counters, so
+# writes invalidate them immediately and the timeout only bounds memory use.
+DEFAULT_CACHE_TIMEOUT = 60 * 60 * 6  # 6 hours
+# Past DEFAULT_CACHE_TIMEOUT, stale entries are served for this long while a
+# single request refreshes them.
+CACHE_STALE_TIMEOUT = 60 * 60  # 1 hour
+# Lookups that matched nothing are answered with a cached 404 for this long
+CACHE_NEGATIVE_TIMEOUT = 60
+# Per-object generation counters expire after this long, so lookups of
+# slugs that never existed don't leave permanent keys behind
+CACHE_OBJECT_GENERATION_TIMEOUT = 60 * 60 * 24  # 1 day
+# Cache JSON API responses as rendered bytes instead of serializer data
+CACHE_RENDERED_RESPONSES = True
+# Cached responses are segmented into anonymous, authenticated and staff
+# variants. Set this to skip the cache entirely for staff requests.
+CACHE_BYPASS_STAFF = False
+# Add a Server-Timing header listing each request's cache operations
+CACHE_SERVER_TIMING = True
+
+# Cached entries at least MIN_SIZE bytes once pickled are stored
+# zlib-compressed at LEVEL (1 = fastest, 9 = smallest)
+CACHE_COMPRESSION = {
+    "ENABLED": True,
+    "MIN_SIZE": 1024,
+    "LEVEL": 6,
+}
+
+# Paginated list counts are cached per filter set. On PostgreSQL, setting a
+# threshold makes results the planner estimates at that many rows or more
+# report the estimate instead of running COUNT(*), flagged with
+# "count_approximate". Pages past a low estimate are still served, but
+# "count", "total_pages" and "last" can be off; None always counts exactly.
+PAGINATION_COUNT_CACHE = True
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = None
+
+# Count only published posts in category and tag post_count fields
+BLOG_POST_COUNT_PUBLISHED_ONLY = False
+
+# Latest approved comments embedded in a post detail payload
+BLOG_EMBEDDED_COMMENTS_LIMIT = 5
+
+# PostgreSQL text search configuration for the post search vector
+BLOG_SEARCH_CONFIG = "english"
+
+# Searches matching at most this many posts cache their ranked post ids, and
+# this many distinct queries are tracked per worker for top searches
+BLOG_SEARCH_CACHE_MAX_RESULTS = 1000
+BLOG_SEARCH_STATS_MAX_QUERIES = 500
+
+# Default trigram similarity for ?fuzzy= title search, and the lowest
+# threshold clients may request with ?similarity=
+FUZZY_SEARCH_THRESHOLD = 0.3
+FUZZY_SEARCH_MIN_THRESHOLD = 0.1
+
+# In-memory search index behind /api/v1/search/. Writes reach other workers
+# through a log of changed rows in CACHES["default"], kept DELTA_TIMEOUT
+# seconds; a worker more than MAX_DELTAS writes behind rebuilds instead.
+# PATH holds the snapshot workers load at startup, written in the background
+# SNAPSHOT_DELAY seconds after a write; None always builds from the database.
+# The snapshot is a local file, which assumes a single host: workers on other
+# hosts follow the log but build from the database when they start.
+# LOCK_TIMEOUT bounds how long a write waits for another worker's write.
+SEARCH_INDEX = {
+    "PATH": BASE_DIR / "var" / "search_index.pickle",
+    "DEFAULT_LIMIT": 20,
+    "MAX_LIMIT": 50,
+    "LOCK_TIMEOUT": 10,
+    "SNAPSHOT_DELAY": 30,
+    "MAX_DELTAS": 1000,
+    "DELTA_TIMEOUT": 60 * 60 * 24,
+}
+
+# Per-worker LRU cache in front of CACHES["default"]. Timeouts are seconds;
+# THROTTLE_TIMEOUT > 0 also serves throttle history locally, which lets each
+# worker undercount requests made to other workers within that window.
+LOCAL_CACHE = {
+    "ENABLED": True,
+    "MAX_ENTRIES": 1000,
+    "TIMEOUT": 30,
+    "GENERATION_TIMEOUT": 1,
+    "THROTTLE_TIMEOUT": 0,
+}
+
 # Logging Configuration
 LOGGING = {
     "version": 1,
@@ -4,6 +4,7 @@ from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from djangify_backend.apps.core.views import cache_metrics
 
 
 @api_view(["GET"])
@@ -12,6 +13,7 @@ def api_root(request):
         {
             "blog": request.build_absolute_uri("/api/v1/blog/"),
             "portfolio": request.build_absolute_uri("/api/v1/portfolio/"),
+            "search": request.build_absolute_uri("/api/v1/search/"),
         }
     )
 
@@ -23,6 +25,8 @@ urlpatterns = [
     path("api/v1/", api_root, name="api-root"),
     path("api/v1/blog/", include("djangify_backend.apps.blog.urls")),
     path("api/v1/portfolio/", include("djangify_backend.apps.portfolio.urls")),
+    path("api/v1/search/", include("djangify_backend.apps.search.urls")),
+    path("api/v1/cache/metrics/", cache_metrics, name="cache-metrics"),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 
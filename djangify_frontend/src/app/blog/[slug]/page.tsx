@@ -76,7 +76,7 @@ export default async function BlogPostPage({ params }: BlogPostPageProps) {
         {/* Post Content */}
         <div
           className="prose prose-lg max-w-none prose-img:rounded-lg prose-a:text-primary"
-          dangerouslySetInnerHTML={{ __html: post.content }}
+          dangerouslySetInnerHTML={{ __html: post.content ?? "" }}
         />
 
         {/* Tags and Category */}
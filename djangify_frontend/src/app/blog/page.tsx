@@ -5,17 +5,6 @@ import type { Post } from "@/lib/api/blog";
 
 export const revalidate = 3600; // Revalidate every hour
 
-// Utility functions for calculating reading time and word count
-function calculateReadingTime(content: string): number {
-  const wordsPerMinute = 200;
-  const wordCount = content.trim().split(/\s+/).length;
-  return Math.ceil(wordCount / wordsPerMinute);
-}
-
-function calculateWordCount(content: string): number {
-  return content.trim().split(/\s+/).length;
-}
-
 export default async function BlogPage() {
   try {
     // Fetch all posts
@@ -23,12 +12,8 @@ export default async function BlogPage() {
       page_size: 12 // Adjust based on how many posts you want to show
     });
 
-    // Add computed properties to posts
-    const posts = data.results.map(post => ({
-      ...post,
-      reading_time: calculateReadingTime(post.content),
-      word_count: calculateWordCount(post.content)
-    }));
+    // List responses carry reading_time and word_count from the API
+    const posts = data.results;
 
     // Separate featured and recent posts
     const featuredPosts = posts.filter(post => post.is_featured);
@@ -17,7 +17,8 @@ export interface Post {
   id: number;
   title: string;
   slug: string;
-  content: string;
+  // Omitted from list responses
+  content?: string;
   excerpt: string;
   featured_image: string;
   category: {
@@ -32,11 +33,19 @@ export interface Post {
   published_date: string;
   created_at: string;
   updated_at: string;
-  meta_description: string;
+  meta_description?: string;
   is_featured: boolean;
-  comments: Comment[];
+  // Latest approved comments; page the rest from comments_url
+  comments?: Comment[];
+  comment_count?: number;
+  comments_url?: string;
   reading_time?: number;
   word_count?: number;
+  // Present on search results: relevance and an excerpt with <mark> highlights
+  search_rank?: number;
+  search_headline?: string;
+  // Present on ?fuzzy= results: trigram similarity of the title (0-1)
+  similarity?: number;
 }
 
 export interface PaginatedResponse<T> {
@@ -50,9 +59,15 @@ export interface PostFilters {
   category?: string;
   tag?: string;
   search?: string;
+  // Typo-tolerant title search, with an optional similarity threshold (0-1)
+  fuzzy?: string;
+  similarity?: number;
   page?: number;
   is_featured?: boolean;
   page_size?: number;
+  // Sparse fieldsets: only return (or leave out) these fields
+  fields?: Array<keyof Post>;
+  omit?: Array<keyof Post>;
 }
 
 // Helper functions
@@ -71,8 +86,8 @@ const calculateWordCount = (content: string | undefined): number => {
 const enhancePost = (post: Post): Post => {
   return {
     ...post,
-    reading_time: calculateReadingTime(post.content),
-    word_count: calculateWordCount(post.content)
+    reading_time: post.reading_time ?? calculateReadingTime(post.content),
+    word_count: post.word_count ?? calculateWordCount(post.content)
   };
 };
 
@@ -92,9 +107,13 @@ export const blogApi = {
         if (filters.category) params.append('category__slug', filters.category);
         if (filters.tag) params.append('tags__slug', filters.tag);
         if (filters.search) params.append('search', filters.search);
+        if (filters.fuzzy) params.append('fuzzy', filters.fuzzy);
+        if (filters.similarity !== undefined) params.append('similarity', filters.similarity.toString());
         if (filters.page) params.append('page', filters.page.toString());
         if (filters.is_featured !== undefined) params.append('is_featured', filters.is_featured.toString());
         if (filters.page_size) params.append('page_size', filters.page_size.toString());
+        if (filters.fields?.length) params.append('fields', filters.fields.join(','));
+        if (filters.omit?.length) params.append('omit', filters.omit.join(','));
       }
 
       const response = await api.get<PaginatedResponse<Post>>(`/blog/posts/?${params}`);
@@ -7,20 +7,34 @@ export interface Technology {
   icon: string;
 }
 
-export interface Portfolio {
+export interface PortfolioImage {
+  id: number;
+  image: string;
+  caption: string;
+  order: number;
+}
+
+// Relations the API collapses to slugs/ids unless named in ?expand=
+export type PortfolioExpansion = 'technologies' | 'images';
+
+// Relations named in E come back nested; the rest as technology slugs and image ids
+export interface Portfolio<E extends PortfolioExpansion = never> {
   id: number;
   title: string;
   slug: string;
   description: string;
   short_description: string;
   featured_image: string;
-  technologies: Technology[];
+  technologies: 'technologies' extends E ? Technology[] : string[];
+  images?: 'images' extends E ? PortfolioImage[] : number[];
   project_url?: string;
   github_url?: string;
   is_featured: boolean;
   order: number;
   created_at: string;
   updated_at: string;
+  // Present on ?fuzzy= results: trigram similarity of the title (0-1)
+  similarity?: number;
 }
 
 export interface PaginatedResponse<T> {
@@ -30,30 +44,42 @@ export interface PaginatedResponse<T> {
   results: T[];
 }
 
-export interface PortfolioFilters {
+export interface PortfolioFilters<E extends PortfolioExpansion = PortfolioExpansion> {
   technology?: string;
   search?: string;
+  // Typo-tolerant title search, with an optional similarity threshold (0-1)
+  fuzzy?: string;
+  similarity?: number;
   page?: number;
   is_featured?: boolean;
+  expand?: E[];
 }
 
 export const portfolioApi = {
-  getPortfolioItems: async (filters?: PortfolioFilters): Promise<PaginatedResponse<Portfolio>> => {
+  getPortfolioItems: async <E extends PortfolioExpansion = 'technologies'>(
+    filters?: PortfolioFilters<E>
+  ): Promise<PaginatedResponse<Portfolio<E>>> => {
     const params = new URLSearchParams();
     
     if (filters) {
       if (filters.technology) params.append('technology__slug', filters.technology);
       if (filters.search) params.append('search', filters.search);
+      if (filters.fuzzy) params.append('fuzzy', filters.fuzzy);
+      if (filters.similarity !== undefined) params.append('similarity', filters.similarity.toString());
       if (filters.page) params.append('page', filters.page.toString());
       if (filters.is_featured !== undefined) params.append('is_featured', filters.is_featured.toString());
     }
+    // Cards render technology names, so nest them; images stay as ids
+    params.append('expand', (filters?.expand ?? ['technologies']).join(','));
 
-    const response = await api.get<PaginatedResponse<Portfolio>>(`/portfolio/projects/?${params}`);
+    const response = await api.get<PaginatedResponse<Portfolio<E>>>(`/portfolio/projects/?${params}`);
     return response.data;
   },
 
-  getPortfolioItem: async (slug: string): Promise<Portfolio> => {
-    const response = await api.get<Portfolio>(`/portfolio/projects/${slug}/`);
+  getPortfolioItem: async (slug: string): Promise<Portfolio<PortfolioExpansion>> => {
+    const response = await api.get<Portfolio<PortfolioExpansion>>(`/portfolio/projects/${slug}/`, {
+      params: { expand: 'technologies,images' }
+    });
     return response.data;
   },
 
@@ -62,9 +88,9 @@ export const portfolioApi = {
     return response.data.results;
   },
 
-  getFeaturedItems: async (): Promise<Portfolio[]> => {
-    const response = await api.get<PaginatedResponse<Portfolio>>('/portfolio/projects/', {
-      params: { is_featured: true }
+  getFeaturedItems: async (): Promise<Portfolio<'technologies'>[]> => {
+    const response = await api.get<PaginatedResponse<Portfolio<'technologies'>>>('/portfolio/projects/', {
+      params: { is_featured: true, expand: 'technologies' }
     });
     return response.data.results;
   }